@@ -1,13 +1,10 @@
+import importlib
+import sys
+
 from . import mission
 from . import task
 from . import templates
-from . import countries
 from . import unittype
-from . import planes
-from . import helicopters
-from . import statics
-from . import vehicles
-from . import ships
 from . import terrain
 from . import unit
 from . import unitgroup
@@ -22,3 +19,20 @@ from . import installation
 from . import nav_target_point
 from .mapping import Point, Rectangle, Polygon
 from .mission import Mission
+
+# The generated unit databases take most of the import time,
+# they are imported on first attribute access, e.g. dcs.planes.plane_map
+_lazy_modules = {"countries", "planes", "helicopters", "statics", "vehicles", "ships", "weapons_data"}
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name in _lazy_modules:
+            return importlib.import_module("." + name, __name__)
+        raise AttributeError("module {m!r} has no attribute {n!r}".format(m=__name__, n=name))
+
+    def __dir__():
+        return sorted(set(globals()) | _lazy_modules)
+else:
+    # module __getattr__ (PEP 562) is not available
+    for _name in sorted(_lazy_modules):
+        importlib.import_module("." + _name, __name__)
@@ -1,10 +1,6 @@
 import sys
 from typing import Dict, Union, TYPE_CHECKING
-import dcs.countries as countries
 import dcs.unitgroup as unitgroup
-import dcs.planes as planes
-import dcs.helicopters as helicopters
-import dcs.ships as ships
 from dcs.unit import Vehicle, Static, Ship, FARP, SingleHeliPad
 from dcs.flyingunit import Plane, Helicopter
 from dcs.point import MovingPoint, StaticPoint
@@ -60,6 +56,9 @@ class Coalition:
                           file=sys.stderr)
 
     def load_from_dict(self, mission, d):
+        # the unit databases are only loaded on first use
+        from dcs import countries, planes, helicopters, ships
+
         for country_idx in d["country"]:
             imp_country = d["country"][country_idx]
             _country = countries.get_by_id(imp_country["id"])
@@ -1,11 +1,13 @@
 from dcs.unit import Unit, Skill
 from dcs.unittype import FlyingType
 from dcs.terrain import ParkingSlot
-from dcs.planes import PlaneType, A_10C
-from dcs.helicopters import HelicopterType, Ka_50
 
 import json
-from typing import Type
+from typing import Type, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from dcs.planes import PlaneType
+    from dcs.helicopters import HelicopterType
 
 
 class FlyingUnit(Unit):
@@ -215,12 +217,18 @@ class FlyingUnit(Unit):
 
 
 class Plane(FlyingUnit):
-    def __init__(self, _id=None, name=None, _type: Type[PlaneType] = A_10C, _country=None):
+    def __init__(self, _id=None, name=None, _type: Type['PlaneType'] = None, _country=None):
+        if _type is None:
+            from dcs.planes import A_10C
+            _type = A_10C
         super(Plane, self).__init__(_id, name, _type, _country)
 
 
 class Helicopter(FlyingUnit):
-    def __init__(self, _id=None, name=None, _type: Type[HelicopterType] = Ka_50, _country=None):
+    def __init__(self, _id=None, name=None, _type: Type['HelicopterType'] = None, _country=None):
+        if _type is None:
+            from dcs.helicopters import Ka_50
+            _type = Ka_50
         super(Helicopter, self).__init__(_id, name, _type, _country)
         self.rope_length = 15
 
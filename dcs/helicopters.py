@@ -2,8 +2,7 @@
 
 from dcs.weapons_data import Weapons
 import dcs.task as task
-from dcs.unittype import FlyingType
-from enum import Enum
+from dcs.unittype import FlyingType, LiveryTable
 
 
 class HelicopterType(FlyingType):
@@ -62,103 +61,104 @@ class Ka_50(HelicopterType):
         },
     }
 
-    class Liveries:
-
-        class Georgia(Enum):
-            georgia_camo = "georgia camo"
-
-        class Australia(Enum):
-            Russia_Worn_Black = "Russia Worn Black"
-
-        class Israel(Enum):
-            Israel_IAF_camo_1 = "Israel IAF camo 1"
-            Israel_IAF_camo_2 = "Israel IAF camo 2"
-            Israel_IAF_camo_3 = "Israel IAF camo 3"
-
-        class Norway(Enum):
-            norway_camo = "norway camo"
-
-        class Ukraine(Enum):
-            Ukraine_Demo = "Ukraine Demo"
-            ukraine_camo_1 = "ukraine camo 1"
-            ukraine_camo_1_dirt = "ukraine camo 1 dirt"
-
-        class Belgium(Enum):
-            belgium_sar = "belgium sar"
-            belgium_camo = "belgium camo"
-            belgium_olive = "belgium olive"
-
-        class Greece(Enum):
-            Greek_Army_Aviation = "Greek Army Aviation"
-            Hellenic_Navy_Aviation = "Hellenic Navy Aviation"
-            Hellenic_Navy_Aviation_2 = "Hellenic Navy Aviation 2"
-
-        class UK(Enum):
-            uk_camo = "uk camo"
-
-        class Abkhazia(Enum):
-            Abkhazia_1 = "Abkhazia 1"
-
-        class SouthOssetia(Enum):
-            South_Ossetia_1 = "South Ossetia 1"
-
-        class TheNetherlands(Enum):
-            Netherlands_RNAF = "Netherlands RNAF"
-            Netherlands_RNAF_wooded = "Netherlands RNAF wooded"
-
-        class Denmark(Enum):
-            denmark_camo = "denmark camo"
-            Denmark_navy_trainer = "Denmark navy trainer"
-
-        class France(Enum):
-            France_Armee_de_Terre_1 = "France Armee de Terre 1"
-            France_Armee_de_Terre_2 = "France Armee de Terre 2"
-            France_Armee_de_Terre_Desert = "France Armee de Terre Desert"
-
-        class USA(Enum):
-            us_army = "us army"
-            us_marines_1 = "us marines 1"
-            us_marines_2 = "us marines 2"
-
-        class Russia(Enum):
-            Russia_Standard_Army = "Russia Standard Army"
-            Russia_DOSAAF = "Russia DOSAAF"
-            Russia_Demo__024 = "Russia Demo #024"
-            Russia_Demo__22__Black_Shark = "Russia Demo #22 `Black Shark`"
-            Russia_Demo__Werewolf = "Russia Demo `Werewolf`"
-            Russia_Fictional_Swedish = "Russia Fictional Swedish"
-            Russia_fictional_desert_scheme = "Russia fictional desert scheme"
-            Russia_Fictional_Olive_Grey = "Russia Fictional Olive Grey"
-            Russia_Fictional_Snow_Splatter = "Russia Fictional Snow Splatter"
-            Russia_Fictional_Tropic_Green = "Russia Fictional Tropic Green"
-            Russia_New_Year = "Russia New Year"
-            Russia_Standard_Army__Worn = "Russia Standard Army (Worn)"
-            Russia_Worn_Black = "Russia Worn Black"
-
-        class Italy(Enum):
-            Italy_Aeronautica_Militare = "Italy Aeronautica Militare"
-            Italy_Esercito_Italiano = "Italy Esercito Italiano"
-
-        class Turkey(Enum):
-            Turkey_Fictional_Light_Gray = "Turkey Fictional Light Gray"
-            Turkey_Fictional_1 = "Turkey Fictional 1"
-            Turkey_Fictional = "Turkey Fictional"
-            Turkey_fictional_desert_scheme = "Turkey fictional desert scheme"
-
-        class Algeria(Enum):
-            Algerian_AF_Desert = "Algerian AF Desert"
-
-        class Germany(Enum):
-            german_8320 = "german 8320"
-            german_8332 = "german 8332"
-
-        class Spain(Enum):
-            Spain_SAA_Arido = "Spain SAA Arido"
-            Spain_SAA_Boscoso = "Spain SAA Boscoso"
-            Spain_SAA_Standard = "Spain SAA Standard"
-
-        class Canada(Enum):
-            canadian_forces = "canadian forces"
+    Liveries = LiveryTable({
+        "Georgia": (
+            "georgia camo",
+        ),
+        "Australia": (
+            "Russia Worn Black",
+        ),
+        "Israel": (
+            "Israel IAF camo 1",
+            "Israel IAF camo 2",
+            "Israel IAF camo 3",
+        ),
+        "Norway": (
+            "norway camo",
+        ),
+        "Ukraine": (
+            "Ukraine Demo",
+            "ukraine camo 1",
+            "ukraine camo 1 dirt",
+        ),
+        "Belgium": (
+            "belgium sar",
+            "belgium camo",
+            "belgium olive",
+        ),
+        "Greece": (
+            "Greek Army Aviation",
+            "Hellenic Navy Aviation",
+            "Hellenic Navy Aviation 2",
+        ),
+        "UK": (
+            "uk camo",
+        ),
+        "Abkhazia": (
+            "Abkhazia 1",
+        ),
+        "SouthOssetia": (
+            "South Ossetia 1",
+        ),
+        "TheNetherlands": (
+            "Netherlands RNAF",
+            "Netherlands RNAF wooded",
+        ),
+        "Denmark": (
+            "denmark camo",
+            "Denmark navy trainer",
+        ),
+        "France": (
+            "France Armee de Terre 1",
+            "France Armee de Terre 2",
+            "France Armee de Terre Desert",
+        ),
+        "USA": (
+            "us army",
+            "us marines 1",
+            "us marines 2",
+        ),
+        "Russia": (
+            "Russia Standard Army",
+            "Russia DOSAAF",
+            "Russia Demo #024",
+            "Russia Demo #22 `Black Shark`",
+            "Russia Demo `Werewolf`",
+            "Russia Fictional Swedish",
+            "Russia fictional desert scheme",
+            "Russia Fictional Olive Grey",
+            "Russia Fictional Snow Splatter",
+            "Russia Fictional Tropic Green",
+            "Russia New Year",
+            "Russia Standard Army (Worn)",
+            "Russia Worn Black",
+        ),
+        "Italy": (
+            "Italy Aeronautica Militare",
+            "Italy Esercito Italiano",
+        ),
+        "Turkey": (
+            "Turkey Fictional Light Gray",
+            "Turkey Fictional 1",
+            "Turkey Fictional",
+            "Turkey fictional desert scheme",
+        ),
+        "Algeria": (
+            "Algerian AF Desert",
+        ),
+        "Germany": (
+            "german 8320",
+            "german 8332",
+        ),
+        "Spain": (
+            "Spain SAA Arido",
+            "Spain SAA Boscoso",
+            "Spain SAA Standard",
+        ),
+        "Canada": (
+            "canadian forces",
+        ),
+    })
 
     class Pylon1:
         B_8V20A_CM = (1, Weapons.B_8V20A_CM)
@@ -235,253 +235,254 @@ class Ka_52(HelicopterType):
     chaff_charge_size = 1
     flare_charge_size = 1
 
-    class Liveries:
-
-        class USSR(Enum):
-            standard = "standard"
-
-        class Georgia(Enum):
-            standard = "standard"
-
-        class Venezuela(Enum):
-            standard = "standard"
-
-        class Australia(Enum):
-            standard = "standard"
-
-        class Israel(Enum):
-            standard = "standard"
-
-        class Combined_Joint_Task_Forces_Blue(Enum):
-            standard = "standard"
-
-        class Sudan(Enum):
-            standard = "standard"
-
-        class Norway(Enum):
-            standard = "standard"
-
-        class Romania(Enum):
-            standard = "standard"
-
-        class Iran(Enum):
-            standard = "standard"
-
-        class Ukraine(Enum):
-            standard = "standard"
-
-        class Libya(Enum):
-            standard = "standard"
-
-        class Belgium(Enum):
-            standard = "standard"
-
-        class Slovakia(Enum):
-            standard = "standard"
-
-        class Greece(Enum):
-            standard = "standard"
-
-        class UK(Enum):
-            standard = "standard"
-
-        class Third_Reich(Enum):
-            standard = "standard"
-
-        class Hungary(Enum):
-            standard = "standard"
-
-        class Abkhazia(Enum):
-            standard = "standard"
-
-        class Morocco(Enum):
-            standard = "standard"
-
-        class United_Nations_Peacekeepers(Enum):
-            standard = "standard"
-
-        class Switzerland(Enum):
-            standard = "standard"
-
-        class SouthOssetia(Enum):
-            standard = "standard"
-
-        class Vietnam(Enum):
-            standard = "standard"
-
-        class China(Enum):
-            standard = "standard"
-
-        class Yemen(Enum):
-            standard = "standard"
-
-        class Kuwait(Enum):
-            standard = "standard"
-
-        class Serbia(Enum):
-            standard = "standard"
-
-        class Oman(Enum):
-            standard = "standard"
-
-        class India(Enum):
-            standard = "standard"
-
-        class Egypt(Enum):
-            standard = "standard"
-
-        class TheNetherlands(Enum):
-            standard = "standard"
-
-        class Poland(Enum):
-            standard = "standard"
-
-        class Syria(Enum):
-            standard = "standard"
-
-        class Finland(Enum):
-            standard = "standard"
-
-        class Kazakhstan(Enum):
-            standard = "standard"
-
-        class Denmark(Enum):
-            standard = "standard"
-
-        class Sweden(Enum):
-            standard = "standard"
-
-        class Croatia(Enum):
-            standard = "standard"
-
-        class CzechRepublic(Enum):
-            standard = "standard"
-
-        class GDR(Enum):
-            standard = "standard"
-
-        class Yugoslavia(Enum):
-            standard = "standard"
-
-        class Bulgaria(Enum):
-            standard = "standard"
-
-        class SouthKorea(Enum):
-            standard = "standard"
-
-        class Tunisia(Enum):
-            standard = "standard"
-
-        class Combined_Joint_Task_Forces_Red(Enum):
-            standard = "standard"
-
-        class Lebanon(Enum):
-            standard = "standard"
-
-        class Portugal(Enum):
-            standard = "standard"
-
-        class Cuba(Enum):
-            standard = "standard"
-
-        class Insurgents(Enum):
-            standard = "standard"
-
-        class SaudiArabia(Enum):
-            standard = "standard"
-
-        class France(Enum):
-            standard = "standard"
-
-        class USA(Enum):
-            standard = "standard"
-
-        class Honduras(Enum):
-            standard = "standard"
-
-        class Qatar(Enum):
-            standard = "standard"
-
-        class Russia(Enum):
-            standard = "standard"
-
-        class United_Arab_Emirates(Enum):
-            standard = "standard"
-
-        class Italian_Social_Republi(Enum):
-            standard = "standard"
-
-        class Austria(Enum):
-            standard = "standard"
-
-        class Bahrain(Enum):
-            standard = "standard"
-
-        class Italy(Enum):
-            standard = "standard"
-
-        class Chile(Enum):
-            standard = "standard"
-
-        class Turkey(Enum):
-            standard = "standard"
-
-        class Philippines(Enum):
-            standard = "standard"
-
-        class Algeria(Enum):
-            standard = "standard"
-
-        class Pakistan(Enum):
-            standard = "standard"
-
-        class Malaysia(Enum):
-            standard = "standard"
-
-        class Indonesia(Enum):
-            standard = "standard"
-
-        class Iraq(Enum):
-            standard = "standard"
-
-        class Germany(Enum):
-            standard = "standard"
-
-        class South_Africa(Enum):
-            standard = "standard"
-
-        class Jordan(Enum):
-            standard = "standard"
-
-        class Mexico(Enum):
-            standard = "standard"
-
-        class USAFAggressors(Enum):
-            standard = "standard"
-
-        class Brazil(Enum):
-            standard = "standard"
-
-        class Spain(Enum):
-            standard = "standard"
-
-        class Belarus(Enum):
-            standard = "standard"
-
-        class Canada(Enum):
-            standard = "standard"
-
-        class NorthKorea(Enum):
-            standard = "standard"
-
-        class Ethiopia(Enum):
-            standard = "standard"
-
-        class Japan(Enum):
-            standard = "standard"
-
-        class Thailand(Enum):
-            standard = "standard"
+    Liveries = LiveryTable({
+        "USSR": (
+            "standard",
+        ),
+        "Georgia": (
+            "standard",
+        ),
+        "Venezuela": (
+            "standard",
+        ),
+        "Australia": (
+            "standard",
+        ),
+        "Israel": (
+            "standard",
+        ),
+        "Combined_Joint_Task_Forces_Blue": (
+            "standard",
+        ),
+        "Sudan": (
+            "standard",
+        ),
+        "Norway": (
+            "standard",
+        ),
+        "Romania": (
+            "standard",
+        ),
+        "Iran": (
+            "standard",
+        ),
+        "Ukraine": (
+            "standard",
+        ),
+        "Libya": (
+            "standard",
+        ),
+        "Belgium": (
+            "standard",
+        ),
+        "Slovakia": (
+            "standard",
+        ),
+        "Greece": (
+            "standard",
+        ),
+        "UK": (
+            "standard",
+        ),
+        "Third_Reich": (
+            "standard",
+        ),
+        "Hungary": (
+            "standard",
+        ),
+        "Abkhazia": (
+            "standard",
+        ),
+        "Morocco": (
+            "standard",
+        ),
+        "United_Nations_Peacekeepers": (
+            "standard",
+        ),
+        "Switzerland": (
+            "standard",
+        ),
+        "SouthOssetia": (
+            "standard",
+        ),
+        "Vietnam": (
+            "standard",
+        ),
+        "China": (
+            "standard",
+        ),
+        "Yemen": (
+            "standard",
+        ),
+        "Kuwait": (
+            "standard",
+        ),
+        "Serbia": (
+            "standard",
+        ),
+        "Oman": (
+            "standard",
+        ),
+        "India": (
+            "standard",
+        ),
+        "Egypt": (
+            "standard",
+        ),
+        "TheNetherlands": (
+            "standard",
+        ),
+        "Poland": (
+            "standard",
+        ),
+        "Syria": (
+            "standard",
+        ),
+        "Finland": (
+            "standard",
+        ),
+        "Kazakhstan": (
+            "standard",
+        ),
+        "Denmark": (
+            "standard",
+        ),
+        "Sweden": (
+            "standard",
+        ),
+        "Croatia": (
+            "standard",
+        ),
+        "CzechRepublic": (
+            "standard",
+        ),
+        "GDR": (
+            "standard",
+        ),
+        "Yugoslavia": (
+            "standard",
+        ),
+        "Bulgaria": (
+            "standard",
+        ),
+        "SouthKorea": (
+            "standard",
+        ),
+        "Tunisia": (
+            "standard",
+        ),
+        "Combined_Joint_Task_Forces_Red": (
+            "standard",
+        ),
+        "Lebanon": (
+            "standard",
+        ),
+        "Portugal": (
+            "standard",
+        ),
+        "Cuba": (
+            "standard",
+        ),
+        "Insurgents": (
+            "standard",
+        ),
+        "SaudiArabia": (
+            "standard",
+        ),
+        "France": (
+            "standard",
+        ),
+        "USA": (
+            "standard",
+        ),
+        "Honduras": (
+            "standard",
+        ),
+        "Qatar": (
+            "standard",
+        ),
+        "Russia": (
+            "standard",
+        ),
+        "United_Arab_Emirates": (
+            "standard",
+        ),
+        "Italian_Social_Republi": (
+            "standard",
+        ),
+        "Austria": (
+            "standard",
+        ),
+        "Bahrain": (
+            "standard",
+        ),
+        "Italy": (
+            "standard",
+        ),
+        "Chile": (
+            "standard",
+        ),
+        "Turkey": (
+            "standard",
+        ),
+        "Philippines": (
+            "standard",
+        ),
+        "Algeria": (
+            "standard",
+        ),
+        "Pakistan": (
+            "standard",
+        ),
+        "Malaysia": (
+            "standard",
+        ),
+        "Indonesia": (
+            "standard",
+        ),
+        "Iraq": (
+            "standard",
+        ),
+        "Germany": (
+            "standard",
+        ),
+        "South_Africa": (
+            "standard",
+        ),
+        "Jordan": (
+            "standard",
+        ),
+        "Mexico": (
+            "standard",
+        ),
+        "USAFAggressors": (
+            "standard",
+        ),
+        "Brazil": (
+            "standard",
+        ),
+        "Spain": (
+            "standard",
+        ),
+        "Belarus": (
+            "standard",
+        ),
+        "Canada": (
+            "standard",
+        ),
+        "NorthKorea": (
+            "standard",
+        ),
+        "Ethiopia": (
+            "standard",
+        ),
+        "Japan": (
+            "standard",
+        ),
+        "Thailand": (
+            "standard",
+        ),
+    })
 
     class Pylon1:
         B_8V20A_CM = (1, Weapons.B_8V20A_CM)
@@ -548,31 +549,32 @@ class Mi_24V(HelicopterType):
     chaff_charge_size = 0
     flare_charge_size = 1
 
-    class Liveries:
-
-        class Georgia(Enum):
-            standard = "standard"
-
-        class Ukraine(Enum):
-            ukraine = "ukraine"
-            Ukraine_UN = "Ukraine UN"
-
-        class Abkhazia(Enum):
-            Abkhazia = "Abkhazia"
-
-        class SouthOssetia(Enum):
-            South_Ossetia = "South Ossetia"
-
-        class Russia(Enum):
-            standard_1 = "standard 1"
-            standard_2__faded_and_sun_bleached = "standard 2 (faded and sun-bleached)"
-            Russia_FSB = "Russia_FSB"
-            Russia_MVD = "Russia_MVD"
-
-        class Algeria(Enum):
-            Algerian_AF_Black = "Algerian AF Black"
-            Algerian_AF_New_Desert = "Algerian AF New Desert"
-            Algerian_AF_Old_Desert = "Algerian AF Old Desert"
+    Liveries = LiveryTable({
+        "Georgia": (
+            "standard",
+        ),
+        "Ukraine": (
+            "ukraine",
+            "Ukraine UN",
+        ),
+        "Abkhazia": (
+            "Abkhazia",
+        ),
+        "SouthOssetia": (
+            "South Ossetia",
+        ),
+        "Russia": (
+            "standard 1",
+            "standard 2 (faded and sun-bleached)",
+            "Russia_FSB",
+            "Russia_MVD",
+        ),
+        "Algeria": (
+            "Algerian AF Black",
+            "Algerian AF New Desert",
+            "Algerian AF Old Desert",
+        ),
+    })
 
     class Pylon1:
         _9M114_Shturm_V___2 = (1, Weapons._9M114_Shturm_V___2)
@@ -743,126 +745,127 @@ class Mi_8MT(HelicopterType):
         class NS430allow:
             id = "NS430allow"
 
-    class Liveries:
-
-        class USSR(Enum):
-            Russia_Aeroflot = "Russia_Aeroflot"
-            Russia_Army_Weather = "Russia_Army_Weather"
-
-        class Georgia(Enum):
-            Georgia = "Georgia"
-
-        class Australia(Enum):
-            Australia = "Australia"
-            Standard = "Standard"
-
-        class Israel(Enum):
-            Israel = "Israel"
-            Standard = "Standard"
-
-        class Norway(Enum):
-            Norway = "Norway"
-            Standard = "Standard"
-
-        class Iran(Enum):
-            IR_AFAGIR_Blue = "IR AFAGIR Blue"
-            IR_AFAGIR_Sand = "IR AFAGIR Sand"
-            IR_Iranian_Special_Police_Forces = "IR Iranian Special Police Forces"
-
-        class Ukraine(Enum):
-            Ukraine = "Ukraine"
-
-        class Belgium(Enum):
-            Belgium = "Belgium"
-
-        class Greece(Enum):
-            Hellenic_Airforce_SAR = "Hellenic Airforce SAR"
-            Hellenic_Army_Aviation = "Hellenic Army Aviation"
-
-        class UK(Enum):
-            United_Kingdom = "United Kingdom"
-            Standard = "Standard"
-
-        class Abkhazia(Enum):
-            Abkhazia = "Abkhazia"
-
-        class SouthOssetia(Enum):
-            South_Ossetia = "South Ossetia"
-
-        class China(Enum):
-            China_PLAAA_Camo = "China PLAAA Camo"
-            China_UN = "China UN"
-            China_PLAAA_White = "China PLAAA White"
-
-        class TheNetherlands(Enum):
-            Netherlands_ARMY = "Netherlands ARMY"
-            Netherlands_NAVY = "Netherlands NAVY"
-            Standard = "Standard"
-
-        class Denmark(Enum):
-            Denmark = "Denmark"
-
-        class Insurgents(Enum):
-            Insurgents = "Insurgents"
-            Standard = "Standard"
-
-        class France(Enum):
-            France_ARMY = "France ARMY"
-            France_NAVY = "France NAVY"
-            Standard = "Standard"
-
-        class USA(Enum):
-            USA_AFG = "USA_AFG"
-            Standard = "Standard"
-
-        class Russia(Enum):
-            Russia_VVS_Standard = "Russia_VVS_Standard"
-            Russia_Aeroflot = "Russia_Aeroflot"
-            Russia_Gazprom = "Russia_Gazprom"
-            Russia_KazanVZ = "Russia_KazanVZ"
-            Russia_LII_Gromov_RA_25546 = "Russia_LII_Gromov RA-25546"
-            Russia_Police = "Russia_Police"
-            Russia_UTair = "Russia_UTair"
-            Russia_Vertolety_Russia = "Russia_Vertolety_Russia"
-            Russia_Naryan_Mar = "Russia_Naryan-Mar"
-            Russia_VVS_Grey = "Russia_VVS_Grey"
-            Russia_VVS_Grey_2 = "Russia_VVS_Grey_2"
-            Russia_VVS_Standard_2 = "Russia_VVS_Standard_2"
-            Russia_FSB = "Russia_FSB"
-            Russia_MVD_Mozdok = "Russia_MVD_Mozdok"
-            Russia_MVD_Standard = "Russia_MVD_Standard"
-            Russia_VVS_MA = "Russia_VVS_MA"
-            Russia_UN = "Russia_UN"
-            Russia_PF_Ambulance = "Russia_PF_Ambulance"
-            Russia_Army_Weather = "Russia_Army_Weather"
-
-        class Italy(Enum):
-            Italy_ARMY = "Italy ARMY"
-            Italy_NAVY = "Italy NAVY"
-            Standard = "Standard"
-
-        class Turkey(Enum):
-            Turkey = "Turkey"
-            Standard = "Standard"
-
-        class Algeria(Enum):
-            Algerian_AF_Green = "Algerian AF Green"
-            Algerian_AF_Green_EVSAN = "Algerian AF Green EVSAN"
-            Algerian_AF_New_Desert = "Algerian AF New Desert"
-            Algerian_AF_Old_Desert = "Algerian AF Old Desert"
-            Algerian_AF_VIP = "Algerian AF VIP"
-
-        class Germany(Enum):
-            Germany = "Germany"
-            Standard = "Standard"
-
-        class Spain(Enum):
-            Spain = "Spain"
-            Standard = "Standard"
-
-        class Canada(Enum):
-            Canada = "Canada"
-            Standard = "Standard"
+    Liveries = LiveryTable({
+        "USSR": (
+            "Russia_Aeroflot",
+            "Russia_Army_Weather",
+        ),
+        "Georgia": (
+            "Georgia",
+        ),
+        "Australia": (
+            "Australia",
+            "Standard",
+        ),
+        "Israel": (
+            "Israel",
+            "Standard",
+        ),
+        "Norway": (
+            "Norway",
+            "Standard",
+        ),
+        "Iran": (
+            "IR AFAGIR Blue",
+            "IR AFAGIR Sand",
+            "IR Iranian Special Police Forces",
+        ),
+        "Ukraine": (
+            "Ukraine",
+        ),
+        "Belgium": (
+            "Belgium",
+        ),
+        "Greece": (
+            "Hellenic Airforce SAR",
+            "Hellenic Army Aviation",
+        ),
+        "UK": (
+            "United Kingdom",
+            "Standard",
+        ),
+        "Abkhazia": (
+            "Abkhazia",
+        ),
+        "SouthOssetia": (
+            "South Ossetia",
+        ),
+        "China": (
+            "China PLAAA Camo",
+            "China UN",
+            "China PLAAA White",
+        ),
+        "TheNetherlands": (
+            "Netherlands ARMY",
+            "Netherlands NAVY",
+            "Standard",
+        ),
+        "Denmark": (
+            "Denmark",
+        ),
+        "Insurgents": (
+            "Insurgents",
+            "Standard",
+        ),
+        "France": (
+            "France ARMY",
+            "France NAVY",
+            "Standard",
+        ),
+        "USA": (
+            "USA_AFG",
+            "Standard",
+        ),
+        "Russia": (
+            "Russia_VVS_Standard",
+            "Russia_Aeroflot",
+            "Russia_Gazprom",
+            "Russia_KazanVZ",
+            "Russia_LII_Gromov RA-25546",
+            "Russia_Police",
+            "Russia_UTair",
+            "Russia_Vertolety_Russia",
+            "Russia_Naryan-Mar",
+            "Russia_VVS_Grey",
+            "Russia_VVS_Grey_2",
+            "Russia_VVS_Standard_2",
+            "Russia_FSB",
+            "Russia_MVD_Mozdok",
+            "Russia_MVD_Standard",
+            "Russia_VVS_MA",
+            "Russia_UN",
+            "Russia_PF_Ambulance",
+            "Russia_Army_Weather",
+        ),
+        "Italy": (
+            "Italy ARMY",
+            "Italy NAVY",
+            "Standard",
+        ),
+        "Turkey": (
+            "Turkey",
+            "Standard",
+        ),
+        "Algeria": (
+            "Algerian AF Green",
+            "Algerian AF Green EVSAN",
+            "Algerian AF New Desert",
+            "Algerian AF Old Desert",
+            "Algerian AF VIP",
+        ),
+        "Germany": (
+            "Germany",
+            "Standard",
+        ),
+        "Spain": (
+            "Spain",
+            "Standard",
+        ),
+        "Canada": (
+            "Canada",
+            "Standard",
+        ),
+    })
 
     class Pylon1:
         B_8V20A_CM = (1, Weapons.B_8V20A_CM)
@@ -961,260 +964,261 @@ class Mi_26(HelicopterType):
     chaff_charge_size = 0
     flare_charge_size = 1
 
-    class Liveries:
-
-        class USSR(Enum):
-            RF_Air_Force = "RF Air Force"
-            United_Nations = "United Nations"
-
-        class Georgia(Enum):
-            United_Nations = "United Nations"
-
-        class Venezuela(Enum):
-            United_Nations = "United Nations"
-
-        class Australia(Enum):
-            United_Nations = "United Nations"
-
-        class Israel(Enum):
-            United_Nations = "United Nations"
-
-        class Combined_Joint_Task_Forces_Blue(Enum):
-            United_Nations = "United Nations"
-
-        class Sudan(Enum):
-            United_Nations = "United Nations"
-
-        class Norway(Enum):
-            United_Nations = "United Nations"
-
-        class Romania(Enum):
-            United_Nations = "United Nations"
-
-        class Iran(Enum):
-            United_Nations = "United Nations"
-
-        class Ukraine(Enum):
-            _7th_Separate_Brigade_of_AA__Kalinov = "7th Separate Brigade of AA (Kalinov)"
-            United_Nations = "United Nations"
-
-        class Libya(Enum):
-            United_Nations = "United Nations"
-
-        class Belgium(Enum):
-            United_Nations = "United Nations"
-
-        class Slovakia(Enum):
-            United_Nations = "United Nations"
-
-        class Greece(Enum):
-            United_Nations = "United Nations"
-
-        class UK(Enum):
-            United_Nations = "United Nations"
-
-        class Third_Reich(Enum):
-            United_Nations = "United Nations"
-
-        class Hungary(Enum):
-            United_Nations = "United Nations"
-
-        class Abkhazia(Enum):
-            United_Nations = "United Nations"
-
-        class Morocco(Enum):
-            United_Nations = "United Nations"
-
-        class United_Nations_Peacekeepers(Enum):
-            United_Nations = "United Nations"
-
-        class Switzerland(Enum):
-            United_Nations = "United Nations"
-
-        class SouthOssetia(Enum):
-            United_Nations = "United Nations"
-
-        class Vietnam(Enum):
-            United_Nations = "United Nations"
-
-        class China(Enum):
-            China_Flying_Dragon_Aviation = "China Flying Dragon Aviation"
-            United_Nations = "United Nations"
-
-        class Yemen(Enum):
-            United_Nations = "United Nations"
-
-        class Kuwait(Enum):
-            United_Nations = "United Nations"
-
-        class Serbia(Enum):
-            United_Nations = "United Nations"
-
-        class Oman(Enum):
-            United_Nations = "United Nations"
-
-        class India(Enum):
-            United_Nations = "United Nations"
-
-        class Egypt(Enum):
-            United_Nations = "United Nations"
-
-        class TheNetherlands(Enum):
-            United_Nations = "United Nations"
-
-        class Poland(Enum):
-            United_Nations = "United Nations"
-
-        class Syria(Enum):
-            United_Nations = "United Nations"
-
-        class Finland(Enum):
-            United_Nations = "United Nations"
-
-        class Kazakhstan(Enum):
-            United_Nations = "United Nations"
-
-        class Denmark(Enum):
-            United_Nations = "United Nations"
-
-        class Sweden(Enum):
-            United_Nations = "United Nations"
-
-        class Croatia(Enum):
-            United_Nations = "United Nations"
-
-        class CzechRepublic(Enum):
-            United_Nations = "United Nations"
-
-        class GDR(Enum):
-            United_Nations = "United Nations"
-
-        class Yugoslavia(Enum):
-            United_Nations = "United Nations"
-
-        class Bulgaria(Enum):
-            United_Nations = "United Nations"
-
-        class SouthKorea(Enum):
-            United_Nations = "United Nations"
-
-        class Tunisia(Enum):
-            United_Nations = "United Nations"
-
-        class Combined_Joint_Task_Forces_Red(Enum):
-            United_Nations = "United Nations"
-
-        class Lebanon(Enum):
-            United_Nations = "United Nations"
-
-        class Portugal(Enum):
-            United_Nations = "United Nations"
-
-        class Cuba(Enum):
-            United_Nations = "United Nations"
-
-        class Insurgents(Enum):
-            United_Nations = "United Nations"
-
-        class SaudiArabia(Enum):
-            United_Nations = "United Nations"
-
-        class France(Enum):
-            United_Nations = "United Nations"
-
-        class USA(Enum):
-            United_Nations = "United Nations"
-
-        class Honduras(Enum):
-            United_Nations = "United Nations"
-
-        class Qatar(Enum):
-            United_Nations = "United Nations"
-
-        class Russia(Enum):
-            RF_Air_Force = "RF Air Force"
-            Russia_FSB = "Russia_FSB"
-            Russia_MVD = "Russia_MVD"
-            United_Nations = "United Nations"
-
-        class United_Arab_Emirates(Enum):
-            United_Nations = "United Nations"
-
-        class Italian_Social_Republi(Enum):
-            United_Nations = "United Nations"
-
-        class Austria(Enum):
-            United_Nations = "United Nations"
-
-        class Bahrain(Enum):
-            United_Nations = "United Nations"
-
-        class Italy(Enum):
-            United_Nations = "United Nations"
-
-        class Chile(Enum):
-            United_Nations = "United Nations"
-
-        class Turkey(Enum):
-            United_Nations = "United Nations"
-
-        class Philippines(Enum):
-            United_Nations = "United Nations"
-
-        class Algeria(Enum):
-            Algerian_Air_Force_SL_22 = "Algerian Air Force SL-22"
-            United_Nations = "United Nations"
-
-        class Pakistan(Enum):
-            United_Nations = "United Nations"
-
-        class Malaysia(Enum):
-            United_Nations = "United Nations"
-
-        class Indonesia(Enum):
-            United_Nations = "United Nations"
-
-        class Iraq(Enum):
-            United_Nations = "United Nations"
-
-        class Germany(Enum):
-            United_Nations = "United Nations"
-
-        class South_Africa(Enum):
-            United_Nations = "United Nations"
-
-        class Jordan(Enum):
-            United_Nations = "United Nations"
-
-        class Mexico(Enum):
-            United_Nations = "United Nations"
-
-        class USAFAggressors(Enum):
-            United_Nations = "United Nations"
-
-        class Brazil(Enum):
-            United_Nations = "United Nations"
-
-        class Spain(Enum):
-            United_Nations = "United Nations"
-
-        class Belarus(Enum):
-            United_Nations = "United Nations"
-
-        class Canada(Enum):
-            United_Nations = "United Nations"
-
-        class NorthKorea(Enum):
-            United_Nations = "United Nations"
-
-        class Ethiopia(Enum):
-            United_Nations = "United Nations"
-
-        class Japan(Enum):
-            United_Nations = "United Nations"
-
-        class Thailand(Enum):
-            United_Nations = "United Nations"
+    Liveries = LiveryTable({
+        "USSR": (
+            "RF Air Force",
+            "United Nations",
+        ),
+        "Georgia": (
+            "United Nations",
+        ),
+        "Venezuela": (
+            "United Nations",
+        ),
+        "Australia": (
+            "United Nations",
+        ),
+        "Israel": (
+            "United Nations",
+        ),
+        "Combined_Joint_Task_Forces_Blue": (
+            "United Nations",
+        ),
+        "Sudan": (
+            "United Nations",
+        ),
+        "Norway": (
+            "United Nations",
+        ),
+        "Romania": (
+            "United Nations",
+        ),
+        "Iran": (
+            "United Nations",
+        ),
+        "Ukraine": (
+            "7th Separate Brigade of AA (Kalinov)",
+            "United Nations",
+        ),
+        "Libya": (
+            "United Nations",
+        ),
+        "Belgium": (
+            "United Nations",
+        ),
+        "Slovakia": (
+            "United Nations",
+        ),
+        "Greece": (
+            "United Nations",
+        ),
+        "UK": (
+            "United Nations",
+        ),
+        "Third_Reich": (
+            "United Nations",
+        ),
+        "Hungary": (
+            "United Nations",
+        ),
+        "Abkhazia": (
+            "United Nations",
+        ),
+        "Morocco": (
+            "United Nations",
+        ),
+        "United_Nations_Peacekeepers": (
+            "United Nations",
+        ),
+        "Switzerland": (
+            "United Nations",
+        ),
+        "SouthOssetia": (
+            "United Nations",
+        ),
+        "Vietnam": (
+            "United Nations",
+        ),
+        "China": (
+            "China Flying Dragon Aviation",
+            "United Nations",
+        ),
+        "Yemen": (
+            "United Nations",
+        ),
+        "Kuwait": (
+            "United Nations",
+        ),
+        "Serbia": (
+            "United Nations",
+        ),
+        "Oman": (
+            "United Nations",
+        ),
+        "India": (
+            "United Nations",
+        ),
+        "Egypt": (
+            "United Nations",
+        ),
+        "TheNetherlands": (
+            "United Nations",
+        ),
+        "Poland": (
+            "United Nations",
+        ),
+        "Syria": (
+            "United Nations",
+        ),
+        "Finland": (
+            "United Nations",
+        ),
+        "Kazakhstan": (
+            "United Nations",
+        ),
+        "Denmark": (
+            "United Nations",
+        ),
+        "Sweden": (
+            "United Nations",
+        ),
+        "Croatia": (
+            "United Nations",
+        ),
+        "CzechRepublic": (
+            "United Nations",
+        ),
+        "GDR": (
+            "United Nations",
+        ),
+        "Yugoslavia": (
+            "United Nations",
+        ),
+        "Bulgaria": (
+            "United Nations",
+        ),
+        "SouthKorea": (
+            "United Nations",
+        ),
+        "Tunisia": (
+            "United Nations",
+        ),
+        "Combined_Joint_Task_Forces_Red": (
+            "United Nations",
+        ),
+        "Lebanon": (
+            "United Nations",
+        ),
+        "Portugal": (
+            "United Nations",
+        ),
+        "Cuba": (
+            "United Nations",
+        ),
+        "Insurgents": (
+            "United Nations",
+        ),
+        "SaudiArabia": (
+            "United Nations",
+        ),
+        "France": (
+            "United Nations",
+        ),
+        "USA": (
+            "United Nations",
+        ),
+        "Honduras": (
+            "United Nations",
+        ),
+        "Qatar": (
+            "United Nations",
+        ),
+        "Russia": (
+            "RF Air Force",
+            "Russia_FSB",
+            "Russia_MVD",
+            "United Nations",
+        ),
+        "United_Arab_Emirates": (
+            "United Nations",
+        ),
+        "Italian_Social_Republi": (
+            "United Nations",
+        ),
+        "Austria": (
+            "United Nations",
+        ),
+        "Bahrain": (
+            "United Nations",
+        ),
+        "Italy": (
+            "United Nations",
+        ),
+        "Chile": (
+            "United Nations",
+        ),
+        "Turkey": (
+            "United Nations",
+        ),
+        "Philippines": (
+            "United Nations",
+        ),
+        "Algeria": (
+            "Algerian Air Force SL-22",
+            "United Nations",
+        ),
+        "Pakistan": (
+            "United Nations",
+        ),
+        "Malaysia": (
+            "United Nations",
+        ),
+        "Indonesia": (
+            "United Nations",
+        ),
+        "Iraq": (
+            "United Nations",
+        ),
+        "Germany": (
+            "United Nations",
+        ),
+        "South_Africa": (
+            "United Nations",
+        ),
+        "Jordan": (
+            "United Nations",
+        ),
+        "Mexico": (
+            "United Nations",
+        ),
+        "USAFAggressors": (
+            "United Nations",
+        ),
+        "Brazil": (
+            "United Nations",
+        ),
+        "Spain": (
+            "United Nations",
+        ),
+        "Belarus": (
+            "United Nations",
+        ),
+        "Canada": (
+            "United Nations",
+        ),
+        "NorthKorea": (
+            "United Nations",
+        ),
+        "Ethiopia": (
+            "United Nations",
+        ),
+        "Japan": (
+            "United Nations",
+        ),
+        "Thailand": (
+            "United Nations",
+        ),
+    })
 
     pylons = {}
 
@@ -1230,19 +1234,20 @@ class Ka_27(HelicopterType):
     fuel_max = 2616
     max_speed = 290
 
-    class Liveries:
-
-        class Ukraine(Enum):
-            ukraine_camo_1 = "ukraine camo 1"
-
-        class China(Enum):
-            China_PLANAF = "China PLANAF"
-
-        class Russia(Enum):
-            standard = "standard"
-
-        class Algeria(Enum):
-            standard = "standard"
+    Liveries = LiveryTable({
+        "Ukraine": (
+            "ukraine camo 1",
+        ),
+        "China": (
+            "China PLANAF",
+        ),
+        "Russia": (
+            "standard",
+        ),
+        "Algeria": (
+            "standard",
+        ),
+    })
 
     pylons = {}
 
@@ -1263,62 +1268,63 @@ class UH_60A(HelicopterType):
     chaff_charge_size = 1
     flare_charge_size = 1
 
-    class Liveries:
-
-        class Georgia(Enum):
-            standard = "standard"
-
-        class Israel(Enum):
-            ISRAIL_UN = "ISRAIL_UN"
-            standard = "standard"
-
-        class Norway(Enum):
-            standard = "standard"
-
-        class Ukraine(Enum):
-            standard = "standard"
-
-        class Belgium(Enum):
-            standard = "standard"
-
-        class UK(Enum):
-            standard = "standard"
-
-        class Abkhazia(Enum):
-            standard = "standard"
-
-        class SouthOssetia(Enum):
-            standard = "standard"
-
-        class TheNetherlands(Enum):
-            standard = "standard"
-
-        class Denmark(Enum):
-            standard = "standard"
-
-        class France(Enum):
-            standard = "standard"
-
-        class USA(Enum):
-            standard = "standard"
-
-        class Russia(Enum):
-            standard = "standard"
-
-        class Italy(Enum):
-            standard = "standard"
-
-        class Turkey(Enum):
-            standard = "standard"
-
-        class Germany(Enum):
-            standard = "standard"
-
-        class Spain(Enum):
-            standard = "standard"
-
-        class Canada(Enum):
-            standard = "standard"
+    Liveries = LiveryTable({
+        "Georgia": (
+            "standard",
+        ),
+        "Israel": (
+            "ISRAIL_UN",
+            "standard",
+        ),
+        "Norway": (
+            "standard",
+        ),
+        "Ukraine": (
+            "standard",
+        ),
+        "Belgium": (
+            "standard",
+        ),
+        "UK": (
+            "standard",
+        ),
+        "Abkhazia": (
+            "standard",
+        ),
+        "SouthOssetia": (
+            "standard",
+        ),
+        "TheNetherlands": (
+            "standard",
+        ),
+        "Denmark": (
+            "standard",
+        ),
+        "France": (
+            "standard",
+        ),
+        "USA": (
+            "standard",
+        ),
+        "Russia": (
+            "standard",
+        ),
+        "Italy": (
+            "standard",
+        ),
+        "Turkey": (
+            "standard",
+        ),
+        "Germany": (
+            "standard",
+        ),
+        "Spain": (
+            "standard",
+        ),
+        "Canada": (
+            "standard",
+        ),
+    })
 
     pylons = {}
 
@@ -1340,10 +1346,11 @@ class CH_53E(HelicopterType):
     chaff_charge_size = 1
     flare_charge_size = 1
 
-    class Liveries:
-
-        class USA(Enum):
-            standard = "standard"
+    Liveries = LiveryTable({
+        "USA": (
+            "standard",
+        ),
+    })
 
     pylons = {}
 
@@ -1365,25 +1372,26 @@ class CH_47D(HelicopterType):
     chaff_charge_size = 1
     flare_charge_size = 1
 
-    class Liveries:
-
-        class Australia(Enum):
-            Australia_RAAF = "Australia RAAF"
-
-        class Greece(Enum):
-            Greek_Army = "Greek Army"
-
-        class UK(Enum):
-            ch_47_green_uk = "ch-47_green uk"
-
-        class TheNetherlands(Enum):
-            ch_47_green_neth = "ch-47_green neth"
-
-        class USA(Enum):
-            standard = "standard"
-
-        class Spain(Enum):
-            ch_47_green_spain = "ch-47_green spain"
+    Liveries = LiveryTable({
+        "Australia": (
+            "Australia RAAF",
+        ),
+        "Greece": (
+            "Greek Army",
+        ),
+        "UK": (
+            "ch-47_green uk",
+        ),
+        "TheNetherlands": (
+            "ch-47_green neth",
+        ),
+        "USA": (
+            "standard",
+        ),
+        "Spain": (
+            "ch-47_green spain",
+        ),
+    })
 
     pylons = {}
 
@@ -1405,253 +1413,254 @@ class SH_3W(HelicopterType):
     chaff_charge_size = 1
     flare_charge_size = 1
 
-    class Liveries:
-
-        class USSR(Enum):
-            standard = "standard"
-
-        class Georgia(Enum):
-            standard = "standard"
-
-        class Venezuela(Enum):
-            standard = "standard"
-
-        class Australia(Enum):
-            standard = "standard"
-
-        class Israel(Enum):
-            standard = "standard"
-
-        class Combined_Joint_Task_Forces_Blue(Enum):
-            standard = "standard"
-
-        class Sudan(Enum):
-            standard = "standard"
-
-        class Norway(Enum):
-            standard = "standard"
-
-        class Romania(Enum):
-            standard = "standard"
-
-        class Iran(Enum):
-            standard = "standard"
-
-        class Ukraine(Enum):
-            standard = "standard"
-
-        class Libya(Enum):
-            standard = "standard"
-
-        class Belgium(Enum):
-            standard = "standard"
-
-        class Slovakia(Enum):
-            standard = "standard"
-
-        class Greece(Enum):
-            standard = "standard"
-
-        class UK(Enum):
-            standard = "standard"
-
-        class Third_Reich(Enum):
-            standard = "standard"
-
-        class Hungary(Enum):
-            standard = "standard"
-
-        class Abkhazia(Enum):
-            standard = "standard"
-
-        class Morocco(Enum):
-            standard = "standard"
-
-        class United_Nations_Peacekeepers(Enum):
-            standard = "standard"
-
-        class Switzerland(Enum):
-            standard = "standard"
-
-        class SouthOssetia(Enum):
-            standard = "standard"
-
-        class Vietnam(Enum):
-            standard = "standard"
-
-        class China(Enum):
-            standard = "standard"
-
-        class Yemen(Enum):
-            standard = "standard"
-
-        class Kuwait(Enum):
-            standard = "standard"
-
-        class Serbia(Enum):
-            standard = "standard"
-
-        class Oman(Enum):
-            standard = "standard"
-
-        class India(Enum):
-            standard = "standard"
-
-        class Egypt(Enum):
-            standard = "standard"
-
-        class TheNetherlands(Enum):
-            standard = "standard"
-
-        class Poland(Enum):
-            standard = "standard"
-
-        class Syria(Enum):
-            standard = "standard"
-
-        class Finland(Enum):
-            standard = "standard"
-
-        class Kazakhstan(Enum):
-            standard = "standard"
-
-        class Denmark(Enum):
-            standard = "standard"
-
-        class Sweden(Enum):
-            standard = "standard"
-
-        class Croatia(Enum):
-            standard = "standard"
-
-        class CzechRepublic(Enum):
-            standard = "standard"
-
-        class GDR(Enum):
-            standard = "standard"
-
-        class Yugoslavia(Enum):
-            standard = "standard"
-
-        class Bulgaria(Enum):
-            standard = "standard"
-
-        class SouthKorea(Enum):
-            standard = "standard"
-
-        class Tunisia(Enum):
-            standard = "standard"
-
-        class Combined_Joint_Task_Forces_Red(Enum):
-            standard = "standard"
-
-        class Lebanon(Enum):
-            standard = "standard"
-
-        class Portugal(Enum):
-            standard = "standard"
-
-        class Cuba(Enum):
-            standard = "standard"
-
-        class Insurgents(Enum):
-            standard = "standard"
-
-        class SaudiArabia(Enum):
-            standard = "standard"
-
-        class France(Enum):
-            standard = "standard"
-
-        class USA(Enum):
-            standard = "standard"
-
-        class Honduras(Enum):
-            standard = "standard"
-
-        class Qatar(Enum):
-            standard = "standard"
-
-        class Russia(Enum):
-            standard = "standard"
-
-        class United_Arab_Emirates(Enum):
-            standard = "standard"
-
-        class Italian_Social_Republi(Enum):
-            standard = "standard"
-
-        class Austria(Enum):
-            standard = "standard"
-
-        class Bahrain(Enum):
-            standard = "standard"
-
-        class Italy(Enum):
-            standard = "standard"
-
-        class Chile(Enum):
-            standard = "standard"
-
-        class Turkey(Enum):
-            standard = "standard"
-
-        class Philippines(Enum):
-            standard = "standard"
-
-        class Algeria(Enum):
-            standard = "standard"
-
-        class Pakistan(Enum):
-            standard = "standard"
-
-        class Malaysia(Enum):
-            standard = "standard"
-
-        class Indonesia(Enum):
-            standard = "standard"
-
-        class Iraq(Enum):
-            standard = "standard"
-
-        class Germany(Enum):
-            standard = "standard"
-
-        class South_Africa(Enum):
-            standard = "standard"
-
-        class Jordan(Enum):
-            standard = "standard"
-
-        class Mexico(Enum):
-            standard = "standard"
-
-        class USAFAggressors(Enum):
-            standard = "standard"
-
-        class Brazil(Enum):
-            standard = "standard"
-
-        class Spain(Enum):
-            standard = "standard"
-
-        class Belarus(Enum):
-            standard = "standard"
-
-        class Canada(Enum):
-            standard = "standard"
-
-        class NorthKorea(Enum):
-            standard = "standard"
-
-        class Ethiopia(Enum):
-            standard = "standard"
-
-        class Japan(Enum):
-            standard = "standard"
-
-        class Thailand(Enum):
-            standard = "standard"
+    Liveries = LiveryTable({
+        "USSR": (
+            "standard",
+        ),
+        "Georgia": (
+            "standard",
+        ),
+        "Venezuela": (
+            "standard",
+        ),
+        "Australia": (
+            "standard",
+        ),
+        "Israel": (
+            "standard",
+        ),
+        "Combined_Joint_Task_Forces_Blue": (
+            "standard",
+        ),
+        "Sudan": (
+            "standard",
+        ),
+        "Norway": (
+            "standard",
+        ),
+        "Romania": (
+            "standard",
+        ),
+        "Iran": (
+            "standard",
+        ),
+        "Ukraine": (
+            "standard",
+        ),
+        "Libya": (
+            "standard",
+        ),
+        "Belgium": (
+            "standard",
+        ),
+        "Slovakia": (
+            "standard",
+        ),
+        "Greece": (
+            "standard",
+        ),
+        "UK": (
+            "standard",
+        ),
+        "Third_Reich": (
+            "standard",
+        ),
+        "Hungary": (
+            "standard",
+        ),
+        "Abkhazia": (
+            "standard",
+        ),
+        "Morocco": (
+            "standard",
+        ),
+        "United_Nations_Peacekeepers": (
+            "standard",
+        ),
+        "Switzerland": (
+            "standard",
+        ),
+        "SouthOssetia": (
+            "standard",
+        ),
+        "Vietnam": (
+            "standard",
+        ),
+        "China": (
+            "standard",
+        ),
+        "Yemen": (
+            "standard",
+        ),
+        "Kuwait": (
+            "standard",
+        ),
+        "Serbia": (
+            "standard",
+        ),
+        "Oman": (
+            "standard",
+        ),
+        "India": (
+            "standard",
+        ),
+        "Egypt": (
+            "standard",
+        ),
+        "TheNetherlands": (
+            "standard",
+        ),
+        "Poland": (
+            "standard",
+        ),
+        "Syria": (
+            "standard",
+        ),
+        "Finland": (
+            "standard",
+        ),
+        "Kazakhstan": (
+            "standard",
+        ),
+        "Denmark": (
+            "standard",
+        ),
+        "Sweden": (
+            "standard",
+        ),
+        "Croatia": (
+            "standard",
+        ),
+        "CzechRepublic": (
+            "standard",
+        ),
+        "GDR": (
+            "standard",
+        ),
+        "Yugoslavia": (
+            "standard",
+        ),
+        "Bulgaria": (
+            "standard",
+        ),
+        "SouthKorea": (
+            "standard",
+        ),
+        "Tunisia": (
+            "standard",
+        ),
+        "Combined_Joint_Task_Forces_Red": (
+            "standard",
+        ),
+        "Lebanon": (
+            "standard",
+        ),
+        "Portugal": (
+            "standard",
+        ),
+        "Cuba": (
+            "standard",
+        ),
+        "Insurgents": (
+            "standard",
+        ),
+        "SaudiArabia": (
+            "standard",
+        ),
+        "France": (
+            "standard",
+        ),
+        "USA": (
+            "standard",
+        ),
+        "Honduras": (
+            "standard",
+        ),
+        "Qatar": (
+            "standard",
+        ),
+        "Russia": (
+            "standard",
+        ),
+        "United_Arab_Emirates": (
+            "standard",
+        ),
+        "Italian_Social_Republi": (
+            "standard",
+        ),
+        "Austria": (
+            "standard",
+        ),
+        "Bahrain": (
+            "standard",
+        ),
+        "Italy": (
+            "standard",
+        ),
+        "Chile": (
+            "standard",
+        ),
+        "Turkey": (
+            "standard",
+        ),
+        "Philippines": (
+            "standard",
+        ),
+        "Algeria": (
+            "standard",
+        ),
+        "Pakistan": (
+            "standard",
+        ),
+        "Malaysia": (
+            "standard",
+        ),
+        "Indonesia": (
+            "standard",
+        ),
+        "Iraq": (
+            "standard",
+        ),
+        "Germany": (
+            "standard",
+        ),
+        "South_Africa": (
+            "standard",
+        ),
+        "Jordan": (
+            "standard",
+        ),
+        "Mexico": (
+            "standard",
+        ),
+        "USAFAggressors": (
+            "standard",
+        ),
+        "Brazil": (
+            "standard",
+        ),
+        "Spain": (
+            "standard",
+        ),
+        "Belarus": (
+            "standard",
+        ),
+        "Canada": (
+            "standard",
+        ),
+        "NorthKorea": (
+            "standard",
+        ),
+        "Ethiopia": (
+            "standard",
+        ),
+        "Japan": (
+            "standard",
+        ),
+        "Thailand": (
+            "standard",
+        ),
+    })
 
     pylons = {}
 
@@ -1672,23 +1681,24 @@ class AH_64A(HelicopterType):
     chaff_charge_size = 1
     flare_charge_size = 1
 
-    class Liveries:
-
-        class Israel(Enum):
-            ah_64_a_green_isr = "ah-64_a_green isr"
-
-        class Greece(Enum):
-            greek_army = "greek army"
-
-        class UK(Enum):
-            ah_64_a_green_uk = "ah-64_a_green uk"
-
-        class TheNetherlands(Enum):
-            ah_64_a_green_neth = "ah-64_a_green neth"
-
-        class USA(Enum):
-            standard = "standard"
-            standard_dirty = "standard dirty"
+    Liveries = LiveryTable({
+        "Israel": (
+            "ah-64_a_green isr",
+        ),
+        "Greece": (
+            "greek army",
+        ),
+        "UK": (
+            "ah-64_a_green uk",
+        ),
+        "TheNetherlands": (
+            "ah-64_a_green neth",
+        ),
+        "USA": (
+            "standard",
+            "standard dirty",
+        ),
+    })
 
     class Pylon1:
         LAU_61___19_2_75__rockets_MK151_HE = (1, Weapons.LAU_61___19_2_75__rockets_MK151_HE)
@@ -1731,22 +1741,23 @@ class AH_64D(HelicopterType):
     chaff_charge_size = 1
     flare_charge_size = 1
 
-    class Liveries:
-
-        class Israel(Enum):
-            ah_64_d_isr = "ah-64_d_isr"
-
-        class Greece(Enum):
-            greek_army = "greek army"
-
-        class UK(Enum):
-            ah_64_d_green_uk = "ah-64_d_green uk"
-
-        class TheNetherlands(Enum):
-            ah_64_d_green_neth = "ah-64_d_green neth"
-
-        class USA(Enum):
-            standard = "standard"
+    Liveries = LiveryTable({
+        "Israel": (
+            "ah-64_d_isr",
+        ),
+        "Greece": (
+            "greek army",
+        ),
+        "UK": (
+            "ah-64_d_green uk",
+        ),
+        "TheNetherlands": (
+            "ah-64_d_green neth",
+        ),
+        "USA": (
+            "standard",
+        ),
+    })
 
     class Pylon1:
         AGM_114K___4 = (1, Weapons.AGM_114K___4)
@@ -1789,19 +1800,20 @@ class AH_1W(HelicopterType):
     chaff_charge_size = 1
     flare_charge_size = 1
 
-    class Liveries:
-
-        class Israel(Enum):
-            standard = "standard"
-
-        class USA(Enum):
-            USA_X_Black = "USA X Black"
-            USA_Marines = "USA Marines"
-            standard = "standard"
-
-        class Turkey(Enum):
-            Turkey_1 = "Turkey 1"
-            Turkey_2 = "Turkey 2"
+    Liveries = LiveryTable({
+        "Israel": (
+            "standard",
+        ),
+        "USA": (
+            "USA X Black",
+            "USA Marines",
+            "standard",
+        ),
+        "Turkey": (
+            "Turkey 1",
+            "Turkey 2",
+        ),
+    })
 
     class Pylon1:
         AGM_114K___4 = (1, Weapons.AGM_114K___4)
@@ -1846,13 +1858,14 @@ class SH_60B(HelicopterType):
     chaff_charge_size = 1
     flare_charge_size = 1
 
-    class Liveries:
-
-        class Greece(Enum):
-            Hellenic_Navy = "Hellenic Navy"
-
-        class USA(Enum):
-            standard = "standard"
+    Liveries = LiveryTable({
+        "Greece": (
+            "Hellenic Navy",
+        ),
+        "USA": (
+            "standard",
+        ),
+    })
 
     class Pylon1:
         AGM_119B_Penguin = (1, Weapons.AGM_119B_Penguin)
@@ -1932,95 +1945,96 @@ class UH_1H(HelicopterType):
                 Ask_Always = -1
                 Equally_Responsible = -2
 
-    class Liveries:
-
-        class Georgia(Enum):
-            Georgian_AF_Camo = "Georgian AF Camo"
-            Georgian_Air_Force = "Georgian Air Force"
-
-        class Australia(Enum):
-            Australia_RAAF_171_Sqn = "Australia RAAF 171 Sqn"
-            Australia_RAAF_1968 = "Australia RAAF 1968"
-            Australia_Royal_Navy = "Australia Royal Navy"
-
-        class Israel(Enum):
-            Israel_Army = "Israel Army"
-
-        class Norway(Enum):
-            Norwegian_Coast_Guard__235 = "Norwegian Coast Guard (235)"
-            Norwegian_UN = "Norwegian UN"
-            _Civilian__Standard = "[Civilian] Standard"
-
-        class Ukraine(Enum):
-            Ukrainian_Army = "Ukrainian Army"
-
-        class Belgium(Enum):
-            _Civilian__Standard = "[Civilian] Standard"
-
-        class Greece(Enum):
-            Greek_Army_Aviation = "Greek Army Aviation"
-            Greek_Army_Aviation_Medic = "Greek Army Aviation Medic"
-            Hellenic_Airforce_SAR = "Hellenic Airforce SAR"
-
-        class UK(Enum):
-            _Civilian__Standard = "[Civilian] Standard"
-
-        class Abkhazia(Enum):
-            _Civilian__Standard = "[Civilian] Standard"
-
-        class SouthOssetia(Enum):
-            _Civilian__Standard = "[Civilian] Standard"
-
-        class TheNetherlands(Enum):
-            Royal_Netherlands_AF = "Royal Netherlands AF"
-
-        class Denmark(Enum):
-            _Civilian__Standard = "[Civilian] Standard"
-
-        class Insurgents(Enum):
-            _Civilian__Standard = "[Civilian] Standard"
-
-        class France(Enum):
-            French_Army = "French Army"
-
-        class USA(Enum):
-            Army_Standard = "Army Standard"
-            _Civilian__Standard = "[Civilian] Standard"
-            US_ARMY_1972 = "US ARMY 1972"
-            US_DOS = "US DOS"
-            US_Ft__Rucker = "US Ft. Rucker"
-            US_NAVY = "US NAVY"
-            USA_Red_Flag = "USA Red Flag"
-            USA_UN = "USA UN"
-            XW_PFJ_Air_America = "XW-PFJ Air America"
-            _Civilian__Medical = "[Civilian] Medical"
-            _Civilian__NASA = "[Civilian] NASA"
-            _Civilian__VIP = "[Civilian] VIP"
-
-        class Russia(Enum):
-            RF_Air_Force_Broken = "RF Air Force Broken"
-            RF_Air_Force_Grey = "RF Air Force Grey"
-
-        class Italy(Enum):
-            Italy_15B_Stormo_S_A_R__Soccorso = "Italy 15B Stormo S.A.R -Soccorso"
-            Italy_E_I__4B_Regg__ALTAIR = "Italy E.I. 4B Regg. ALTAIR"
-            Italy_Marina_Militare_s_n__80951_7_20 = "Italy Marina Militare s.n. 80951 7-20"
-
-        class Turkey(Enum):
-            Turkish_Air_Force = "Turkish Air Force"
-
-        class Algeria(Enum):
-            Algerian_AF_BV_32 = "Algerian AF BV-32"
-
-        class Germany(Enum):
-            Luftwaffe = "Luftwaffe"
-
-        class Spain(Enum):
-            Spanish_Army = "Spanish Army"
-            Spanish_UN = "Spanish UN"
-
-        class Canada(Enum):
-            Canadian_Force = "Canadian Force"
+    Liveries = LiveryTable({
+        "Georgia": (
+            "Georgian AF Camo",
+            "Georgian Air Force",
+        ),
+        "Australia": (
+            "Australia RAAF 171 Sqn",
+            "Australia RAAF 1968",
+            "Australia Royal Navy",
+        ),
+        "Israel": (
+            "Israel Army",
+        ),
+        "Norway": (
+            "Norwegian Coast Guard (235)",
+            "Norwegian UN",
+            "[Civilian] Standard",
+        ),
+        "Ukraine": (
+            "Ukrainian Army",
+        ),
+        "Belgium": (
+            "[Civilian] Standard",
+        ),
+        "Greece": (
+            "Greek Army Aviation",
+            "Greek Army Aviation Medic",
+            "Hellenic Airforce SAR",
+        ),
+        "UK": (
+            "[Civilian] Standard",
+        ),
+        "Abkhazia": (
+            "[Civilian] Standard",
+        ),
+        "SouthOssetia": (
+            "[Civilian] Standard",
+        ),
+        "TheNetherlands": (
+            "Royal Netherlands AF",
+        ),
+        "Denmark": (
+            "[Civilian] Standard",
+        ),
+        "Insurgents": (
+            "[Civilian] Standard",
+        ),
+        "France": (
+            "French Army",
+        ),
+        "USA": (
+            "Army Standard",
+            "[Civilian] Standard",
+            "US ARMY 1972",
+            "US DOS",
+            "US Ft. Rucker",
+            "US NAVY",
+            "USA Red Flag",
+            "USA UN",
+            "XW-PFJ Air America",
+            "[Civilian] Medical",
+            "[Civilian] NASA",
+            "[Civilian] VIP",
+        ),
+        "Russia": (
+            "RF Air Force Broken",
+            "RF Air Force Grey",
+        ),
+        "Italy": (
+            "Italy 15B Stormo S.A.R -Soccorso",
+            "Italy E.I. 4B Regg. ALTAIR",
+            "Italy Marina Militare s.n. 80951 7-20",
+        ),
+        "Turkey": (
+            "Turkish Air Force",
+        ),
+        "Algeria": (
+            "Algerian AF BV-32",
+        ),
+        "Germany": (
+            "Luftwaffe",
+        ),
+        "Spain": (
+            "Spanish Army",
+            "Spanish UN",
+        ),
+        "Canada": (
+            "Canadian Force",
+        ),
+    })
 
     class Pylon1:
         M134_L = (1, Weapons.M134_L)
@@ -2075,15 +2089,16 @@ class Mi_28N(HelicopterType):
     chaff_charge_size = 0
     flare_charge_size = 1
 
-    class Liveries:
-
-        class Russia(Enum):
-            night = "night"
-            standard = "standard"
-
-        class Algeria(Enum):
-            AAF_SC_11 = "AAF SC-11"
-            AAF_SC_12 = "AAF SC-12"
+    Liveries = LiveryTable({
+        "Russia": (
+            "night",
+            "standard",
+        ),
+        "Algeria": (
+            "AAF SC-11",
+            "AAF SC-12",
+        ),
+    })
 
     class Pylon1:
         B_8V20A_CM = (1, Weapons.B_8V20A_CM)
@@ -2210,38 +2225,39 @@ class SA342M(HelicopterType):
         },
     }
 
-    class Liveries:
-
-        class Israel(Enum):
-            israel_fictional = "israel fictional"
-
-        class Greece(Enum):
-            greece_cyprus_fictional_desert = "greece cyprus fictional desert"
-
-        class UK(Enum):
-            uk_fictional = "uk fictional"
-
-        class Serbia(Enum):
-            serbia_fictional = "serbia fictional"
-            yugoslav_fictional = "yugoslav fictional"
-
-        class Syria(Enum):
-            syria_fictional = "syria fictional"
-
-        class France(Enum):
-            combat = "combat"
-            tiger_meet = "tiger meet"
-            tiger_meet_2 = "tiger meet 2"
-            training = "training"
-
-        class USA(Enum):
-            us_marines_fictional = "us marines fictional"
-
-        class Russia(Enum):
-            russia_fictional = "russia fictional"
-
-        class Germany(Enum):
-            germany_fictional = "germany fictional"
+    Liveries = LiveryTable({
+        "Israel": (
+            "israel fictional",
+        ),
+        "Greece": (
+            "greece cyprus fictional desert",
+        ),
+        "UK": (
+            "uk fictional",
+        ),
+        "Serbia": (
+            "serbia fictional",
+            "yugoslav fictional",
+        ),
+        "Syria": (
+            "syria fictional",
+        ),
+        "France": (
+            "combat",
+            "tiger meet",
+            "tiger meet 2",
+            "training",
+        ),
+        "USA": (
+            "us marines fictional",
+        ),
+        "Russia": (
+            "russia fictional",
+        ),
+        "Germany": (
+            "germany fictional",
+        ),
+    })
 
     class Pylon1:
         HOT3_ = (1, Weapons.HOT3_)
@@ -2298,38 +2314,40 @@ class SA342L(HelicopterType):
         },
     }
 
-    class Liveries:
-
-        class Israel(Enum):
-            israel_fictional = "israel fictional"
-
-        class Greece(Enum):
-            greece_cyprus_fictional_desert = "greece cyprus fictional desert"
-
-        class UK(Enum):
-            uk_fictional = "uk fictional"
+    Liveries = LiveryTable({
+        "Israel": (
+            "israel fictional",
+        ),
+        "Greece": (
+            "greece cyprus fictional desert",
+        ),
+        "UK": (
+            "uk fictional",
+        ),
+        "Serbia": (
+            "serbia fictional",
+            "yugoslav fictional",
+        ),
+        "Syria": (
+            "syria fictional",
+        ),
+        "France": (
+            "combat",
+            "tiger meet",
+            "tiger meet 2",
+            "training",
+        ),
+        "USA": (
+            "us marines fictional",
+        ),
+        "Russia": (
+            "russia fictional",
+        ),
+        "Germany": (
+            "germany fictional",
+        ),
+    })
 
-        class Serbia(Enum):
-            serbia_fictional = "serbia fictional"
-            yugoslav_fictional = "yugoslav fictional"
-
-        class Syria(Enum):
-            syria_fictional = "syria fictional"
-
-        class France(Enum):
-            combat = "combat"
-            tiger_meet = "tiger meet"
-            tiger_meet_2 = "tiger meet 2"
-            training = "training"
-
-        class USA(Enum):
-            us_marines_fictional = "us marines fictional"
-
-        class Russia(Enum):
-            russia_fictional = "russia fictional"
-
-        class Germany(Enum):
-            germany_fictional = "germany fictional"
 #ERRR {GIAT_M621G}
 
     class Pylon2:
@@ -2379,38 +2397,39 @@ class SA342Mistral(HelicopterType):
         },
     }
 
-    class Liveries:
-
-        class Israel(Enum):
-            israel_fictional = "israel fictional"
-
-        class Greece(Enum):
-            greece_cyprus_fictional_desert = "greece cyprus fictional desert"
-
-        class UK(Enum):
-            uk_fictional = "uk fictional"
-
-        class Serbia(Enum):
-            serbia_fictional = "serbia fictional"
-            yugoslav_fictional = "yugoslav fictional"
-
-        class Syria(Enum):
-            syria_fictional = "syria fictional"
-
-        class France(Enum):
-            combat = "combat"
-            tiger_meet = "tiger meet"
-            tiger_meet_2 = "tiger meet 2"
-            training = "training"
-
-        class USA(Enum):
-            us_marines_fictional = "us marines fictional"
-
-        class Russia(Enum):
-            russia_fictional = "russia fictional"
-
-        class Germany(Enum):
-            germany_fictional = "germany fictional"
+    Liveries = LiveryTable({
+        "Israel": (
+            "israel fictional",
+        ),
+        "Greece": (
+            "greece cyprus fictional desert",
+        ),
+        "UK": (
+            "uk fictional",
+        ),
+        "Serbia": (
+            "serbia fictional",
+            "yugoslav fictional",
+        ),
+        "Syria": (
+            "syria fictional",
+        ),
+        "France": (
+            "combat",
+            "tiger meet",
+            "tiger meet 2",
+            "training",
+        ),
+        "USA": (
+            "us marines fictional",
+        ),
+        "Russia": (
+            "russia fictional",
+        ),
+        "Germany": (
+            "germany fictional",
+        ),
+    })
 
     class Pylon1:
         Mistral_ = (1, Weapons.Mistral_)
@@ -2467,38 +2486,40 @@ class SA342Minigun(HelicopterType):
         },
     }
 
-    class Liveries:
-
-        class Israel(Enum):
-            israel_fictional = "israel fictional"
-
-        class Greece(Enum):
-            greece_cyprus_fictional_desert = "greece cyprus fictional desert"
-
-        class UK(Enum):
-            uk_fictional = "uk fictional"
-
-        class Serbia(Enum):
-            serbia_fictional = "serbia fictional"
-            yugoslav_fictional = "yugoslav fictional"
-
-        class Syria(Enum):
-            syria_fictional = "syria fictional"
-
-        class France(Enum):
-            combat = "combat"
-            tiger_meet = "tiger meet"
-            tiger_meet_2 = "tiger meet 2"
-            training = "training"
-
-        class USA(Enum):
-            us_marines_fictional = "us marines fictional"
-
-        class Russia(Enum):
-            russia_fictional = "russia fictional"
+    Liveries = LiveryTable({
+        "Israel": (
+            "israel fictional",
+        ),
+        "Greece": (
+            "greece cyprus fictional desert",
+        ),
+        "UK": (
+            "uk fictional",
+        ),
+        "Serbia": (
+            "serbia fictional",
+            "yugoslav fictional",
+        ),
+        "Syria": (
+            "syria fictional",
+        ),
+        "France": (
+            "combat",
+            "tiger meet",
+            "tiger meet 2",
+            "training",
+        ),
+        "USA": (
+            "us marines fictional",
+        ),
+        "Russia": (
+            "russia fictional",
+        ),
+        "Germany": (
+            "germany fictional",
+        ),
+    })
 
-        class Germany(Enum):
-            germany_fictional = "germany fictional"
 #ERRR {MINIGUN}
 
     class Pylon5:
@@ -1,4 +1,5 @@
 # lua table serialization
 
-from dcs.lua.parse import loads
-from dcs.lua.serialize import dumps
+from dcs.lua.parse import loads, iterparse
+from dcs.lua.serialize import dump, dump_table, dumps
+from dcs.lua.cache import ParseCache
@@ -0,0 +1,761 @@
+/*
+ * Optional C implementation of dcs.lua.parse.loads.
+ *
+ * Mirrors the token rules and error reporting of the pure python Parser
+ * in parse.py, both backends have to return identical results.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+typedef struct {
+    PyObject *buffer;
+    int kind;
+    const void *data;
+    Py_ssize_t len;
+    PyObject *variables;
+} Parser;
+
+enum {
+    T_NONE = 0,
+    T_KEY_STRING,
+    T_KEY_NUMBER,
+    T_STRING,
+    T_NUMBER,
+    T_NAME,
+    T_CHAR
+};
+
+typedef struct {
+    int type;
+    Py_ssize_t start;   /* position of the first token character */
+    Py_ssize_t end;     /* position behind the token */
+    Py_ssize_t vstart;  /* value slice for strings, numbers and names */
+    Py_ssize_t vend;
+    int escaped;        /* string contains backslashes */
+} Token;
+
+#define CH(p, i) PyUnicode_READ((p)->kind, (p)->data, (i))
+#define IS_DIGIT(c) ((c) >= '0' && (c) <= '9')
+
+static Py_ssize_t
+skip_ws(Parser *p, Py_ssize_t pos)
+{
+    while (pos < p->len) {
+        Py_UCS4 c = CH(p, pos);
+        if (Py_UNICODE_ISSPACE(c)) {
+            pos++;
+        }
+        else if (c == '-' && pos + 1 < p->len && CH(p, pos + 1) == '-') {
+            pos += 2;
+            while (pos < p->len && CH(p, pos) != '\n')
+                pos++;
+            if (pos < p->len)
+                pos++;
+        }
+        else {
+            break;
+        }
+    }
+    return pos;
+}
+
+static Py_ssize_t
+lineno(Parser *p, Py_ssize_t pos)
+{
+    Py_ssize_t n = 1;
+    for (Py_ssize_t i = 0; i < pos && i < p->len; i++) {
+        if (CH(p, i) == '\n')
+            n++;
+    }
+    return n;
+}
+
+static void
+syntax_error(Parser *p, PyObject *text, Py_ssize_t pos)
+{
+    PyObject *se, *v;
+    if (text == NULL)
+        return;
+    se = PyObject_CallObject(PyExc_SyntaxError, NULL);
+    if (se == NULL) {
+        Py_DECREF(text);
+        return;
+    }
+    v = PyLong_FromSsize_t(lineno(p, pos));
+    if (v) {
+        PyObject_SetAttrString(se, "lineno", v);
+        Py_DECREF(v);
+    }
+    v = PyLong_FromSsize_t(pos);
+    if (v) {
+        PyObject_SetAttrString(se, "offset", v);
+        Py_DECREF(v);
+    }
+    PyObject_SetAttrString(se, "text", text);
+    Py_DECREF(text);
+    PyErr_SetObject(PyExc_SyntaxError, se);
+    Py_DECREF(se);
+}
+
+static PyObject *
+char_str(Parser *p, Py_ssize_t pos)
+{
+    if (pos >= p->len)
+        return PyUnicode_FromString("");
+    return PyUnicode_Substring(p->buffer, pos, pos + 1);
+}
+
+static void
+eob_error(Parser *p, Py_ssize_t pos)
+{
+    syntax_error(p, PyUnicode_FromString("Unexpected end of buffer"), pos);
+}
+
+static void
+unexpected_error(Parser *p, Py_ssize_t pos)
+{
+    PyObject *c = char_str(p, pos);
+    if (c == NULL)
+        return;
+    syntax_error(p, PyUnicode_FromFormat("Unexpected character '%U'", c), pos);
+    Py_DECREF(c);
+}
+
+static void
+expected_error(Parser *p, char exp, Py_ssize_t pos)
+{
+    PyObject *c = char_str(p, pos);
+    if (c == NULL)
+        return;
+    syntax_error(p, PyUnicode_FromFormat("Expected character '%c', got '%U'", exp, c), pos);
+    Py_DECREF(c);
+}
+
+static void
+name_error(Parser *p, PyObject *name, Py_ssize_t pos)
+{
+    PyObject *c = char_str(p, pos);
+    if (c == NULL)
+        return;
+    syntax_error(p, PyUnicode_FromFormat("%U '%U'", name, c), pos);
+    Py_DECREF(c);
+}
+
+/* scans a string body starting behind the opening quote, returns the closing quote position or -1 */
+static Py_ssize_t
+scan_string(Parser *p, Py_ssize_t pos, int *escaped)
+{
+    *escaped = 0;
+    while (pos < p->len) {
+        Py_UCS4 c = CH(p, pos);
+        if (c == '"')
+            return pos;
+        if (c == '\\') {
+            *escaped = 1;
+            pos++;
+            if (pos >= p->len)
+                return -1;
+        }
+        pos++;
+    }
+    return -1;
+}
+
+/* scans a number at pos, returns the end position or -1 */
+static Py_ssize_t
+scan_number(Parser *p, Py_ssize_t pos)
+{
+    if (pos < p->len && CH(p, pos) == '-')
+        pos++;
+    if (pos >= p->len || !IS_DIGIT(CH(p, pos)))
+        return -1;
+    while (pos < p->len && IS_DIGIT(CH(p, pos)))
+        pos++;
+    if (pos < p->len && CH(p, pos) == '.') {
+        pos++;
+        while (pos < p->len && IS_DIGIT(CH(p, pos)))
+            pos++;
+    }
+    if (pos < p->len && (CH(p, pos) == 'e' || CH(p, pos) == 'E')) {
+        Py_ssize_t e = pos + 1;
+        if (e < p->len && (CH(p, e) == '-' || CH(p, e) == '+'))
+            e++;
+        if (e < p->len && IS_DIGIT(CH(p, e))) {
+            while (e < p->len && IS_DIGIT(CH(p, e)))
+                e++;
+            pos = e;
+        }
+    }
+    return pos;
+}
+
+static int
+is_name_char(Py_UCS4 c)
+{
+    return c == '_' || Py_UNICODE_ISALNUM(c);
+}
+
+/* `[ "key" ] =` or `[ 1 ] =`, whitespace only, returns 1 if matched */
+static int
+scan_key(Parser *p, Py_ssize_t pos, Token *t)
+{
+    Py_ssize_t i = pos + 1;
+    while (i < p->len && Py_UNICODE_ISSPACE(CH(p, i)))
+        i++;
+    if (i >= p->len)
+        return 0;
+    if (CH(p, i) == '"') {
+        Py_ssize_t close = scan_string(p, i + 1, &t->escaped);
+        if (close < 0)
+            return 0;
+        t->type = T_KEY_STRING;
+        t->vstart = i + 1;
+        t->vend = close;
+        i = close + 1;
+    }
+    else {
+        Py_ssize_t e = scan_number(p, i);
+        if (e < 0)
+            return 0;
+        t->type = T_KEY_NUMBER;
+        t->vstart = i;
+        t->vend = e;
+        i = e;
+    }
+    while (i < p->len && Py_UNICODE_ISSPACE(CH(p, i)))
+        i++;
+    if (i >= p->len || CH(p, i) != ']')
+        return 0;
+    i++;
+    while (i < p->len && Py_UNICODE_ISSPACE(CH(p, i)))
+        i++;
+    if (i >= p->len || CH(p, i) != '=')
+        return 0;
+    t->end = i + 1;
+    return 1;
+}
+
+/* reads the token behind pos, T_NONE at end of buffer or on a lone '-' */
+static void
+next_token(Parser *p, Py_ssize_t pos, Token *t)
+{
+    Py_UCS4 c;
+    pos = skip_ws(p, pos);
+    t->start = pos;
+    t->type = T_NONE;
+    t->escaped = 0;
+    if (pos >= p->len)
+        return;
+
+    c = CH(p, pos);
+    if (c == '[' && scan_key(p, pos, t))
+        return;
+    if (c == '"') {
+        Py_ssize_t close = scan_string(p, pos + 1, &t->escaped);
+        if (close >= 0) {
+            t->type = T_STRING;
+            t->vstart = pos + 1;
+            t->vend = close;
+            t->end = close + 1;
+            return;
+        }
+    }
+    else if (c == '-' || IS_DIGIT(c)) {
+        Py_ssize_t e = scan_number(p, pos);
+        if (e >= 0) {
+            t->type = T_NUMBER;
+            t->vstart = pos;
+            t->vend = e;
+            t->end = e;
+            return;
+        }
+        if (c == '-')
+            return;
+    }
+    else if (is_name_char(c) && !Py_UNICODE_ISDECIMAL(c)) {
+        Py_ssize_t e = pos + 1;
+        while (e < p->len && is_name_char(CH(p, e)))
+            e++;
+        t->type = T_NAME;
+        t->vstart = pos;
+        t->vend = e;
+        t->end = e;
+        return;
+    }
+    t->type = T_CHAR;
+    t->vstart = pos;
+    t->vend = pos + 1;
+    t->end = pos + 1;
+}
+
+/* like next_token, raises for end of buffer or invalid characters, returns -1 on error */
+static int
+token(Parser *p, Py_ssize_t pos, Token *t)
+{
+    next_token(p, pos, t);
+    if (t->type != T_NONE)
+        return 0;
+    if (t->start >= p->len)
+        eob_error(p, t->start);
+    else
+        unexpected_error(p, t->start);
+    return -1;
+}
+
+static int
+is_char(Parser *p, Token *t, Py_UCS4 c)
+{
+    return t->type == T_CHAR && CH(p, t->start) == c;
+}
+
+static PyObject *
+make_string(Parser *p, Token *t)
+{
+    Py_UCS4 *buf;
+    Py_ssize_t n = 0;
+    PyObject *s;
+
+    if (!t->escaped)
+        return PyUnicode_Substring(p->buffer, t->vstart, t->vend);
+
+    buf = PyMem_New(Py_UCS4, t->vend - t->vstart);
+    if (buf == NULL)
+        return PyErr_NoMemory();
+    for (Py_ssize_t i = t->vstart; i < t->vend; i++) {
+        Py_UCS4 c = CH(p, i);
+        if (c == '\\' && i + 1 < t->vend)
+            c = CH(p, ++i);
+        buf[n++] = c;
+    }
+    s = PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND, buf, n);
+    PyMem_Free(buf);
+    return s;
+}
+
+static PyObject *
+make_number(Parser *p, Token *t)
+{
+    char small[64];
+    char *s = small;
+    Py_ssize_t n = t->vend - t->vstart;
+    int is_int = n < 16;
+    PyObject *result;
+    double d;
+
+    if (n >= (Py_ssize_t)sizeof(small)) {
+        s = PyMem_Malloc(n + 1);
+        if (s == NULL)
+            return PyErr_NoMemory();
+    }
+    for (Py_ssize_t i = 0; i < n; i++) {
+        Py_UCS4 c = CH(p, t->vstart + i);
+        if (c == '.' || c == 'e' || c == 'E')
+            is_int = 0;
+        s[i] = (char)c;
+    }
+    s[n] = '\0';
+
+    if (is_int) {
+        result = PyLong_FromString(s, NULL, 10);
+    }
+    else {
+        d = PyOS_string_to_double(s, NULL, NULL);
+        if (d == -1.0 && PyErr_Occurred())
+            result = NULL;
+        else if (Py_IS_FINITE(d) && d == floor(d))
+            result = PyLong_FromDouble(d);
+        else
+            result = PyFloat_FromDouble(d);
+    }
+    if (s != small)
+        PyMem_Free(s);
+    return result;
+}
+
+static PyObject *table(Parser *p, Py_ssize_t pos, Py_ssize_t *end);
+static PyObject *value(Parser *p, Token *t, Py_ssize_t *end);
+
+static PyObject *
+str_function(Parser *p, Py_ssize_t pos, Py_ssize_t *end)
+{
+    Token t;
+    PyObject *s;
+    if (token(p, pos, &t) < 0)
+        return NULL;
+    if (!is_char(p, &t, '(')) {
+        expected_error(p, '(', t.start);
+        return NULL;
+    }
+    if (token(p, t.end, &t) < 0)
+        return NULL;
+    if (t.type != T_STRING) {
+        expected_error(p, '"', t.start);
+        return NULL;
+    }
+    s = make_string(p, &t);
+    if (s == NULL)
+        return NULL;
+    if (token(p, t.end, &t) < 0 || !is_char(p, &t, ')')) {
+        if (!PyErr_Occurred())
+            expected_error(p, ')', t.start);
+        Py_DECREF(s);
+        return NULL;
+    }
+    *end = t.end;
+    return s;
+}
+
+/* returns a new reference to the value of token t */
+static PyObject *
+value_impl(Parser *p, Token *t, Py_ssize_t *end)
+{
+    switch (t->type) {
+    case T_STRING:
+        *end = t->end;
+        return make_string(p, t);
+    case T_NUMBER:
+        *end = t->end;
+        return make_number(p, t);
+    case T_NAME: {
+        PyObject *name = PyUnicode_Substring(p->buffer, t->vstart, t->vend);
+        PyObject *v;
+        if (name == NULL)
+            return NULL;
+        if (PyUnicode_CompareWithASCIIString(name, "true") == 0) {
+            Py_DECREF(name);
+            *end = t->end;
+            Py_RETURN_TRUE;
+        }
+        if (PyUnicode_CompareWithASCIIString(name, "false") == 0) {
+            Py_DECREF(name);
+            *end = t->end;
+            Py_RETURN_FALSE;
+        }
+        if (PyUnicode_CompareWithASCIIString(name, "_") == 0) {
+            Py_DECREF(name);
+            return str_function(p, t->end, end);
+        }
+        v = PyDict_GetItemWithError(p->variables, name);
+        if (v != NULL) {
+            Py_DECREF(name);
+            Py_INCREF(v);
+            *end = t->end;
+            return v;
+        }
+        if (!PyErr_Occurred())
+            name_error(p, name, skip_ws(p, t->end));
+        Py_DECREF(name);
+        return NULL;
+    }
+    case T_CHAR:
+        if (CH(p, t->start) == '{')
+            return table(p, t->end, end);
+        if (CH(p, t->start) == '"') {
+            eob_error(p, p->len);
+            return NULL;
+        }
+        /* fall through */
+    default:
+        unexpected_error(p, t->start);
+        return NULL;
+    }
+}
+
+static int
+name_equals(Parser *p, Token *t, const char *s)
+{
+    Py_ssize_t n = (Py_ssize_t)strlen(s);
+    if (t->vend - t->vstart != n)
+        return 0;
+    for (Py_ssize_t i = 0; i < n; i++) {
+        if (CH(p, t->vstart + i) != (Py_UCS4)(unsigned char)s[i])
+            return 0;
+    }
+    return 1;
+}
+
+static PyObject *
+key(Parser *p, Py_ssize_t pos, Py_ssize_t *end)
+{
+    Token t;
+    PyObject *k;
+    if (token(p, pos, &t) < 0)
+        return NULL;
+    if (t.type == T_STRING)
+        k = make_string(p, &t);
+    else if (t.type == T_NUMBER)
+        k = make_number(p, &t);
+    else if (t.type == T_NAME && name_equals(p, &t, "true")) {
+        k = Py_True;
+        Py_INCREF(k);
+    }
+    else if (t.type == T_NAME && name_equals(p, &t, "false")) {
+        k = Py_False;
+        Py_INCREF(k);
+    }
+    else {
+        unexpected_error(p, t.start);
+        return NULL;
+    }
+    if (k == NULL)
+        return NULL;
+    if (token(p, t.end, &t) < 0 || !is_char(p, &t, ']')) {
+        if (!PyErr_Occurred())
+            expected_error(p, ']', t.start);
+        Py_DECREF(k);
+        return NULL;
+    }
+    if (token(p, t.end, &t) < 0 || !is_char(p, &t, '=')) {
+        if (!PyErr_Occurred())
+            expected_error(p, '=', t.start);
+        Py_DECREF(k);
+        return NULL;
+    }
+    *end = t.end;
+    return k;
+}
+
+static PyObject *
+table_impl(Parser *p, Py_ssize_t pos, Py_ssize_t *end)
+{
+    PyObject *d = PyDict_New();
+    long inc_key = 1;
+    Token t;
+
+    if (d == NULL)
+        return NULL;
+
+    for (;;) {
+        PyObject *k, *v;
+        int have_value_token = 0;
+
+        if (token(p, pos, &t) < 0)
+            goto error;
+
+        if (t.type == T_KEY_STRING) {
+            k = make_string(p, &t);
+            pos = t.end;
+        }
+        else if (t.type == T_KEY_NUMBER) {
+            k = make_number(p, &t);
+            pos = t.end;
+        }
+        else if (is_char(p, &t, '}')) {
+            *end = t.end;
+            return d;
+        }
+        else if (is_char(p, &t, '[')) {
+            k = key(p, t.end, &pos);
+        }
+        else {
+            k = PyLong_FromLong(inc_key++);
+            have_value_token = 1;
+        }
+        if (k == NULL)
+            goto error;
+
+        if (!have_value_token && token(p, pos, &t) < 0) {
+            Py_DECREF(k);
+            goto error;
+        }
+        v = value(p, &t, &pos);
+        if (v == NULL) {
+            Py_DECREF(k);
+            goto error;
+        }
+        if (PyDict_SetItem(d, k, v) < 0) {
+            Py_DECREF(k);
+            Py_DECREF(v);
+            goto error;
+        }
+        Py_DECREF(k);
+        Py_DECREF(v);
+
+        if (token(p, pos, &t) < 0)
+            goto error;
+        if (is_char(p, &t, ',')) {
+            pos = t.end;
+            continue;
+        }
+        if (is_char(p, &t, '}')) {
+            *end = t.end;
+            return d;
+        }
+        unexpected_error(p, t.start);
+        goto error;
+    }
+
+error:
+    Py_DECREF(d);
+    return NULL;
+}
+
+/* value and table recurse for nested tables, deep input raises RecursionError like the python parser */
+static PyObject *
+value(Parser *p, Token *t, Py_ssize_t *end)
+{
+    PyObject *v;
+    if (Py_EnterRecursiveCall(" while parsing a lua value"))
+        return NULL;
+    v = value_impl(p, t, end);
+    Py_LeaveRecursiveCall();
+    return v;
+}
+
+static PyObject *
+table(Parser *p, Py_ssize_t pos, Py_ssize_t *end)
+{
+    PyObject *d;
+    if (Py_EnterRecursiveCall(" while parsing a lua table"))
+        return NULL;
+    d = table_impl(p, pos, end);
+    Py_LeaveRecursiveCall();
+    return d;
+}
+
+static int
+parse(Parser *p)
+{
+    Py_ssize_t pos = 0;
+    Token t;
+    PyObject *names = NULL;
+
+    for (;;) {
+        Py_ssize_t n, i;
+
+        pos = skip_ws(p, pos);
+        if (pos >= p->len)
+            break;
+
+        if (token(p, pos, &t) < 0)
+            return -1;
+        pos = t.end;
+        if (t.type != T_NAME) {
+            PyObject *v = value(p, &t, &pos);
+            if (v == NULL)
+                return -1;
+            Py_DECREF(v);
+            break;
+        }
+
+        if (name_equals(p, &t, "false") || name_equals(p, &t, "true") || name_equals(p, &t, "return"))
+            break;
+
+        names = PyList_New(0);
+        if (names == NULL)
+            return -1;
+        if (name_equals(p, &t, "local")) {
+            Py_ssize_t start = pos;
+            for (;;) {
+                PyObject *name;
+                next_token(p, pos, &t);
+                if (t.type != T_NAME)
+                    break;
+                name = PyUnicode_Substring(p->buffer, t.vstart, t.vend);
+                if (name == NULL || PyList_Append(names, name) < 0) {
+                    Py_XDECREF(name);
+                    goto error;
+                }
+                Py_DECREF(name);
+                pos = skip_ws(p, t.end);
+                if (pos >= p->len || CH(p, pos) != ',')
+                    break;
+                pos++;
+            }
+            if (PyList_GET_SIZE(names) == 0) {
+                PyObject *local = PyUnicode_FromString("local");
+                if (local != NULL) {
+                    name_error(p, local, start);
+                    Py_DECREF(local);
+                }
+                goto error;
+            }
+        }
+        else {
+            PyObject *name = PyUnicode_Substring(p->buffer, t.vstart, t.vend);
+            if (name == NULL || PyList_Append(names, name) < 0) {
+                Py_XDECREF(name);
+                goto error;
+            }
+            Py_DECREF(name);
+        }
+
+        n = PyList_GET_SIZE(names);
+        pos = skip_ws(p, pos);
+        if (pos >= p->len || CH(p, pos) != '=') {
+            name_error(p, PyList_GET_ITEM(names, n - 1), pos);
+            goto error;
+        }
+        pos++;
+
+        for (i = 0;; i++) {
+            PyObject *v;
+            if (token(p, pos, &t) < 0)
+                goto error;
+            v = value(p, &t, &pos);
+            if (v == NULL)
+                goto error;
+            if (i < n && PyDict_SetItem(p->variables, PyList_GET_ITEM(names, i), v) < 0) {
+                Py_DECREF(v);
+                goto error;
+            }
+            Py_DECREF(v);
+
+            pos = skip_ws(p, pos);
+            if (pos >= p->len || CH(p, pos) != ',')
+                break;
+            pos++;
+        }
+        Py_CLEAR(names);
+    }
+    return 0;
+
+error:
+    Py_XDECREF(names);
+    return -1;
+}
+
+static PyObject *
+lua_loads(PyObject *self, PyObject *args)
+{
+    Parser p;
+    PyObject *buffer, *variables;
+
+    if (!PyArg_ParseTuple(args, "UO!:loads", &buffer, &PyDict_Type, &variables))
+        return NULL;
+#if PY_VERSION_HEX < 0x030C0000
+    if (PyUnicode_READY(buffer) < 0)
+        return NULL;
+#endif
+
+    p.buffer = buffer;
+    p.kind = PyUnicode_KIND(buffer);
+    p.data = PyUnicode_DATA(buffer);
+    p.len = PyUnicode_GET_LENGTH(buffer);
+    p.variables = variables;
+
+    if (parse(&p) < 0)
+        return NULL;
+    Py_INCREF(variables);
+    return variables;
+}
+
+static PyMethodDef methods[] = {
+    {"loads", lua_loads, METH_VARARGS,
+     "loads(tablestr, variables)\n\nParses lua assignments into the given variables dict and returns it."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef module = {
+    PyModuleDef_HEAD_INIT,
+    "dcs.lua._parse",
+    "C implementation of the lua table parser.",
+    -1,
+    methods
+};
+
+PyMODINIT_FUNC
+PyInit__parse(void)
+{
+    return PyModule_Create(&module);
+}
@@ -0,0 +1,129 @@
+import os
+import pickle
+import tempfile
+import zipfile
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple, Callable, Iterable, List
+
+from dcs.lua.parse import loads
+
+
+class ParseCache:
+    """Cache of parsed lua zip members, keyed by the CRC32 and size of the member.
+
+    The CRC and size are taken from the zip directory, so a cache hit
+    neither decompresses nor parses the member. Results are kept pickled,
+    every hit returns a fresh copy that the caller may modify.
+
+    Entries are kept in memory with LRU eviction, if a directory is given
+    they are stored there instead and shared between processes.
+
+    >>> Mission.parse_cache = ParseCache(maxsize=16)
+
+    Args:
+        maxsize: maximum number of entries kept in memory
+        directory: if set, entries are stored as files in this directory and maxsize is ignored
+    """
+    # bump if the parser output changes, invalidates on disk entries
+    version = 1
+
+    def __init__(self, maxsize: int = 32, directory: Optional[str] = None):
+        self.maxsize = maxsize
+        self.directory = directory
+        self.entries = OrderedDict()  # type: OrderedDict[Tuple[int, int], bytes]
+        self.hits = 0
+        self.misses = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def loads(self, mizfile: zipfile.ZipFile, name: str, _globals: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Returns the parsed lua member name of mizfile.
+
+        :param mizfile: opened zip file
+        :param name: name of the lua member in the zip file
+        :param _globals: predefined variables, they are not part of the cache key
+        :return: dict of all assigned variables
+        """
+        def parse(names):
+            return ((x, loads(mizfile.read(x).decode(), _globals)) for x in names)
+        return self.loads_many(mizfile, [name], parse)[name]
+
+    def loads_many(self, mizfile: zipfile.ZipFile, names: List[str],
+                   parse: Callable[[List[str]], Iterable[Tuple[str, Dict[str, Any]]]]) -> Dict[str, Dict[str, Any]]:
+        """Returns the parsed lua members names of mizfile.
+
+        :param mizfile: opened zip file
+        :param names: names of the lua members in the zip file
+        :param parse: called with the names missing in the cache, yields (name, value) pairs,
+                      e.g. parsed on a process pool
+        :return: dict of the parsed values by member name
+        """
+        values = {}
+        pending = []
+        for name in names:
+            value = self.lookup(mizfile.getinfo(name))
+            if value is None:
+                pending.append(name)
+            else:
+                values[name] = value
+        for name, value in parse(pending):
+            self.store(mizfile.getinfo(name), value)
+            values[name] = value
+        return values
+
+    def lookup(self, info: zipfile.ZipInfo) -> Optional[Dict[str, Any]]:
+        """Returns a copy of the cached value for the zip member or None."""
+        data = self._get((info.CRC, info.file_size))
+        if data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return pickle.loads(data)
+
+    def store(self, info: zipfile.ZipInfo, value: Dict[str, Any]):
+        """Stores the parsed value of the zip member, later changes to value are not reflected."""
+        self._put((info.CRC, info.file_size), pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+
+    def clear(self):
+        self.entries.clear()
+        if self.directory:
+            for filename in os.listdir(self.directory):
+                if filename.endswith(".pickle"):
+                    os.remove(os.path.join(self.directory, filename))
+
+    def _path(self, key: Tuple[int, int]) -> str:
+        return os.path.join(self.directory, "{v}_{crc:08x}_{size}.pickle".format(v=self.version, crc=key[0], size=key[1]))
+
+    def _get(self, key: Tuple[int, int]) -> Optional[bytes]:
+        if self.directory:
+            try:
+                with open(self._path(key), "rb") as f:
+                    return f.read()
+            except FileNotFoundError:
+                return None
+
+        data = self.entries.get(key)
+        if data is not None:
+            self.entries.move_to_end(key)
+        return data
+
+    def _put(self, key: Tuple[int, int], data: bytes):
+        if self.directory:
+            # write to a temporary file first, other processes might read the entry concurrently
+            fd, tmpname = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmpname, self._path(key))
+            return
+
+        self.entries[key] = data
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def __len__(self):
+        if self.directory:
+            return len([x for x in os.listdir(self.directory) if x.endswith(".pickle")])
+        return len(self.entries)
+
+    def __repr__(self):
+        return "ParseCache({n} entries, {h} hits, {m} misses)".format(n=len(self), h=self.hits, m=self.misses)
@@ -1,359 +1,585 @@
-from typing import Dict, Any, Optional, List, Union
-
-
-def loads(tablestr, _globals: Optional[Dict[str, Any]] = None):
-
-    class Parser:
-        def __init__(self, buffer: str, _globals: dict = None):
-            self.buffer: str = buffer
-            if _globals:
-                self.variables = _globals.copy()
+import codecs
+import os
+import re
+import sys
+from typing import Dict, Any, Optional, List, Union, Tuple, BinaryIO, Iterator, Collection, Callable
+
+try:
+    from dcs.lua import _parse
+except ImportError:
+    _parse = None
+
+
+# whitespace and `--` line comments between tokens
+_WS = re.compile(r'(?:\s|--[^\n]*(?:\n|\Z))*')
+
+# one token, preceded by optional whitespace/comments.
+# The common table key forms `["key"] =` and `[1] =` are matched as a single token.
+_TOKEN = re.compile(r'''
+    (?:\s|--[^\n]*(?:\n|\Z))*
+    (?:
+        \[\s*(?:"([^"\\]*(?:\\.[^"\\]*)*)"|(-?[0-9]+(?:\.[0-9]*)?(?:[eE][-+]?[0-9]+)?))\s*\]\s*=
+      | "([^"\\]*(?:\\.[^"\\]*)*)"
+      | (-?[0-9]+(?:\.[0-9]*)?(?:[eE][-+]?[0-9]+)?)
+      | ([^\W\d]\w*)
+      | ([^\s-])
+    )''', re.VERBOSE | re.DOTALL)
+
+# token group indices
+_KEY_STRING = 1
+_KEY_NUMBER = 2
+_STRING = 3
+_NUMBER = 4
+_NAME = 5
+_CHAR = 6
+
+# strings, comments and braces, used to find the end of a table without parsing it
+_SCAN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|--[^\n]*|[{}"]', re.DOTALL)
+
+_ESCAPE = re.compile(r'\\(.)', re.DOTALL)
+
+# boolean table keys, written as `[true]=`
+_BOOL_KEYS = {'true': True, 'false': False}
+
+
+def _string(s: str) -> str:
+    if '\\' in s:
+        return _ESCAPE.sub(r'\1', s)
+    return s
+
+
+def _number(s: str) -> Union[int, float]:
+    if len(s) < 16 and '.' not in s and 'e' not in s and 'E' not in s:
+        return int(s)
+    num = float(s)
+    if num.is_integer():
+        return int(num)
+    return num
+
+
+class Parser:
+    """Parses lua tables and variable assignments into python dicts.
+
+    The buffer is scanned token wise with compiled regular expressions,
+    strings and numbers are sliced directly out of the buffer.
+
+    Args:
+        buffer: lua source to parse
+        _globals: predefined variables that can be referenced in the source
+    """
+    def __init__(self, buffer: str, _globals: Optional[Dict[str, Any]] = None):
+        self.buffer: str = buffer
+        if _globals:
+            self.variables = _globals.copy()
+        else:
+            self.variables = {}
+        self.buflen: int = len(buffer)
+
+    def parse(self) -> Dict[str, Any]:
+        """Parses all statements in the buffer.
+
+        :return: dict of all assigned variables
+        """
+        buf = self.buffer
+        pos = 0
+        while True:
+            pos = _WS.match(buf, pos).end()
+            if pos >= self.buflen:
+                break
+
+            m = self.token(pos)
+            pos = m.end()
+            if m.lastindex != _NAME:
+                # a bare value ends the statement list
+                self.value(m)
+                break
+
+            name = m.group(_NAME)
+            if name == 'false' or name == 'true':
+                break
+            elif name == 'return':
+                break
+            elif name == 'local':
+                names, pos = self.namelist(pos)
+                if not names:
+                    raise self.syntax_error(name + " '" + self.char(pos) + "'", pos)
             else:
-                self.variables = {}
-
-            self._variable_assignment_queue: List[str] = []
+                names = [name]
 
-            self.buflen: int = len(buffer)
-            self.pos: int = 0
-            self.lineno: int = 1
+            pos = _WS.match(buf, pos).end()
+            if pos >= self.buflen or buf[pos] != '=':
+                raise self.syntax_error(names[-1] + " '" + self.char(pos) + "'", pos)
+            pos += 1
 
-        def parse(self):
-            self.eat_ws()
+            # value list
+            i = 0
+            while True:
+                val, pos = self.value(self.token(pos))
+                if i < len(names):
+                    self.variables[names[i]] = val
+                i += 1
 
-            c = self.buffer[self.pos]
+                pos = _WS.match(buf, pos).end()
+                if pos >= self.buflen or buf[pos] != ',':
+                    break
+                pos += 1
+
+        return self.variables
+
+    def namelist(self, pos: int) -> Tuple[List[str], int]:
+        names = []
+        while True:
+            m = _TOKEN.match(self.buffer, pos)
+            if m is None or m.lastindex != _NAME:
+                return names, pos
+            names.append(m.group(_NAME))
+            pos = _WS.match(self.buffer, m.end()).end()
+            if pos >= self.buflen or self.buffer[pos] != ',':
+                return names, pos
+            pos += 1
+
+    def token(self, pos: int):
+        m = _TOKEN.match(self.buffer, pos)
+        if m is None:
+            pos = _WS.match(self.buffer, pos).end()
+            if pos >= self.buflen:
+                raise self.eob_exception(pos)
+            raise self.syntax_error("Unexpected character '{char}'".format(char=self.buffer[pos]), pos)
+        return m
+
+    def value(self, m) -> Tuple[Any, int]:
+        """Returns the value of the given token and the position after it.
+
+        Tables and string functions consume further tokens.
+        """
+        g = m.lastindex
+        if g == _STRING:
+            return _string(m.group(g)), m.end()
+        elif g == _NUMBER:
+            return _number(m.group(g)), m.end()
+        elif g == _NAME:
+            name = m.group(g)
+            if name == 'true':
+                return True, m.end()
+            elif name == 'false':
+                return False, m.end()
+            elif name == '_':
+                return self.str_function(m.end())
+            elif name in self.variables:
+                return self.variables[name], m.end()
+            pos = _WS.match(self.buffer, m.end()).end()
+            raise self.syntax_error(name + " '" + self.char(pos) + "'", pos)
+        elif g == _CHAR:
+            c = m.group(g)
             if c == '{':
-                return self.object()
+                return self.table(m.end())
             elif c == '"':
-                return self.string()
-            elif c.isnumeric() or c == '-':
-                return self.number()
-            elif c == '_':
-                return self.str_function()
-            else:  # varname
-                self.eat_ws()
-
-                varname = self.eatvarname()
-                if varname == 'false' or varname == 'true':
-                    return varname == 'true'
-                elif varname == 'local':
-                    self.eat_ws()
-                    # push names for assignment into queue
-                    self.push_assigned_variable_names(self.eatvarnamelist())
-
-                elif varname == 'return':
-                    self.eat_ws()
-
-                    name = self.eatvarname()
-                    return {name: self.variables[name]}
-                elif varname in self.variables:
-                    # substitute value from variables
-                    return self.variables[varname]
-                else:
-                    # shortcut syntax without `local`
-                    self.push_assigned_variable_names([varname])
-
-                self.eat_ws()
-                if not self.eob() and self.buffer[self.pos] == '=':
-                    while True:
-                        # skip comma or whitespace
-                        self.advance()
-
-                        self.eat_ws()
-                        self.assign_local_variable(self.parse())
-
-                        if self.eob():
-                            return None
-
-                        self.eat_ws()
+                # unterminated string
+                raise self.eob_exception(self.buflen)
+        raise self.unexpected(m)
+
+    def str_function(self, pos: int) -> Tuple[str, int]:
+        m = self.expect(pos, '(')
+        m = self.token(m.end())
+        if m.lastindex != _STRING:
+            raise self.expected(m, '"')
+        s = _string(m.group(_STRING))
+        m = self.expect(m.end(), ')')
+        return s, m.end()
+
+    def expect(self, pos: int, char: str):
+        m = self.token(pos)
+        if m.lastindex != _CHAR or m.group(_CHAR) != char:
+            raise self.expected(m, char)
+        return m
+
+    def table(self, pos: int) -> Tuple[Dict[Union[int, str], Any], int]:
+        """Parses a table, pos points behind the opening curly brace."""
+        d = {}
+        inc_key = 1
+        match = _TOKEN.match
+        buf = self.buffer
+        while True:
+            m = match(buf, pos)
+            if m is None:
+                self.token(pos)
+            g = m.lastindex
+
+            if g == _KEY_STRING:
+                key = _string(m.group(g))
+                pos = m.end()
+                m = match(buf, pos)
+            elif g == _KEY_NUMBER:
+                key = _number(m.group(g))
+                pos = m.end()
+                m = match(buf, pos)
+            elif g == _CHAR and m.group(g) == '}':
+                return d, m.end()
+            elif g == _CHAR and m.group(g) == '[':
+                key, pos = self.key(m.end())
+                m = match(buf, pos)
+            else:
+                key = inc_key
+                inc_key += 1
+
+            if m is None:
+                self.token(pos)
+            g = m.lastindex
+            if g == _STRING:
+                d[key] = _string(m.group(g))
+                pos = m.end()
+            elif g == _NUMBER:
+                d[key] = _number(m.group(g))
+                pos = m.end()
+            elif g == _CHAR and m.group(g) == '{':
+                d[key], pos = self.table(m.end())
+            else:
+                d[key], pos = self.value(m)
+
+            m = match(buf, pos)
+            if m is None:
+                self.token(pos)
+            g = m.lastindex
+            if g == _CHAR:
+                c = m.group(g)
+                if c == ',':
+                    pos = m.end()
+                    continue
+                elif c == '}':
+                    return d, m.end()
+            raise self.unexpected(m)
+
+    def key(self, pos: int) -> Tuple[Union[int, str], int]:
+        """Parses a bracketed table key, pos points behind the opening bracket."""
+        m = self.token(pos)
+        g = m.lastindex
+        if g == _STRING:
+            key = _string(m.group(g))
+        elif g == _NUMBER:
+            key = _number(m.group(g))
+        elif g == _NAME and m.group(g) in _BOOL_KEYS:
+            key = _BOOL_KEYS[m.group(g)]
+        else:
+            raise self.unexpected(m)
+        m = self.expect(m.end(), ']')
+        m = self.expect(m.end(), '=')
+        return key, m.end()
+
+    def token_start(self, m) -> int:
+        return _WS.match(self.buffer, m.start()).end()
+
+    def unexpected(self, m) -> SyntaxError:
+        pos = self.token_start(m)
+        return self.syntax_error("Unexpected character '{char}'".format(char=self.buffer[pos]), pos)
+
+    def expected(self, m, char: str) -> SyntaxError:
+        pos = self.token_start(m)
+        return self.syntax_error("Expected character '{exp}', got '{char}'".format(exp=char, char=self.buffer[pos]), pos)
+
+    def char(self, pos: int) -> str:
+        if pos >= self.buflen:
+            return ''
+        return self.buffer[pos]
+
+    def lineno(self, pos: int) -> int:
+        return self.buffer.count('\n', 0, pos) + 1
+
+    def syntax_error(self, text: str, pos: int) -> SyntaxError:
+        se = SyntaxError()
+        se.lineno = self.lineno(pos)
+        se.offset = pos
+        se.text = text
+        return se
+
+    def eob_exception(self, pos: int) -> SyntaxError:
+        return self.syntax_error("Unexpected end of buffer", pos)
+
+
+def _python_loads(tablestr: str, _globals: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    return Parser(tablestr, _globals).parse()
+
+
+def _c_loads(tablestr: str, _globals: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    return _parse.loads(tablestr, dict(_globals) if _globals else {})
+
+
+# available parser backends, "c" is only present if the optional extension module was built
+backends: Dict[str, Callable[[str, Optional[Dict[str, Any]]], Dict[str, Any]]] = {"python": _python_loads}
+if _parse is not None:
+    backends["c"] = _c_loads
+
+
+def _default_backend() -> str:
+    name = os.environ.get("PYDCS_LUA_BACKEND")
+    if name:
+        if name in backends:
+            return name
+        print("WARNING: lua parser backend '{b}' is not available, using 'python'".format(b=name), file=sys.stderr)
+        return "python"
+    return "c" if "c" in backends else "python"
+
+
+default_backend = _default_backend()
+
+
+def loads(tablestr: str, _globals: Optional[Dict[str, Any]] = None, backend: Optional[str] = None) -> Dict[str, Any]:
+    """Parses lua variable assignments into a dict.
+
+    All backends return identical results and raise identical syntax errors.
+    The default backend is the C extension if it was built, otherwise the
+    pure python :class:`Parser`. It can be overridden with the ``PYDCS_LUA_BACKEND``
+    environment variable.
+
+    :param tablestr: lua source to parse
+    :param _globals: predefined variables that can be referenced in the source
+    :param backend: name of the parser backend from :data:`backends`, None for the default
+    :return: dict of all assigned variables
+    """
+    try:
+        parse = backends[backend or default_backend]
+    except KeyError:
+        raise ValueError("Unknown or unavailable lua parser backend '{b}'".format(b=backend))
+    return parse(tablestr, _globals)
+
+
+class StreamParser(Parser):
+    """Incrementally parses lua tables from a binary file object.
+
+    Only the currently needed part of the stream is held in memory,
+    tables below the requested depth are parsed one at a time and
+    skipped tables are never built.
+
+    Args:
+        fp: binary file object, e.g. opened from a zip file
+        _globals: predefined variables that can be referenced in the source
+        encoding: text encoding of the stream
+    """
+    chunk_size = 64 * 1024
+
+    def __init__(self, fp: BinaryIO, _globals: Optional[Dict[str, Any]] = None, encoding: str = 'utf-8'):
+        super().__init__('', _globals)
+        self.fp = fp
+        self.decoder = codecs.getincrementaldecoder(encoding)()
+        self.eof = False
+        self.pos = 0
+        self.base = 0
+        self.base_lineno = 1
+
+    def fill(self, keep: int) -> int:
+        """Drops the buffer before keep and appends the next chunk of the stream.
+
+        :return: the number of dropped characters, positions have to be shifted by it
+        """
+        if keep:
+            self.base_lineno += self.buffer.count('\n', 0, keep)
+            self.base += keep
+            self.buffer = self.buffer[keep:]
+            self.pos -= keep
+        # grow geometrically, so reading a large table stays linear
+        data = self.fp.read(max(self.chunk_size, self.buflen))
+        if data:
+            self.buffer += self.decoder.decode(data)
+        else:
+            self.buffer += self.decoder.decode(b'', True)
+            self.eof = True
+        self.buflen = len(self.buffer)
+        return keep
+
+    def token(self, pos: int):
+        """Returns the token at pos, reads ahead without dropping the buffer as needed.
+
+        Values like _("key") are parsed with several calls, their start has to stay in the buffer.
+        """
+        while not self.eof:
+            m = _TOKEN.match(self.buffer, pos)
+            # a token touching the end of buffer or an open string might be incomplete
+            if m is not None and m.end() < self.buflen and not (m.lastindex == _CHAR and m.group(_CHAR) == '"'):
+                return m
+            self.fill(0)
+        return super().token(pos)
+
+    def read_token(self):
+        """Returns the next token and moves the cursor behind it, reads ahead as needed."""
+        if not self.eof and self.buflen - self.pos < self.chunk_size:
+            self.fill(self.pos)
+        m = self.token(self.pos)
+        self.pos = m.end()
+        return m
+
+    def at_end(self) -> bool:
+        while True:
+            if not self.eof and self.buflen - self.pos < self.chunk_size:
+                self.fill(self.pos)
+            end = _WS.match(self.buffer, self.pos).end()
+            if end < self.buflen:
+                return False
+            if self.eof:
+                return True
+            self.fill(self.pos)
+
+    def table_end(self) -> int:
+        """Reads ahead until the table starting before the cursor is complete.
+
+        :return: position behind the closing curly brace
+        """
+        start = self.pos
+        pos = start
+        depth = 1
+        while True:
+            m = _SCAN.search(self.buffer, pos)
+            if m is None or m.group() == '"' or m.end() >= self.buflen:
+                if self.eof:
+                    if m is not None and m.group() == '}' and depth == 1:
+                        return m.end()
+                    raise self.eob_exception(self.buflen)
+                # rescan the last character, it might start a comment
+                pos = max(pos, self.buflen - 1) if m is None else m.start()
+                pos -= self.fill(start)
+                start = 0
+                continue
+            c = m.group()
+            if c == '{':
+                depth += 1
+            elif c == '}':
+                depth -= 1
+                if depth == 0:
+                    return m.end()
+            pos = m.end()
+
+    def iterparse(self, depth: int = 1, skip: Collection[Tuple] = ()) -> Iterator[Tuple[Tuple, Any]]:
+        """Yields (path, value) for all tables at depth and scalars above it.
+
+        The path starts with the assigned variable name followed by the table keys.
+
+        :param depth: length of the paths of the yielded tables
+        :param skip: paths of values that are skipped without building them
+        """
+        while not self.at_end():
+            m = self.read_token()
+            if m.lastindex != _NAME:
+                raise self.unexpected(m)
+
+            name = m.group(_NAME)
+            if name == 'return':
+                break
+            elif name == 'local':
+                names = []
+                while True:
+                    m = self.read_token()
+                    if m.lastindex != _NAME:
+                        raise self.unexpected(m)
+                    names.append(m.group(_NAME))
+                    m = self.read_token()
+                    if m.lastindex != _CHAR or m.group(_CHAR) != ',':
+                        break
+            else:
+                names = [name]
+                m = self.read_token()
 
-                        if self.eob():
-                            # file ended on variable declaration
-                            return None
-                        elif self.char() != ',':
-                            # value list ended
-                            break
+            if m.lastindex != _CHAR or m.group(_CHAR) != '=':
+                raise self.expected(m, '=')
 
-                    return self.parse()
-                else:
-                    se = SyntaxError()
-                    se.text = varname + " '" + self.buffer[self.pos] + "'"
-                    se.lineno = self.lineno
-                    se.offset = self.pos
-                    raise se
-
-        def str_function(self) -> str:
-            if self.buffer[self.pos] != '_':
-                se = SyntaxError()
-                se.lineno = self.lineno
-                se.offset = self.pos
-                se.text = "Expected character '_', got '{char}'".format(char=self.buffer[self.pos])
-                raise se
-
-            if self.advance():
-                raise self.eob_exception()
-
-            self.eat_ws()
-
-            if self.buffer[self.pos] != '(':
-                se = SyntaxError()
-                se.lineno = self.lineno
-                se.offset = self.pos
-                se.text = "Expected character '(', got '{char}'".format(char=self.buffer[self.pos])
-                raise se
-
-            self.advance()
-            self.eat_ws()
-
-            s = self.string()
-
-            self.eat_ws()
-
-            if self.buffer[self.pos] != ')':
-                se = SyntaxError()
-                se.lineno = self.lineno
-                se.offset = self.pos
-                se.text = "Expected character ')', got '{char}'".format(char=self.buffer[self.pos])
-                raise se
-
-            self.pos += 1
-            return s
-
-        def string(self) -> str:
-            if self.buffer[self.pos] != '"':
-                se = SyntaxError()
-                se.lineno = self.lineno
-                se.offset = self.pos
-                se.text = "Expected character '\"', got '{char}'".format(char=self.buffer[self.pos])
-                raise se
-
-            state = 0
-            s = ''
-            while state != 1:
-                if self.advance():
-                    raise self.eob_exception()
-
-                c = self.buffer[self.pos]
-                if state == 0:
-                    if c == '"':
-                        state = 1
-                        self.pos += 1
-                    elif c == '\\':
-                        state = 2
-                    else:
-                        s += c
-                elif state == 2:
-                    s += c
-                    state = 0
-            return s
-
-        def number(self) -> Union[int, float]:
-            n = ''
-            sign = 1
-            if self.buffer[self.pos] == '-':
-                sign = -1
-                if self.advance():
-                    raise self.eob_exception()
-
-            found_exponent, found_exponent_sign, found_separator = False, False, False
-            while not self.eob():
-                if self.buffer[self.pos].isnumeric():
-                    pass
-                elif self.buffer[self.pos] == '.':
-                    if not found_separator:
-                        found_separator = True
-                    else:
-                        raise SyntaxError()
-                elif self.buffer[self.pos].lower() == 'e':
-                    if not found_exponent:
-                        found_exponent = True
-                    else:
-                        raise SyntaxError()
-                elif self.buffer[self.pos] == '-':
-                    if not found_exponent_sign:
-                        found_exponent_sign = True
-                    else:
-                        raise SyntaxError()
-                else:
+            i = 0
+            while True:
+                path = (names[i] if i < len(names) else '',)
+                yield from self.walk(path, self.read_token(), depth, skip)
+                i += 1
+                if self.at_end() or self.buffer[_WS.match(self.buffer, self.pos).end()] != ',':
                     break
+                self.read_token()
 
-                n += self.buffer[self.pos]
-                self.pos += 1
-
-            num = float(n) * sign
-            if num.is_integer():
-                return int(num)
-            return num
-
-        def object(self) -> Dict[Union[int, str], Any]:
-            d = {}
-            if self.buffer[self.pos] != '{':
-                se = SyntaxError()
-                se.lineno = self.lineno
-                se.offset = self.pos
-                se.text = "Expected character '{', got '{char}'".format(char=self.buffer[self.pos])
-                raise se
-
-            if self.advance():
-                raise self.eob_exception()
-
-            self.eat_ws()
-
-            inc_key = 1
-            while self.buffer[self.pos] != '}':
-                self.eat_ws()
-
-                if self.buffer[self.pos] == '[':
-                    # key given
-                    if self.advance():
-                        raise self.eob_exception()
-
-                    self.eat_ws()
-                    if self.buffer[self.pos] == '"':
-                        key = self.string()
-                    else:
-                        key = self.number()
-
-                    if self.eob():
-                        raise self.eob_exception()
-
-                    self.eat_ws()
-
-                    if self.buffer[self.pos] != ']':
-                        se = SyntaxError()
-                        se.lineno = self.lineno
-                        se.offset = self.pos
-                        se.text = "Expected character ']', got '{char}'".format(char=self.buffer[self.pos])
-                        raise se
-
-                    if self.advance():
-                        raise self.eob_exception()
-
-                    self.eat_ws()
-
-                    if self.buffer[self.pos] != '=':
-                        se = SyntaxError()
-                        se.lineno = self.lineno
-                        se.offset = self.pos
-                        se.text = "Expected character '=', got '{char}'".format(char=self.buffer[self.pos])
-                        raise se
-
-                    if self.advance():
-                        raise self.eob_exception()
+    def walk(self, path: Tuple, m, depth: int, skip: Collection[Tuple]) -> Iterator[Tuple[Tuple, Any]]:
+        is_table = m.lastindex == _CHAR and m.group(_CHAR) == '{'
+        if path in skip:
+            if is_table:
+                self.pos = self.table_end()
+            else:
+                _, self.pos = self.value(m)
+            return
+
+        if not is_table:
+            value, self.pos = self.value(m)
+            yield path, value
+            return
+
+        if len(path) >= depth:
+            end = self.table_end()
+            value, self.pos = self.table(self.pos)
+            assert self.pos == end
+            yield path, value
+            return
+
+        inc_key = 1
+        empty = True
+        while True:
+            m = self.read_token()
+            g = m.lastindex
+            if g == _KEY_STRING:
+                key = _string(m.group(g))
+            elif g == _KEY_NUMBER:
+                key = _number(m.group(g))
+            elif g == _CHAR and m.group(g) == '}':
+                break
+            elif g == _CHAR and m.group(g) == '[':
+                m = self.read_token()
+                if m.lastindex == _STRING:
+                    key = _string(m.group(_STRING))
+                elif m.lastindex == _NUMBER:
+                    key = _number(m.group(_NUMBER))
+                elif m.lastindex == _NAME and m.group(_NAME) in _BOOL_KEYS:
+                    key = _BOOL_KEYS[m.group(_NAME)]
                 else:
-                    key = inc_key
-                    inc_key += 1
-
-                val = self.parse()
-
-                self.eat_ws()
-
-                d[key] = val
-                # print(key, ':', val)
+                    raise self.unexpected(m)
+                for c in ']=':
+                    m = self.read_token()
+                    if m.lastindex != _CHAR or m.group(_CHAR) != c:
+                        raise self.expected(m, c)
+            else:
+                key = inc_key
+                inc_key += 1
+                self.pos = m.start()
 
-                if self.eob():
-                    raise self.eob_exception()
+            empty = False
+            yield from self.walk(path + (key,), self.read_token(), depth, skip)
 
-                c = self.buffer[self.pos]
+            m = self.read_token()
+            if m.lastindex == _CHAR:
+                c = m.group(_CHAR)
                 if c == '}':
                     break
                 elif c == ',':
-                    if self.advance():
-                        raise self.eob_exception()
-                    self.eat_ws()
-                else:
-                    se = SyntaxError()
-                    se.lineno = self.lineno
-                    se.offset = self.pos
-                    se.text = "Unexpected character '{char}'".format(char=self.buffer[self.pos])
-                    raise se
+                    continue
+            raise self.unexpected(m)
 
-            self.pos += 1
+        if empty:
+            yield path, {}
 
-            return d
+    def lineno(self, pos: int) -> int:
+        return self.base_lineno + self.buffer.count('\n', 0, pos)
 
-        def push_assigned_variable_names(self, variable_names: List[str]):
-            self._variable_assignment_queue += variable_names
+    def syntax_error(self, text: str, pos: int) -> SyntaxError:
+        se = super().syntax_error(text, pos)
+        se.offset = self.base + pos
+        return se
 
-        def assign_local_variable(self, value):
-            self.variables[self._variable_assignment_queue.pop(0)] = value
 
-        def eatvarname(self) -> str:
-            varname = ''
-            while (not self.eob()) and (self.buffer[self.pos].isalnum() or self.buffer[self.pos] == '_'):
-                varname += self.buffer[self.pos]
-                self.pos += 1
+def iterparse(fp: BinaryIO,
+              depth: int = 1,
+              skip: Collection[Tuple] = (),
+              _globals: Optional[Dict[str, Any]] = None) -> Iterator[Tuple[Tuple, Any]]:
+    """Incrementally parses lua tables from a binary file object.
 
-            return varname
+    Yields (path, value) pairs, where path is the assigned variable name followed
+    by the table keys leading to value. Tables are yielded at the given depth,
+    scalars above it are yielded on their own.
 
-        def eatvarnamelist(self) -> List[str]:
-            varnames = []
-            while not self.eob():
-                self.eat_ws()
-                name = self.eatvarname()
-                if len(name) > 0:
-                    varnames.append(name)
-                self.eat_ws()
+    >>> with zipfile.ZipFile("my.miz") as miz, miz.open("mission") as f:
+    ...     for path, group in iterparse(f, depth=3, skip={("mission", "trig"), ("mission", "trigrules")}):
+    ...         pass
 
-                if self.char() == ',':
-                    self.advance()
-                else:
-                    break
-
-            return varnames
-
-        def eat_comment(self):
-            if (self.pos + 1 < self.buflen and
-                self.buffer[self.pos] == '-' and
-               self.buffer[self.pos + 1] == '-'):
-                while not self.eob() and self.buffer[self.pos] != '\n':
-                    self.pos += 1
-
-        def eat_ws(self):
-            """
-            Advances the internal buffer until it reaches a non comment or whitespace.
-            :return: None
-            """
-            self.eat_comment()
-            while True:
-                if self.pos >= self.buflen:
-                    return
-                c: str = self.buffer[self.pos]
-                if c == '\n':
-                    self.lineno += 1
-                if c == '-':
-                    self.eat_comment()
-                    c = self.buffer[self.pos]
-                if not c.isspace():
-                    return
-
-                self.pos += 1
-
-        def eob(self) -> bool:
-            """
-            Checks if we are at the end of buffer.
-
-            :return: True if end of buffer is reached, else False.
-            """
-            return self.pos >= self.buflen
-
-        def eob_exception(self):
-            se = SyntaxError()
-            se.lineno = self.lineno
-            se.offset = self.pos
-            se.text = "Unexpected end of buffer"
-            return se
-
-        def char(self):
-            return self.buffer[self.pos]
-
-        def advance(self) -> bool:
-            """
-            Advances the internal buffer position by 1 and checks if we are at the end of buffer.
-            :return: True if end of buffer is reached, else False.
-            """
-            self.pos += 1
-            return self.eob()
-
-    p = Parser(tablestr, _globals)
-    p.parse()
-    return p.variables
+    :param fp: binary file object
+    :param depth: number of path elements of the yielded tables, 1 yields whole variables like :func:`loads`
+    :param skip: paths of values which are skipped without building them
+    :param _globals: predefined variables that can be referenced in the source
+    """
+    return StreamParser(fp, _globals).iterparse(depth, set(skip))
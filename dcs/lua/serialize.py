@@ -1,44 +1,155 @@
-def dumps(value, varname=None, indent=None):
-    nl = "\n" if indent else ""
-    s = varname + '=' + nl if varname else ''
-    indentcount = 0 if indent is None else indent
+import array
+import io
+from typing import Any, Optional, TextIO, Callable, Iterable, Tuple, List
 
-    if isinstance(value, dict):
-        e = []
-        for key in sorted(value.keys(), key=str):
-            child = value[key]
-            KNL = "\n" if indent and isinstance(child, (dict, list)) else ""
-            selem = '\t' * indentcount
-            skey = key if isinstance(key, int) else '"{key}"'.format(key=key)
-            selem += '[{key}]={nl}'.format(key=skey, nl=KNL)
-            selem += dumps(value[key], indent=indent + 1 if indent else None)
-            e.append(selem)
-        s += '\t' * (indent-1) if nl else ""
-        s += "{"
-        if e:
-            s += nl + ",{nl}".format(nl=nl).join(e)
-        s += nl + '\t' * (indentcount-1) + "}"
-    elif isinstance(value, list):
-        e = []
-        i = 1
-        for v in value:
-            selem = '\t' * indentcount + "[{i}]=".format(i=i)
-            selem += dumps(v, indent=indent + 1 if indent else None)
-            e.append(selem)
-            i += 1
-        s += '\t' * (indent-1) if nl else ""
-        s += "{"
-        if e:
-            s += nl + ",{nl}".format(nl=nl).join(e)
-        s += nl + '\t' * (indentcount-1) + "}"
-    elif isinstance(value, str):
+# indentation strings per depth, deeper levels are created on demand
+_INDENT = ['\t' * i for i in range(32)]
+
+
+def _indent(depth: int) -> str:
+    while depth >= len(_INDENT):
+        _INDENT.append('\t' * len(_INDENT))
+    return _INDENT[depth]
+
+
+def _scalar(value) -> str:
+    if isinstance(value, str):
         v = value.replace('\\', '\\\\')
         v = v.replace('"', '\\"')
         v = v.replace('\n', '\\\n')
-        s += '"{val}"'.format(val=v)
+        return '"' + v + '"'
     elif isinstance(value, bool):
-        s += "true" if value else "false"
+        return "true" if value else "false"
+    return str(value)
+
+
+# python sequences, written as lua arrays
+_SEQUENCES = (list, tuple, array.array)
+_TABLES = (dict, list, tuple, array.array)
+
+# `[i]=` keys of array entries, longer arrays extend it on demand
+_INDEX = ['[' + str(i) + ']=' for i in range(256)]
+
+
+def _index(n: int) -> List[str]:
+    while n >= len(_INDEX):
+        _INDEX.append('[' + str(len(_INDEX)) + ']=')
+    return _INDEX
+
+
+def _key(key) -> str:
+    if isinstance(key, bool):
+        return '[true]=' if key else '[false]='
+    if isinstance(key, (int, float)):
+        return '[' + str(key) + ']='
+    return '["' + str(key) + '"]='
+
+
+def _sequence_items(values, n: int) -> Iterable[Tuple[str, Any]]:
+    return zip(_index(n)[1:n + 1], values)
+
+
+def _dict_items(value: dict, sort_keys: bool) -> Iterable[Tuple[str, Any]]:
+    n = len(value)
+    if (1 in value and n in value and all(map(value.__contains__, range(2, n)))
+            and all(type(k) is int for k in value)):
+        # dense 1-based array, like the units and route points of a group
+        return _sequence_items(map(value.__getitem__, range(1, n + 1)), n)
+    if sort_keys:
+        return ((_key(k), value[k]) for k in sorted(value.keys(), key=str))
+    return ((_key(k), v) for k, v in value.items())
+
+
+def _write_indented(value, write: Callable[[str], Any], depth: int, sort_keys: bool = True):
+    if isinstance(value, dict):
+        items = _dict_items(value, sort_keys)
+        nested_nl = True
+    elif isinstance(value, _SEQUENCES):
+        items = _sequence_items(value, len(value))
+        nested_nl = False
+    else:
+        write(_scalar(value))
+        return
+    _write_items(items, nested_nl, write, depth, sort_keys)
+
+
+def _write_items(items: Iterable[Tuple[str, Any]], nested_nl: bool, write: Callable[[str], Any], depth: int,
+                 sort_keys: bool = True):
+    outer = _indent(depth - 1)
+    inner = _indent(depth)
+    write(outer + '{')
+    sep = '\n'
+    for skey, child in items:
+        if isinstance(child, _TABLES):
+            write(sep + inner + skey + '\n' if nested_nl else sep + inner + skey)
+            _write_indented(child, write, depth + 1, sort_keys)
+        else:
+            write(sep + inner + skey + _scalar(child))
+        sep = ',\n'
+    write('\n' + outer + '}')
+
+
+def _write_compact(value, write: Callable[[str], Any], sort_keys: bool = True):
+    if isinstance(value, dict):
+        items = _dict_items(value, sort_keys)
+    elif isinstance(value, _SEQUENCES):
+        items = _sequence_items(value, len(value))
+    else:
+        write(_scalar(value))
+        return
+
+    write('{')
+    sep = ''
+    for skey, child in items:
+        write(sep + skey)
+        _write_compact(child, write, sort_keys)
+        sep = ','
+    write('}')
+
+
+def dump(value, fp: TextIO, varname: Optional[str] = None, indent: Optional[int] = None, sort_keys: bool = True):
+    """Writes value as lua table to a text file object.
+
+    The output is written piece by piece, no intermediate strings are built for nested tables.
+
+    :param value: value to serialize
+    :param fp: text file object to write to
+    :param varname: if set, the value is assigned to this variable name
+    :param indent: indentation depth of value, None for compact output
+    :param sort_keys: sort the keys of all dicts by their string representation,
+        if False they are written in insertion order, which is faster and still
+        reproducible for dicts built in a deterministic order
+    """
+    write = fp.write
+    if varname:
+        write(varname + '=' + ('\n' if indent else ''))
+    if indent:
+        _write_indented(value, write, indent, sort_keys)
     else:
-        s += str(value)
+        _write_compact(value, write, sort_keys)
+
+
+def dump_table(items: Iterable[Tuple[Any, Any]], fp: TextIO, varname: Optional[str] = None, indent: int = 1,
+               sort_keys: bool = True):
+    """Writes a lua table from (key, value) pairs to a text file object.
+
+    The pairs are written in the given order, so the caller is responsible
+    to keep them sorted like :func:`dump` would. As items may be a generator,
+    large tables can be written without ever holding all values in memory.
+
+    :param items: iterable of (key, value) pairs
+    :param fp: text file object to write to
+    :param varname: if set, the table is assigned to this variable name
+    :param indent: indentation depth of the table
+    :param sort_keys: sort the keys of nested dicts, see :func:`dump`
+    """
+    write = fp.write
+    if varname:
+        write(varname + '=\n')
+    _write_items(((_key(k), v) for k, v in items), True, write, indent, sort_keys)
+
 
-    return s
+def dumps(value, varname=None, indent=None, sort_keys=True):
+    s = io.StringIO()
+    dump(value, s, varname, indent, sort_keys)
+    return s.getvalue()
@@ -0,0 +1,68 @@
+import io
+import tempfile
+import unittest
+import zipfile
+from dcs.lua.cache import ParseCache
+
+
+class TestParseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.zipdata = io.BytesIO()
+        with zipfile.ZipFile(self.zipdata, 'w', zipfile.ZIP_DEFLATED) as z:
+            z.writestr("a", 'a = { ["x"] = { 1, 2 } }')
+            z.writestr("b", 'b = { ["y"] = "z" }')
+            z.writestr("c", 'a = { ["x"] = { 1, 2 } }')
+
+    def check(self, cache):
+        with zipfile.ZipFile(self.zipdata) as z:
+            r = cache.loads(z, "a")
+            self.assertEqual(r, {"a": {"x": {1: 1, 2: 2}}})
+            r["a"]["x"][1] = 5
+            self.assertEqual(cache.loads(z, "a"), {"a": {"x": {1: 1, 2: 2}}})
+            self.assertEqual(cache.loads(z, "b"), {"b": {"y": "z"}})
+            # same content under another name is a hit
+            self.assertEqual(cache.loads(z, "c"), {"a": {"x": {1: 1, 2: 2}}})
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+        self.assertEqual(len(cache), 2)
+
+    def test_memory(self):
+        self.check(ParseCache())
+
+    def test_lru(self):
+        cache = ParseCache(maxsize=1)
+        with zipfile.ZipFile(self.zipdata) as z:
+            cache.loads(z, "a")
+            cache.loads(z, "b")
+            cache.loads(z, "a")
+        self.assertEqual((cache.hits, cache.misses), (0, 3))
+        self.assertEqual(len(cache), 1)
+
+    def test_loads_many(self):
+        cache = ParseCache()
+        parsed = []
+
+        def parse(names):
+            parsed.append(list(names))
+            return ((x, {"name": x}) for x in names)
+
+        with zipfile.ZipFile(self.zipdata) as z:
+            cache.loads(z, "a")
+            r = cache.loads_many(z, ["a", "b"], parse)
+            self.assertEqual(r, {"a": {"a": {"x": {1: 1, 2: 2}}}, "b": {"name": "b"}})
+            self.assertEqual(cache.loads_many(z, ["b", "c"], parse), {"b": {"name": "b"}, "c": r["a"]})
+        self.assertEqual(parsed, [["b"], []])
+
+    def test_directory(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.check(ParseCache(directory=tmpdir))
+            cache = ParseCache(directory=tmpdir)
+            with zipfile.ZipFile(self.zipdata) as z:
+                cache.loads(z, "b")
+            self.assertEqual(cache.hits, 1)
+            cache.clear()
+            self.assertEqual(len(cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
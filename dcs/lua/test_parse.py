@@ -1,28 +1,36 @@
+import glob
+import io
+import os
 import unittest
-from dcs.lua.parse import loads
+import zipfile
+from dcs.lua.parse import loads, iterparse, StreamParser, backends
 
 
 class TestLuaParse(unittest.TestCase):
+    backend = "python"
+
+    def loads(self, tablestr, _globals=None):
+        return loads(tablestr, _globals, backend=self.backend)
 
     def test_integer(self):
-        r = loads("int = 3")
+        r = self.loads("int = 3")
         self.assertEqual(r, {"int": 3})
 
-        r = loads("int = 193984")
+        r = self.loads("int = 193984")
         self.assertEqual(r, {"int": 193984})
 
-        r = loads("int = -23")
+        r = self.loads("int = -23")
         self.assertEqual(r, {"int": -23})
 
     def test_decimal(self):
-        r = loads("dec = 666.6")
+        r = self.loads("dec = 666.6")
         self.assertEqual(r, {"dec": 666.6})
 
     def test_exponent(self):
-        r = loads("dec = 666.6e10")
+        r = self.loads("dec = 666.6e10")
         self.assertEqual(r, {"dec": 666.6e10})
 
-        r = loads("dec = 666.6e-10")
+        r = self.loads("dec = 666.6e-10")
         self.assertEqual(r, {"dec": 666.6e-10})
 
     def test_string(self):
@@ -42,9 +50,9 @@ mission =
     }
 }
 """
-        r = loads(s)
+        r = self.loads(s)
 
-        r = loads('x = "a_do_script_file(getValueResourceByKey(\\"ResKey_Action_62\\")); mission.trig.func[1]=nil;"')
+        r = self.loads('x = "a_do_script_file(getValueResourceByKey(\\"ResKey_Action_62\\")); mission.trig.func[1]=nil;"')
         self.assertEqual(r, {
             "x": "a_do_script_file(getValueResourceByKey(\"ResKey_Action_62\")); mission.trig.func[1]=nil;"})
 
@@ -74,7 +82,7 @@ mission=
             'descriptionBlueTask': 'DictKey_descriptionBlueTask_3',
             'trig': {},
             'maxDictId': 18.0}}
-        r = loads(luas)
+        r = self.loads(luas)
         self.assertEqual(r, ref)
 
     def test_dictmix(self):
@@ -98,19 +106,59 @@ o =
                 "name": "Enfield11"
             }
         }}
-        r = loads(luas)
+        r = self.loads(luas)
         self.assertEqual(r, ref)
 
+    def test_bool_keys(self):
+        r = self.loads('o = {[true]=1, [ false ] = {[1.5]="x"}}')
+        self.assertEqual(r, {"o": {True: 1, False: {1.5: "x"}}})
+        self.assertEqual(type(next(iter(r["o"]))), bool)
+
     def test_syntaxerr(self):
         with self.assertRaises(SyntaxError):
-            loads("""m=
+            self.loads("""m=
             {
                 ["x"] 12
             }""")
 
+    def test_syntaxerr_position(self):
+        with self.assertRaises(SyntaxError) as cm:
+            self.loads('m=\n{\n ["x"] 12\n}')
+        self.assertEqual(cm.exception.lineno, 3)
+        self.assertEqual(cm.exception.offset, 12)
+        self.assertEqual(cm.exception.text, "Expected character '=', got '1'")
+
+        with self.assertRaises(SyntaxError) as cm:
+            self.loads('x = {["a"] = 1 ["b"] = 2}')
+        self.assertEqual(cm.exception.lineno, 1)
+        self.assertEqual(cm.exception.offset, 15)
+
+    def test_unterminated_string(self):
+        with self.assertRaises(SyntaxError) as cm:
+            self.loads('x = "abc')
+        self.assertEqual(cm.exception.text, "Unexpected end of buffer")
+
+    def test_escapes_and_comments(self):
+        luas = """
+x = { -- start of x
+    [ "a" ] -- key comment
+    = "line1\\
+line2",
+    ["b"] = "quote \\" and backslash \\\\",
+    [3] = _("translated"),
+    true, false,
+} -- end of x"""
+        r = self.loads(luas)
+        self.assertEqual(r, {"x": {
+            "a": "line1\nline2",
+            "b": "quote \" and backslash \\",
+            3: "translated",
+            1: True,
+            2: False}})
+
     def test_missing_curly(self):
         with self.assertRaises(SyntaxError):
-            loads("""t=
+            self.loads("""t=
             {
                 ["payload"] = {
                     ["num"] = 1
@@ -148,7 +196,7 @@ local unitPayloads = {
                 }
             }
         }}
-        r = loads(luas)
+        r = self.loads(luas)
         self.assertEqual(r, ref)
 
     def test_mixed_objects(self):
@@ -161,7 +209,7 @@ o = {
 """
 
         ref = {'o': {1: "x", "a": 2, 2: "y"}}
-        r = loads(luas)
+        r = self.loads(luas)
         self.assertEqual(r, ref)
 
     def test_payload_var_ref(self):
@@ -234,7 +282,7 @@ local unitPayloads = {
 }
 return unitPayloads
 """
-        r = loads(luas, {'Intercept': 'Intercept', 'CAP': 'CAP', 'Escort': 'Escort', 'FighterSweep': 'FighterSweep'})
+        r = self.loads(luas, {'Intercept': 'Intercept', 'CAP': 'CAP', 'Escort': 'Escort', 'FighterSweep': 'FighterSweep'})
         self.assertEqual(r['unitPayloads']['name'], 'F-14B')
         self.assertEqual(r['unitPayloads']['payloads'][1]['name'], "XT*2")
         self.assertEqual(r['unitPayloads']['payloads'][1]['pylons'][1]['num'], 8)
@@ -242,5 +290,141 @@ return unitPayloads
         self.assertEqual(r['unitPayloads']['payloads'][2]['tasks'][1], "Intercept")
 
 
+class TestLuaIterParse(unittest.TestCase):
+    luas = """
+mission =
+{
+    ["trig"] =
+    {
+        ["actions"] =
+        {
+            [1] = "a_do_script(\\"x\\")",
+        }, -- end of ["actions"]
+    }, -- end of ["trig"]
+    ["coalition"] =
+    {
+        ["blue"] =
+        {
+            ["bullseye"] = { ["x"] = 1.5, ["y"] = -2 },
+            ["country"] = {},
+        }, -- end of ["blue"]
+        ["red"] = {
+            { ["name"] = "Russia" },
+        },
+    },
+    ["version"] = 16,
+    ["sortie"] = _("DictKey_sortie_5"),
+} -- end of mission
+options = { ["playerName"] = "PyDCS" }
+"""
+
+    def parse(self, depth, skip=(), chunk_size=StreamParser.chunk_size):
+        parser = StreamParser(io.BytesIO(self.luas.encode()))
+        parser.chunk_size = chunk_size
+        return list(parser.iterparse(depth, skip))
+
+    def test_depth_one_equals_loads(self):
+        ref = loads(self.luas)
+        for chunk_size in [1, 3, 16, 64 * 1024]:
+            self.assertEqual(dict((p[0], v) for p, v in self.parse(1, chunk_size=chunk_size)), ref)
+
+    def test_paths(self):
+        for chunk_size in [1, 5, 64 * 1024]:
+            r = self.parse(3, chunk_size=chunk_size)
+            self.assertEqual(r, [
+                (("mission", "trig", "actions"), {1: 'a_do_script("x")'}),
+                (("mission", "coalition", "blue"), {"bullseye": {"x": 1.5, "y": -2}, "country": {}}),
+                (("mission", "coalition", "red"), {1: {"name": "Russia"}}),
+                (("mission", "version"), 16),
+                (("mission", "sortie"), "DictKey_sortie_5"),
+                (("options", "playerName"), "PyDCS")
+            ])
+
+    def test_skip(self):
+        r = self.parse(2, skip={("mission", "trig"), ("mission", "coalition")})
+        self.assertEqual([p for p, v in r], [("mission", "version"), ("mission", "sortie"), ("options", "playerName")])
+
+    def test_skip_scalars(self):
+        r = self.parse(2, skip={("mission", "version"), ("mission", "sortie")})
+        self.assertEqual([p for p, v in r][-2:], [("mission", "coalition"), ("options", "playerName")])
+
+    def test_values_across_chunks(self):
+        long = "x" * 40
+        luas = 'm = { ["a"] = _("' + long + '"), ["b"] = "' + long + '", [3] = _( "' + long + '" ) }\n'
+        for chunk_size in [1, 2, 3, 7, 16]:
+            parser = StreamParser(io.BytesIO(luas.encode()))
+            parser.chunk_size = chunk_size
+            self.assertEqual(list(parser.iterparse(2)), [(("m", "a"), long), (("m", "b"), long), (("m", 3), long)])
+
+            parser = StreamParser(io.BytesIO(luas.encode()))
+            parser.chunk_size = chunk_size
+            self.assertEqual(list(parser.iterparse(2, skip={("m", "a"), ("m", 3)})), [(("m", "b"), long)])
+
+    def test_iterparse_syntaxerr(self):
+        with self.assertRaises(SyntaxError):
+            list(iterparse(io.BytesIO(b'm = { ["x"] = { [1] = 2 }')))
+
+
+@unittest.skipUnless("c" in backends, "C parser extension not built")
+class TestLuaParseC(TestLuaParse):
+    backend = "c"
+
+
+class TestLuaBackendConformance(unittest.TestCase):
+    def assertSameTables(self, a, b):
+        self.assertEqual(a, b)
+        # keys have to match in order and type, 1 and 1.0 compare equal
+        if isinstance(a, dict):
+            self.assertEqual([(k, type(k)) for k in a], [(k, type(k)) for k in b])
+            for k in a:
+                self.assertSameTables(a[k], b[k])
+        else:
+            self.assertIs(type(a), type(b))
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            loads("x = 1", backend="fortran")
+
+    def test_missions(self):
+        testdir = os.path.join(os.path.dirname(__file__), "..", "..", "tests")
+        files = glob.glob(os.path.join(testdir, "*.miz")) + glob.glob(os.path.join(testdir, "missions", "*.miz"))
+        self.assertTrue(files)
+        for filename in files:
+            with zipfile.ZipFile(filename) as miz:
+                for member in ["mission", "options", "warehouses", "l10n/DEFAULT/dictionary"]:
+                    if member not in miz.namelist():
+                        continue
+                    luas = miz.read(member).decode("utf-8")
+                    ref = loads(luas, backend="python")
+                    for backend in backends:
+                        with self.subTest(miz=os.path.basename(filename), member=member, backend=backend):
+                            self.assertSameTables(loads(luas, backend=backend), ref)
+
+    def test_deep_nesting(self):
+        luas = "x = " + "{" * 50 + "}" * 50
+        ref = loads(luas, backend="python")
+        for backend in backends:
+            with self.subTest(backend=backend):
+                self.assertSameTables(loads(luas, backend=backend), ref)
+
+        luas = "x = " + "{" * 200000 + "}" * 200000
+        for backend in backends:
+            with self.subTest(backend=backend), self.assertRaises(RecursionError):
+                loads(luas, backend=backend)
+
+    def test_errors(self):
+        cases = ['x = "abc', 'x = {["a"] = 1 ["b"] = 2}', 'm=\n{\n ["x"] 12\n}', 'local = 3', 'x = y',
+                 'x = _(1)', 'x = { [{}] = 1 }', 'x = -', 'x = { 1, 2', 'x = { -- }']
+        for luas in cases:
+            with self.assertRaises(SyntaxError) as cm:
+                loads(luas, backend="python")
+            ref = cm.exception
+            for backend in backends:
+                with self.subTest(luas=luas, backend=backend), self.assertRaises(SyntaxError) as cm:
+                    loads(luas, backend=backend)
+                self.assertEqual((cm.exception.text, cm.exception.lineno, cm.exception.offset),
+                                 (ref.text, ref.lineno, ref.offset))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,83 @@
+import array
+import io
+import unittest
+from dcs.lua.parse import loads
+from dcs.lua.serialize import dump, dump_table, dumps
+
+
+class TestLuaSerialize(unittest.TestCase):
+
+    def test_compact(self):
+        self.assertEqual(dumps({"b": 1, "a": "x", 1: True}), '{[1]=true,["a"]="x",["b"]=1}')
+        self.assertEqual(dumps([1.5, {}], "t"), 't={[1]=1.5,[2]={}}')
+
+    def test_indented(self):
+        s = dumps({"a": {1: 2}, "b": [3, {"c": False}], "d": {}}, "o", 1)
+        self.assertEqual(s, 'o=\n'
+                            '{\n'
+                            '\t["a"]=\n'
+                            '\t{\n'
+                            '\t\t[1]=2\n'
+                            '\t},\n'
+                            '\t["b"]=\n'
+                            '\t{\n'
+                            '\t\t[1]=3,\n'
+                            '\t\t[2]=\t\t{\n'
+                            '\t\t\t["c"]=false\n'
+                            '\t\t}\n'
+                            '\t},\n'
+                            '\t["d"]=\n'
+                            '\t{\n'
+                            '\t}\n'
+                            '}')
+
+    def test_string_escape(self):
+        s = 'quote " backslash \\ newline \n end'
+        self.assertEqual(loads(dumps(s, "x")), {"x": s})
+
+    def test_dump_equals_dumps(self):
+        d = {"mission": {"x": [1, 2, {"y": "z"}], 5: {6: 7.25}}}
+        fp = io.StringIO()
+        dump(d, fp, "m", 1)
+        self.assertEqual(fp.getvalue(), dumps(d, "m", 1))
+        self.assertEqual(loads(fp.getvalue()), {"m": {"mission": {"x": {1: 1, 2: 2, 3: {"y": "z"}}, 5: {6: 7.25}}}})
+
+    def test_dump_table(self):
+        d = {"a": [1], "b": {"c": "d"}, 1: 2}
+        fp = io.StringIO()
+        dump_table(((k, d[k]) for k in sorted(d, key=str)), fp, "m", 1)
+        self.assertEqual(fp.getvalue(), dumps(d, "m", 1))
+
+    def test_sort_keys(self):
+        d = {"b": {10: "x", 2: "y", 1: True}, "a": [1, {"z": 1, "c": 2}], 3: 4.5}
+        self.assertEqual(dumps(d, sort_keys=False), '{["b"]={[10]="x",[2]="y",[1]=true},["a"]={[1]=1,[2]={["z"]=1,["c"]=2}},[3]=4.5}')
+        self.assertEqual(dumps(d), '{[3]=4.5,["a"]={[1]=1,[2]={["c"]=2,["z"]=1}},["b"]={[1]=true,[10]="x",[2]="y"}}')
+        for indent in [None, 1]:
+            self.assertEqual(loads(dumps(d, "m", indent, sort_keys=False)), loads(dumps(d, "m", indent)))
+
+    def test_sequences(self):
+        ref = '{[1]=1,[2]=2,[3]=3}'
+        self.assertEqual(dumps([1, 2, 3]), ref)
+        self.assertEqual(dumps((1, 2, 3)), ref)
+        self.assertEqual(dumps(array.array('i', [1, 2, 3])), ref)
+        self.assertEqual(dumps({3: 3, 1: 1, 2: 2}), ref)
+        self.assertEqual(dumps(array.array('d', [0.5, 2.25])), '{[1]=0.5,[2]=2.25}')
+
+        # dense arrays are written in index order, other tables sorted by key
+        d = {i: i for i in range(1, 12)}
+        self.assertEqual(dumps(d), '{' + ','.join('[{i}]={i}'.format(i=i) for i in range(1, 12)) + '}')
+        self.assertEqual(dumps({1: 1, 2: 2, 10: 10}), '{[1]=1,[10]=10,[2]=2}')
+        self.assertEqual(dumps({1: "a", "1": "b"}), '{[1]="a",["1"]="b"}')
+        self.assertEqual(loads(dumps({"a": array.array('i', [4, 5])}, "x", 1)), {"x": {"a": {1: 4, 2: 5}}})
+
+    def test_key_types(self):
+        # bool and float keys compare equal to ints, they must not be taken for array indices
+        self.assertEqual(dumps({True: "a"}), '{[true]="a"}')
+        self.assertEqual(dumps({1.0: "a", 2: "b"}), '{[1.0]="a",[2]="b"}')
+        for d in [{True: "a", 1.5: "b"}, {True: 1}, {False: 0, 1: 1}, {1: "a", 2.5: "b"}]:
+            for indent in [None, 1]:
+                self.assertEqual(loads(dumps(d, "m", indent)), {"m": d})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,8 @@
+import heapq
 import math
 import random
 import copy
-from typing import List, Tuple, Union
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
 
 
 def point_from_heading(_x, _y, heading, distance):
@@ -347,3 +348,115 @@ class Polygon:
 
     def __repr__(self):
         return "Polygon([{points}])".format(points=", ".join(map(repr, self.points)))
+
+
+def _position(item) -> Point:
+    return item.position
+
+
+class KDTree:
+    """2d tree for nearest, radius and rectangle queries on items with a position.
+
+    The tree is not updated, it has to be built again if items are added or moved.
+    Query results with equal distance are ordered like the items given to the tree.
+
+    Args:
+        items: items to index
+        position: function returning the Point of an item, default is the position attribute
+    """
+    def __init__(self, items: Iterable[Any], position: Callable[[Any], Point] = None):
+        if position is None:
+            position = _position
+        self._position = position
+        entries = []
+        for i, item in enumerate(items):
+            p = position(item)
+            entries.append((p.x, p.y, i, item))
+        self._size = len(entries)
+        self._root = self._build(entries, 0)
+
+    @staticmethod
+    def _build(entries, depth):
+        # node tuples: x, y, index, item, axis, left, right
+        if not entries:
+            return None
+        axis = depth % 2
+        entries.sort(key=lambda e: (e[axis], e[2]))
+        median = len(entries) // 2
+        x, y, index, item = entries[median]
+        return (x, y, index, item, axis,
+                KDTree._build(entries[:median], depth + 1), KDTree._build(entries[median + 1:], depth + 1))
+
+    def nearest(self, point: Point) -> Optional[Any]:
+        """Returns the nearest item to point or None if the tree is empty."""
+        items = self.k_nearest(point, 1)
+        return items[0] if items else None
+
+    def k_nearest(self, point: Point, k: int) -> List[Any]:
+        """Returns the k nearest items to point, ordered by distance."""
+        best = []  # heap of (-distance, -index, item), the root is the farthest of the found items
+        px, py = point.x, point.y
+
+        def search(node):
+            x, y, index, item, axis, left, right = node
+            entry = (-math.hypot(x - px, y - py), -index, item)
+            if len(best) < k:
+                heapq.heappush(best, entry)
+            elif entry[:2] > best[0][:2]:
+                heapq.heapreplace(best, entry)
+
+            diff = px - x if axis == 0 else py - y
+            near, far = (left, right) if diff < 0 else (right, left)
+            if near is not None:
+                search(near)
+            if far is not None and (len(best) < k or abs(diff) <= -best[0][0]):
+                search(far)
+
+        if self._root is not None and k > 0:
+            search(self._root)
+        return [x[2] for x in sorted(best, key=lambda e: e[:2], reverse=True)]
+
+    def within_distance(self, point: Point, distance: float) -> List[Any]:
+        """Returns all items closer than distance to point."""
+        found = []
+        px, py = point.x, point.y
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            x, y, index, item, axis, left, right = node
+            if math.hypot(x - px, y - py) < distance:
+                found.append((index, item))
+            diff = px - x if axis == 0 else py - y
+            if diff < distance:
+                stack.append(left)
+            if -diff < distance:
+                stack.append(right)
+        return [x[1] for x in sorted(found, key=lambda e: e[0])]
+
+    def within_rectangle(self, rect: Rectangle) -> List[Any]:
+        """Returns all items within the rectangle, borders included."""
+        found = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            x, y, index, item, axis, left, right = node
+            if rect.bottom <= x <= rect.top and rect.left <= y <= rect.right:
+                found.append((index, item))
+            low, high, split = (rect.bottom, rect.top, x) if axis == 0 else (rect.left, rect.right, y)
+            if low <= split:
+                stack.append(left)
+            if high >= split:
+                stack.append(right)
+        return [x[1] for x in sorted(found, key=lambda e: e[0])]
+
+    def within_polygon(self, polygon: Polygon) -> List[Any]:
+        """Returns all items within the polygon, only items in its bounding rectangle are tested."""
+        return [x for x in self.within_rectangle(polygon.outbound_rectangle())
+                if polygon.point_in_poly(self._position(x))]
+
+    def __len__(self):
+        return self._size
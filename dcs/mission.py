@@ -1,26 +1,30 @@
 """
 The mission module is the entry point to all pydcs functions.
 """
+import concurrent.futures
 import copy
+import io
 import os
+import struct
 import sys
 import tempfile
+import time
+import traceback
 import zipfile
+import zlib
 import random
+import shutil
 from collections import defaultdict
 from datetime import datetime, timezone, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import List, Dict, Union, Optional, Type
+from typing import List, Dict, Union, Optional, Type, Any, Iterable, Tuple, Callable, Iterator, TYPE_CHECKING
 
 from dcs.coalition import Coalition
 from dcs.terrain.terrain import Warehouses
 from dcs.triggers import Triggers
-import dcs.countries as countries
-import dcs.helicopters as helicopters
 import dcs.lua as lua
 import dcs.mapping as mapping
-import dcs.planes as planes
 import dcs.task as task
 import dcs.unitgroup as unitgroup
 import dcs.unittype as unittype
@@ -39,6 +43,19 @@ from dcs.translation import Translation, String, ResourceKey
 from dcs.unit import Unit, Ship, Vehicle, Static
 from dcs.flyingunit import Plane, Helicopter
 
+if TYPE_CHECKING:
+    import dcs.helicopters as helicopters
+    import dcs.planes as planes
+
+
+def _load_lua_file(miz: Union[str, zipfile.ZipFile], name: str) -> Dict[str, Any]:
+    # module level, so it can be run on a process pool
+    if not isinstance(miz, zipfile.ZipFile):
+        with zipfile.ZipFile(miz, 'r') as mizfile:
+            return _load_lua_file(mizfile, name)
+    with miz.open(name) as mfile:
+        return lua.loads(mfile.read().decode())
+
 
 class StartType(Enum):
     """Enum class for start types."""
@@ -91,6 +108,9 @@ class Mission:
     """
     _COUNTRY_IDS = {x for x in range(0, 13)} | {x for x in range(15, 47)}
 
+    # optional lua.ParseCache used by load_file and reload, can be set per class or per instance
+    parse_cache = None  # type: Optional[lua.ParseCache]
+
     def __init__(self, terrain: Union[
             terrain_.Caucasus,
             terrain_.Nevada,
@@ -102,6 +122,11 @@ class Mission:
         if terrain is None:
             terrain = terrain_.Caucasus()
 
+        # raw data of sections that are decoded on first access, see load_file
+        self._lazy_sections = {}  # type: Dict[str, Any]
+        # lua files of the loaded archive, copied on save if they did not change
+        self._loaded_files = {}  # type: Dict[str, ZipResource]
+
         self.current_unit_id = 0
         self.current_group_id = 0
         self.current_dict_id = 0
@@ -132,6 +157,9 @@ class Mission:
         self.options = Options()
         self.warehouses = Warehouses(self.terrain)
         self.goals = Goals()
+
+        # first use of the unit databases, they are not loaded by import dcs
+        from dcs import countries
         blue = Coalition("blue")
         blue.add_country(countries.Australia())
         blue.add_country(countries.Belgium())
@@ -218,13 +246,24 @@ class Mission:
 
         self.aircraft_kneeboards: Dict[unittype.FlyingType, List[Path]] = defaultdict(list)
 
-    def load_file(self, filename: str, bypass_triggers: bool = False):
+    def load_file(self, filename: str, bypass_triggers: bool = False, lazy: bool = False,
+                  executor: Optional[concurrent.futures.Executor] = None):
         """Load a mission file (.miz) file, replacing all current data.
 
+        If :attr:`parse_cache` is set, unchanged lua members are taken from the cache
+        instead of being parsed again.
+
         Args:
             filename: path to the mission(.miz) file.
             bypass_triggers: do not parse triggers, if a mission is loaded this way
                              the same triggers will be exported on save.
+            lazy: decode the coalitions, triggers and warehouses only when they are
+                  first accessed, untouched sections are exported unchanged on save.
+                  Accessing the terrain decodes coalitions and warehouses,
+                  as they set up airport and parking state.
+            executor: if set, the lua files of the mission are decompressed and parsed
+                      concurrently on this thread or process pool.
+
         Returns:
             bool: True if everything loaded correctly
 
@@ -235,31 +274,34 @@ class Mission:
         self.current_unit_id = 0
         self.current_group_id = 0
         self.current_dict_id = 0
+        self._lazy_sections = {}
         mission_dict = {}
         options_dict = {}
         warehouse_dict = {}
+        warehouse_data = None
         dictionary_dict = {}
 
-        def loaddict(fname, mizfile, reserved_files):
-            reserved_files.append(fname)
-            with mizfile.open(fname) as mfile:
-                data = mfile.read()
-                data = data.decode()
-                return lua.loads(data)
-
         with zipfile.ZipFile(filename, 'r') as miz:
-            reserved_files = []
-            mission_dict = loaddict('mission', miz, reserved_files)
-
+            reserved_files = ['mission', 'options', 'warehouses', 'l10n/DEFAULT/dictionary']
+            has_map_resource = 'l10n/DEFAULT/mapResource' in miz.namelist()
+            if has_map_resource:
+                reserved_files.append('l10n/DEFAULT/mapResource')
+            lua_files = [x for x in reserved_files if not (lazy and x == 'warehouses')]
+            lua_dicts = self._load_lua_files(filename, miz, lua_files, executor)
+            self._loaded_files = {x: ZipResource(filename, miz.getinfo(x)) for x in reserved_files if x != 'mission'}
+
+            mission_dict = lua_dicts['mission']
             if mission_dict["mission"]["version"] < 16:
                 print("Mission file is using an old format, be aware!", file=sys.stderr)
-            options_dict = loaddict('options', miz, reserved_files)
-            warehouse_dict = loaddict('warehouses', miz, reserved_files)
-            dictionary_dict = loaddict('l10n/DEFAULT/dictionary', miz, reserved_files)
+            options_dict = lua_dicts['options']
+            if lazy:
+                warehouse_data = miz.read('warehouses')
+            else:
+                warehouse_dict = lua_dicts['warehouses']
+            dictionary_dict = lua_dicts['l10n/DEFAULT/dictionary']
 
-            if 'l10n/DEFAULT/mapResource' in miz.namelist():
-                mapresource_dict = loaddict('l10n/DEFAULT/mapResource', miz, reserved_files)
-                self.map_resource.load_from_dict(mapresource_dict, miz)
+            if has_map_resource:
+                self.map_resource.load_from_dict(lua_dicts['l10n/DEFAULT/mapResource'], miz)
 
             self.map_resource.load_binary_files(miz, reserved_files)
 
@@ -296,8 +338,11 @@ class Mission:
         self.options.load_from_dict(options_dict["options"])
 
         # import warehouses
-        self.warehouses = Warehouses(self.terrain)
-        self.warehouses.load_dict(warehouse_dict["warehouses"])
+        self.warehouses = Warehouses(self._terrain)
+        if lazy:
+            self._lazy_sections["warehouses"] = warehouse_data
+        else:
+            self.warehouses.load_dict(warehouse_dict["warehouses"])
 
         # import base values
         self._description_text = self.translation.get_string(imp_mission["descriptionText"])
@@ -344,10 +389,12 @@ class Mission:
         self.bypassed_trig = None
         self.triggers = Triggers()
         self.triggerrules = triggers.Rules()
-        if bypass_triggers:
+        if bypass_triggers or lazy:
             self.bypassed_triggers = imp_mission["triggers"]
             self.bypassed_trigrules = imp_mission["trigrules"]
             self.bypassed_trig = imp_mission["trig"]
+            if not bypass_triggers:
+                self._lazy_sections["triggers"] = True
         else:
             self.triggers.load_from_dict(imp_mission["triggers"])
             # this will import trigrules and trig
@@ -365,17 +412,37 @@ class Mission:
         # weather
         self.random_weather = False
         imp_weather = imp_mission["weather"]
-        self.weather = weather.Weather(self.terrain)
+        self.weather = weather.Weather(self._terrain)
         self.weather.load_from_dict(imp_weather)
 
         # import coalition with countries and units
-        for col_name in ["blue", "red", "neutral"]:
-            if col_name in imp_mission["coalition"]:
-                self.coalition[col_name] = Coalition(col_name, imp_mission["coalition"][col_name]["bullseye"])
-                self.coalition[col_name].load_from_dict(self, imp_mission["coalition"][col_name])
+        if lazy:
+            self._lazy_sections["coalition"] = (imp_mission["coalition"], imp_mission["coalitions"])
+        else:
+            self._load_coalition(imp_mission["coalition"])
 
         return True
 
+    def _load_lua_files(self, filename: str, miz: zipfile.ZipFile, names: List[str],
+                        executor: Optional[concurrent.futures.Executor] = None) -> Dict[str, Dict[str, Any]]:
+        def parse(pending: List[str]) -> Iterable[Tuple[str, Dict[str, Any]]]:
+            if executor is None:
+                return ((name, _load_lua_file(miz, name)) for name in pending)
+            # start with the largest file, the others are parsed alongside
+            pending = sorted(pending, key=lambda x: miz.getinfo(x).file_size, reverse=True)
+            futures = [(name, executor.submit(_load_lua_file, filename, name)) for name in pending]
+            return ((name, future.result()) for name, future in futures)
+
+        if self.parse_cache is None:
+            return dict(parse(names))
+        return self.parse_cache.loads_many(miz, names, parse)
+
+    def _load_coalition(self, imp_coalition):
+        for col_name in ["blue", "red", "neutral"]:
+            if col_name in imp_coalition:
+                self._coalition[col_name] = Coalition(col_name, imp_coalition[col_name]["bullseye"])
+                self._coalition[col_name].load_from_dict(self, imp_coalition[col_name])
+
     def sortie_text(self) -> str:
         """Returns the mission sortie text.
 
@@ -472,6 +539,7 @@ class Mission:
         Returns:
             a new group id
         """
+        self._load_lazy_sections("coalition")  # make sure all loaded groups are accounted for
         self.current_group_id += 1
         return self.current_group_id
 
@@ -481,6 +549,7 @@ class Mission:
         Returns:
             a new unit id
         """
+        self._load_lazy_sections("coalition")  # make sure all loaded units are accounted for
         self.current_unit_id += 1
         return self.current_unit_id
 
@@ -811,7 +880,7 @@ class Mission:
 
         return False
 
-    def plane(self, name, _type: Type[planes.PlaneType], country: Country):
+    def plane(self, name, _type: Type['planes.PlaneType'], country: Country):
         """Creates a new plane unit.
 
         This method is a advanced interface method not intended for simple usage.
@@ -831,7 +900,7 @@ class Mission:
         """
         return Plane(self.next_unit_id(), self.string(name), _type, country)
 
-    def helicopter(self, name, _type: Type[helicopters.HelicopterType], country: Country):
+    def helicopter(self, name, _type: Type['helicopters.HelicopterType'], country: Country):
         """Creates a new helicopter unit.
 
         This method is a advanced interface method not intended for simple usage.
@@ -1190,7 +1259,7 @@ class Mission:
     def awacs_flight(self,
                      country: Country,
                      name: str,
-                     plane_type: Type[planes.PlaneType],
+                     plane_type: Type['planes.PlaneType'],
                      airport: Optional[terrain_.Airport],
                      position: mapping.Point,
                      race_distance=30 * 1000,
@@ -1245,7 +1314,7 @@ class Mission:
     def refuel_flight(self,
                       country,
                       name: str,
-                      plane_type: Type[planes.PlaneType],
+                      plane_type: Type['planes.PlaneType'],
                       airport: Optional[terrain_.Airport],
                       position: mapping.Point,
                       race_distance=30 * 1000,
@@ -1308,7 +1377,7 @@ class Mission:
     def escort_flight(self,
                       country,
                       name: str,
-                      escort_type: Type[planes.PlaneType],
+                      escort_type: Type['planes.PlaneType'],
                       airport: Optional[terrain_.Airport],
                       group_to_escort: unitgroup.FlyingGroup,
                       start_type: StartType = StartType.Cold,
@@ -1355,7 +1424,7 @@ class Mission:
     def patrol_flight(self,
                       country,
                       name: str,
-                      patrol_type: Type[planes.PlaneType],
+                      patrol_type: Type['planes.PlaneType'],
                       airport: Optional[terrain_.Airport],
                       pos1,
                       pos2,
@@ -1437,7 +1506,7 @@ class Mission:
     def intercept_flight(self,
                          country,
                          name: str,
-                         patrol_type: Type[planes.PlaneType],
+                         patrol_type: Type['planes.PlaneType'],
                          airport: terrain_.Airport,
                          zone: triggers.TriggerZone,
                          late_activation=True,
@@ -1493,7 +1562,7 @@ class Mission:
     def sead_flight(self,
                     country,
                     name: str,
-                    plane_type: Type[planes.PlaneType],
+                    plane_type: Type['planes.PlaneType'],
                     target_pos: mapping.Point,
                     airport: Optional[terrain_.Airport],
                     start_type: StartType = StartType.Cold,
@@ -1569,7 +1638,7 @@ class Mission:
     def strike_flight(self,
                       country,
                       name: str,
-                      _type: Type[planes.FlyingType],
+                      _type: Type[unittype.FlyingType],
                       target: Unit,
                       airport: Optional[terrain_.Airport],
                       start_type: StartType = StartType.Cold,
@@ -1846,42 +1915,143 @@ class Mission:
             return self.load_file(self.filename)
         raise RuntimeError("Currently no file loaded to reload.")
 
-    def save(self, filename=None):
+    def save(self, filename=None, sort_keys: bool = True, compression: Optional['Compression'] = None):
         """Save the current Mission object to the given file.
 
         Args:
             filename: filepath to save the Mission object
+            sort_keys: sort all lua tables by key, if False tables are written in the
+                       order pydcs builds them, which is faster but not sorted
+            compression: zip compression per file class, default is deflate for all files
         """
         filename = self.filename if filename is None else filename
         if not filename:
             raise RuntimeError("No filename given.")
         self.filename = filename  # store filename
+        compression = compression or Compression.presets["default"]
+        # resources are copied from the loaded archive, which might be overwritten now
+        self.map_resource.detach(filename)
+        try:
+            ZipResource.detach_all(self._loaded_files.values(), filename)
+        except RuntimeError:
+            # the loaded archive changed, the lua files are written from memory
+            self._loaded_files = {}
+
+        # written to a temporary file first, a failing save leaves no truncated mission behind
+        tmpname = "{f}.tmp".format(f=filename)
+        try:
+            # all lua files are streamed into their zip member, without building the text in memory
+            with zipfile.ZipFile(tmpname, 'w', compression=zipfile.ZIP_DEFLATED) as zipf:
+                # options
+                self._write_lua_file(zipf, 'options', lambda f: self.options.dump(f, sort_keys), compression)
+
+                # warehouses
+                if "warehouses" in self._lazy_sections:
+                    self._write_file(zipf, 'warehouses', self._lazy_sections["warehouses"], compression)
+                else:
+                    self._write_lua_file(zipf, 'warehouses', lambda f: self.warehouses.dump(f, sort_keys), compression)
+
+                # translation files
+                self._write_lua_file(zipf, 'l10n/DEFAULT/dictionary',
+                                     lambda f: lua.dump(self.translation.dict('DEFAULT'), f, "dictionary", 1, sort_keys),
+                                     compression)
+
+                mapresource = self.map_resource.store(zipf, 'DEFAULT', compression)
+                # print(mapresource)
+                self._write_lua_file(zipf, 'l10n/DEFAULT/mapResource',
+                                     lambda f: lua.dump(mapresource, f, "mapResource", 1, sort_keys), compression)
+
+                for unit_type, pages in self.aircraft_kneeboards.items():
+                    directory = f'KNEEBOARD/{unit_type.id}/IMAGES/'
+                    for idx, page in enumerate(pages):
+                        _write_path(zipf, page, f'{directory}/{page.name}', compression)
+
+                with self._open_text_member(zipf, 'mission', compression) as mfile:
+                    self.dump(mfile, sort_keys)
+            os.replace(tmpname, filename)
+        except BaseException:
+            if os.path.exists(tmpname):
+                os.remove(tmpname)
+            raise
 
-        with zipfile.ZipFile(filename, 'w', compression=zipfile.ZIP_DEFLATED) as zipf:
-            # options
-            zipf.writestr('options', str(self.options))
-
-            # warehouses
-            zipf.writestr('warehouses', str(self.warehouses))
+        return True
 
-            # translation files
-            dicttext = lua.dumps(self.translation.dict('DEFAULT'), "dictionary", 1)
-            zipf.writestr('l10n/DEFAULT/dictionary', dicttext)
+    @staticmethod
+    def _open_text_member(zipf: zipfile.ZipFile, name: str, compression: 'Compression') -> io.TextIOWrapper:
+        """Opens a new zip member for writing text."""
+        return io.TextIOWrapper(zipf.open(compression.zipinfo(name), 'w'), encoding='utf-8', newline='')
+
+    def _copy_unchanged(self, zipf: zipfile.ZipFile, name: str, size: int, crc: int,
+                        compression: 'Compression') -> bool:
+        """Copies the compressed data of the loaded file name, if it has the given size and CRC."""
+        loaded = self._loaded_files.get(name)
+        if (loaded is None or loaded.info.compress_type != compression.method(name)[0]
+                or loaded.info.file_size != size or loaded.info.CRC != crc):
+            return False
+        try:
+            loaded.copy_to(zipf, name)
+            return True
+        except (OSError, RuntimeError):
+            # the loaded archive is gone or was changed, nothing was written yet
+            return False
 
-            mapresource = self.map_resource.store(zipf, 'DEFAULT')
-            # print(mapresource)
-            zipf.writestr('l10n/DEFAULT/mapResource', lua.dumps(mapresource, "mapResource", 1))
+    def _write_file(self, zipf: zipfile.ZipFile, name: str, data: bytes, compression: 'Compression'):
+        """Writes a zip member, if it is unchanged the compressed data of the loaded file is copied."""
+        if not self._copy_unchanged(zipf, name, len(data), zlib.crc32(data), compression):
+            zipf.writestr(compression.zipinfo(name), data)
 
-            for unit_type, pages in self.aircraft_kneeboards.items():
-                directory = f'KNEEBOARD/{unit_type.id}/IMAGES/'
-                for idx, page in enumerate(pages):
-                    zipf.write(page, arcname=f'{directory}/{page.name}')
+    def _write_lua_file(self, zipf: zipfile.ZipFile, name: str, dump, compression: 'Compression'):
+        """Streams a lua file into its zip member, dump is called with a text file object.
 
-            zipf.writestr('mission', str(self))
+        Files of the loaded mission are spooled first, if they are unchanged
+        the compressed data of the loaded file is copied instead.
+        """
+        loaded = self._loaded_files.get(name)
+        if loaded is None or loaded.info.compress_type != compression.method(name)[0]:
+            with self._open_text_member(zipf, name, compression) as f:
+                dump(f)
+            return
+
+        with tempfile.SpooledTemporaryFile(_SPOOL_SIZE) as spool:
+            counter = _CrcWriter(spool)
+            f = io.TextIOWrapper(counter, encoding='utf-8', newline='')
+            dump(f)
+            f.flush()
+            f.detach()
+            if not self._copy_unchanged(zipf, name, counter.size, counter.crc, compression):
+                spool.seek(0)
+                with zipf.open(compression.zipinfo(name), 'w') as dst:
+                    shutil.copyfileobj(spool, dst, 1024 * 1024)
+
+    def dump(self, fp, sort_keys: bool = True):
+        """Writes the lua representation of the mission to a text file object.
 
-        return True
+        Args:
+            fp: text file object to write to
+            sort_keys: sort all tables by key, otherwise they are written in insertion order
+        """
+        m, deferred = self._dict_sections()
+        keys = list(m.keys()) + list(deferred.keys())
+        if sort_keys:
+            keys.sort(key=str)
+        # deferred sections are built right before they are written and released afterwards
+        items = ((k, deferred[k]() if k in deferred else m[k]) for k in keys)
+        lua.dump_table(items, fp, "mission", 1, sort_keys)
 
     def dict(self):
+        m, deferred = self._dict_sections()
+        for key, build in deferred.items():
+            m[key] = build()
+        return m
+
+    def _dict_sections(self):
+        """Returns the mission table entries.
+
+        Returns:
+            tuple of a dict with the small entries and a dict mapping the names
+            of the large entries to functions building them
+        """
+        deferred = {}
         m = {
             "start_time": int((self.start_time.hour * 60 * 60) + (self.start_time.minute * 60) + self.start_time.second)
         }
@@ -1893,7 +2063,7 @@ class Mission:
             "Day": self.start_time.day
         }
         if self.random_weather:
-            self.weather.random(self.start_time, self.terrain)
+            self.weather.random(self.start_time, self._terrain)
         m["groundControl"] = self.groundControl.dict()
         if self.usedModules is not None:
             m["usedModules"] = self.usedModules
@@ -1903,11 +2073,11 @@ class Mission:
             m["trigrules"] = self.bypassed_trigrules
             m["triggers"] = self.bypassed_triggers
         else:
-            m["trig"] = self.triggerrules.trig()
-            m["trigrules"] = self.triggerrules.trigrules()
-            m["triggers"] = self.triggers.dict()
+            deferred["trig"] = self.triggerrules.trig
+            deferred["trigrules"] = self.triggerrules.trigrules
+            deferred["triggers"] = self.triggers.dict
         m["weather"] = self.weather.dict()
-        m["theatre"] = self.terrain.name
+        m["theatre"] = self._terrain.name
         if self.needModules:
             m["needModules"] = self.needModules
         m["map"] = self.map.dict()
@@ -1924,19 +2094,20 @@ class Mission:
             m["initScriptFile"] = self.init_script_file
         if self.init_script is not None:
             m["initScript"] = self.init_script
-        m["coalition"] = {}
-        for col in self.coalition.keys():
-            m["coalition"][col] = self.coalition[col].dict()
-        col_blue = {self.coalition["blue"].country(x).id for x in self.coalition["blue"].countries.keys()}
-        col_red = {self.coalition["red"].country(x).id for x in self.coalition["red"].countries.keys()}
-        col_neutral = list(Mission._COUNTRY_IDS - col_blue - col_red)
-        col_blue = list(col_blue)
-        col_red = list(col_red)
-        m["coalitions"] = {
-            "neutral": {x + 1: col_neutral[x] for x in range(0, len(col_neutral))},
-            "blue": {x + 1: col_blue[x] for x in range(0, len(col_blue))},
-            "red": {x + 1: col_red[x] for x in range(0, len(col_red))}
-        }
+        if "coalition" in self._lazy_sections:
+            m["coalition"], m["coalitions"] = self._lazy_sections["coalition"]
+        else:
+            deferred["coalition"] = lambda: {col: self.coalition[col].dict() for col in self.coalition.keys()}
+            col_blue = {self.coalition["blue"].country(x).id for x in self.coalition["blue"].countries.keys()}
+            col_red = {self.coalition["red"].country(x).id for x in self.coalition["red"].countries.keys()}
+            col_neutral = list(Mission._COUNTRY_IDS - col_blue - col_red)
+            col_blue = list(col_blue)
+            col_red = list(col_red)
+            m["coalitions"] = {
+                "neutral": {x + 1: col_neutral[x] for x in range(0, len(col_neutral))},
+                "blue": {x + 1: col_blue[x] for x in range(0, len(col_blue))},
+                "red": {x + 1: col_red[x] for x in range(0, len(col_red))}
+            }
         m["sortie"] = self._sortie.id
         m["version"] = self.version
         m["goals"] = self.goals.dict()
@@ -1946,27 +2117,412 @@ class Mission:
         m["forcedOptions"] = self.forced_options.dict()
         m["failures"] = self.failures
 
-        return m
+        return m, deferred
 
     def __str__(self):
-        return lua.dumps(self.dict(), "mission", 1)
+        s = io.StringIO()
+        self.dump(s)
+        return s.getvalue()
 
     def __repr__(self):
         rep = {"base": str(self), "options": self.options, "translation": self.translation}
         return repr(rep)
 
+    def _load_lazy_sections(self, *sections: str):
+        """Decodes sections deferred by load_file.
+
+        Args:
+            sections: names of the sections to load, all pending sections if none are given
+        """
+        for section in sections or list(self._lazy_sections):
+            if section not in self._lazy_sections:
+                continue
+            if section == "coalition":
+                imp_coalition, _ = self._lazy_sections.pop("coalition")
+                self._load_coalition(imp_coalition)
+            elif section == "warehouses":
+                data = self._lazy_sections.pop("warehouses")
+                self._warehouses.load_dict(lua.loads(data.decode())["warehouses"])
+            elif section == "triggers":
+                self._load_triggers()
+
+    @property
+    def coalition(self) -> Dict[str, Coalition]:
+        self._load_lazy_sections("coalition")
+        return self._coalition
+
+    @coalition.setter
+    def coalition(self, coalition: Dict[str, Coalition]):
+        self._lazy_sections.pop("coalition", None)
+        self._coalition = coalition
+
+    @property
+    def terrain(self) -> terrain_.Terrain:
+        # airport warehouse and parking state is part of the terrain
+        self._load_lazy_sections("warehouses", "coalition")
+        return self._terrain
+
+    @terrain.setter
+    def terrain(self, terrain: terrain_.Terrain):
+        self._terrain = terrain
+
+    @property
+    def warehouses(self) -> Warehouses:
+        self._load_lazy_sections("warehouses")
+        return self._warehouses
+
+    @warehouses.setter
+    def warehouses(self, warehouses: Warehouses):
+        self._lazy_sections.pop("warehouses", None)
+        self._warehouses = warehouses
+
+    def _load_triggers(self):
+        if "triggers" in self._lazy_sections:
+            del self._lazy_sections["triggers"]
+            self._triggers.load_from_dict(self.bypassed_triggers)
+            self._triggerrules.load_from_dict(self, self.bypassed_trigrules)
+            self.bypassed_triggers = None
+            self.bypassed_trigrules = None
+            self.bypassed_trig = None
+
+    @property
+    def triggers(self) -> Triggers:
+        self._load_triggers()
+        return self._triggers
+
+    @triggers.setter
+    def triggers(self, _triggers: Triggers):
+        self._load_triggers()
+        self._triggers = _triggers
+
+    @property
+    def triggerrules(self) -> 'triggers.Rules':
+        self._load_triggers()
+        return self._triggerrules
+
+    @triggerrules.setter
+    def triggerrules(self, rules: 'triggers.Rules'):
+        self._load_triggers()
+        self._triggerrules = rules
+
+
+class Compression:
+    """Zip compression of the files in a saved mission, chosen per file class.
+
+    Each file class maps to a (method, level) pair, with a zipfile method like
+    ``zipfile.ZIP_DEFLATED`` and a level of None for the zlib default.
+    zipfile supports per file levels since python 3.7, on python 3.6 the
+    level is ignored and every file uses the default level of its method.
+
+    Unchanged files copied from a loaded mission keep their compressed data.
+
+    >>> m.save("fast.miz", compression=Compression.presets["fast"])
+
+    Args:
+        lua: mission, options, warehouses, dictionary and mapResource
+        media: already compressed images and sounds, see :attr:`media_extensions`
+        kneeboard: kneeboard images
+        other: all other files, e.g. scripts and wave files
+    """
+    Lua = "lua"
+    Media = "media"
+    Kneeboard = "kneeboard"
+    Other = "other"
+
+    lua_files = {'mission', 'options', 'warehouses'}
+    lua_l10n_files = {'dictionary', 'mapResource'}
+    media_extensions = {'.ogg', '.mp3', '.jpg', '.jpeg', '.png', '.dds', '.zip'}
+
+    def __init__(self,
+                 lua=(zipfile.ZIP_DEFLATED, None),
+                 media=(zipfile.ZIP_DEFLATED, None),
+                 kneeboard=(zipfile.ZIP_DEFLATED, None),
+                 other=(zipfile.ZIP_DEFLATED, None)):
+        self.settings = {
+            Compression.Lua: lua,
+            Compression.Media: media,
+            Compression.Kneeboard: kneeboard,
+            Compression.Other: other
+        }
+
+    @staticmethod
+    def file_class(name: str) -> str:
+        """Returns the file class of an archive path."""
+        if name in Compression.lua_files:
+            return Compression.Lua
+        if name.startswith('l10n/') and name.rsplit('/', 1)[-1] in Compression.lua_l10n_files:
+            return Compression.Lua
+        if name.startswith('KNEEBOARD/'):
+            return Compression.Kneeboard
+        if os.path.splitext(name)[1].lower() in Compression.media_extensions:
+            return Compression.Media
+        return Compression.Other
+
+    def method(self, name: str):
+        """Returns the (method, level) pair for an archive path."""
+        return self.settings[self.file_class(name)]
+
+    def apply(self, zinfo: zipfile.ZipInfo):
+        """Sets method and level of an archive member from its path."""
+        zinfo.compress_type, level = self.method(zinfo.filename)
+        if hasattr(zinfo, '_compresslevel'):
+            # python 3.6 ZipInfo has no compression level
+            zinfo._compresslevel = level
+
+    def zipinfo(self, name: str) -> zipfile.ZipInfo:
+        """Returns the info for a new archive member, like ZipFile.writestr would create it."""
+        zinfo = zipfile.ZipInfo(name, date_time=time.localtime(time.time())[:6])
+        self.apply(zinfo)
+        zinfo.external_attr = 0o600 << 16
+        return zinfo
+
+    def __repr__(self):
+        return "Compression({s})".format(s=self.settings)
+
+
+Compression.presets = {
+    # the zipfile defaults, smallest files
+    "default": Compression(),
+    # fast deflate for text, media is not compressed again
+    "fast": Compression(lua=(zipfile.ZIP_DEFLATED, 1), media=(zipfile.ZIP_STORED, None),
+                        kneeboard=(zipfile.ZIP_STORED, None), other=(zipfile.ZIP_DEFLATED, 1)),
+    # best compression
+    "small": Compression(lua=(zipfile.ZIP_DEFLATED, 9), media=(zipfile.ZIP_DEFLATED, 9),
+                         kneeboard=(zipfile.ZIP_DEFLATED, 9), other=(zipfile.ZIP_DEFLATED, 9)),
+    # no compression at all
+    "store": Compression(lua=(zipfile.ZIP_STORED, None), media=(zipfile.ZIP_STORED, None),
+                         kneeboard=(zipfile.ZIP_STORED, None), other=(zipfile.ZIP_STORED, None))
+}  # type: Dict[str, Compression]
+
+
+class ZipResource:
+    """A file inside a loaded mission archive.
+
+    Only the zip member reference is kept, the file is neither extracted
+    nor decompressed. On save its compressed data is copied as is, after
+    checking by CRC and size that the archive still holds the same file.
+
+    Args:
+        archive: path of the zip file
+        info: zip member of the file
+    """
+    def __init__(self, archive: Union[str, io.BytesIO], info: zipfile.ZipInfo):
+        self.archive = os.path.abspath(archive) if isinstance(archive, str) else archive
+        self.info = info
+
+    @property
+    def filename(self) -> str:
+        return self.info.filename
+
+    @property
+    def name(self) -> str:
+        return self.info.filename.rsplit('/', 1)[-1]
+
+    def _open_archive(self):
+        if isinstance(self.archive, str):
+            try:
+                return open(self.archive, 'rb')
+            except OSError as e:
+                raise RuntimeError("Archive '{a}' of '{f}' is not readable anymore".format(
+                    a=self.archive, f=self.filename)) from e
+        # in memory archives stay open
+        return io.BufferedReader(_Unclosable(self.archive))
+
+    def _member(self, zipf: zipfile.ZipFile) -> zipfile.ZipInfo:
+        """Returns the member in the current archive, which may have been replaced since loading."""
+        try:
+            info = zipf.getinfo(self.filename)
+        except KeyError:
+            info = None
+        if info is None or info.CRC != self.info.CRC or info.file_size != self.info.file_size:
+            raise RuntimeError("Archive '{a}' changed since '{f}' was loaded".format(a=self.archive, f=self.filename))
+        return info
+
+    def read(self) -> bytes:
+        """Returns the uncompressed content of the file."""
+        with self._open_archive() as fp:
+            try:
+                with zipfile.ZipFile(fp) as zipf:
+                    return zipf.read(self._member(zipf))
+            except zipfile.BadZipFile as e:
+                raise RuntimeError("Archive '{a}' changed since '{f}' was loaded".format(
+                    a=self.archive, f=self.filename)) from e
+
+    def copy_to(self, zipf: zipfile.ZipFile, arcname: Optional[str] = None,
+                compression: Optional[Compression] = None):
+        """Writes the file to another zip file, keeping its compressed data.
+
+        If compression asks for another method than the loaded file has, or
+        zipfile lacks the internals for raw copies, the file is decompressed
+        and compressed again. Nothing is written if the archive is gone or
+        does not hold the loaded file anymore, a RuntimeError is raised instead.
+        """
+        arcname = arcname or self.filename
+        with self._open_archive() as fp:
+            try:
+                with zipfile.ZipFile(fp) as src:
+                    info = self._member(src)
+                    if info.flag_bits & 0x1:
+                        # encrypted members can't be copied raw, and not read without password either
+                        raise RuntimeError("Can't copy encrypted file '{f}'".format(f=self.filename))
+                    recompress = compression is not None and compression.method(arcname)[0] != info.compress_type
+                    if recompress or not _can_write_raw(zipf):
+                        if recompress:
+                            zinfo = compression.zipinfo(arcname)
+                        else:
+                            zinfo = zipfile.ZipInfo(arcname)
+                            zinfo.compress_type = info.compress_type
+                            zinfo.external_attr = info.external_attr
+                        zinfo.date_time = info.date_time
+                        with src.open(info) as data, zipf.open(zinfo, 'w') as dst:
+                            shutil.copyfileobj(data, dst, 1024 * 1024)
+                        return
+            except zipfile.BadZipFile as e:
+                raise RuntimeError("Archive '{a}' changed since '{f}' was loaded".format(
+                    a=self.archive, f=self.filename)) from e
+            fp.seek(info.header_offset)
+            header = fp.read(30)
+            if header[:4] != b'PK\x03\x04':
+                raise RuntimeError("Bad zip member header for '{f}'".format(f=self.filename))
+            name_len, extra_len = struct.unpack('<HH', header[26:30])
+            fp.seek(name_len + extra_len, os.SEEK_CUR)
+            _write_raw_member(zipf, info, arcname, fp)
+
+    def detach(self):
+        """Moves the compressed data into memory, the archive may be overwritten afterwards."""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as zipf:
+            self.copy_to(zipf)
+        self.archive = buffer
+        self.info = zipf.getinfo(self.filename)
+
+    @staticmethod
+    def detach_all(resources: Iterable['ZipResource'], filename: str):
+        """Detaches all resources that are kept in the archive filename."""
+        if not os.path.exists(filename):
+            return
+        for resource in resources:
+            if (isinstance(resource.archive, str) and os.path.exists(resource.archive)
+                    and os.path.samefile(resource.archive, filename)):
+                resource.detach()
+
+    def __repr__(self):
+        return "ZipResource({a!r}, {f!r})".format(a=self.archive, f=self.filename)
+
+
+# spooled lua files stay in memory up to this size
+_SPOOL_SIZE = 64 * 1024
+
+
+class _CrcWriter(io.RawIOBase):
+    """Write only stream that passes the data on to fp, counting its CRC and size."""
+    def __init__(self, fp):
+        self.fp = fp
+        self.crc = 0
+        self.size = 0
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.crc = zlib.crc32(b, self.crc)
+        self.size += len(b)
+        return self.fp.write(b)
+
+
+class _Unclosable(io.RawIOBase):
+    """Read only view of a BytesIO that leaves it open when closed."""
+    def __init__(self, buffer: io.BytesIO):
+        self.buffer = buffer
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def seek(self, pos, whence=os.SEEK_SET):
+        return self.buffer.seek(pos, whence)
+
+    def tell(self):
+        return self.buffer.tell()
+
+    def readinto(self, b):
+        data = self.buffer.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+
+# private ZipFile attributes _write_raw_member relies on
+_RAW_WRITE_ATTRS = ('_lock', '_writing', '_writecheck', '_didModify', '_seekable', 'start_dir', 'fp',
+                    'filelist', 'NameToInfo')
+
+
+def _can_write_raw(zipf: zipfile.ZipFile) -> bool:
+    """Returns if zipf has the internals to append already compressed data."""
+    return hasattr(zipfile.ZipInfo, 'FileHeader') and all(hasattr(zipf, x) for x in _RAW_WRITE_ATTRS)
+
+
+def _write_raw_member(zipf: zipfile.ZipFile, info: zipfile.ZipInfo, arcname: str, data_fp):
+    """Appends a member with already compressed data read from data_fp to zipf.
+
+    zipfile has no public API for this, so it writes the local header and
+    registers the member the same way ZipFile.writestr does, holding the
+    archive lock while writing.
+    """
+    zinfo = zipfile.ZipInfo(arcname, info.date_time)
+    zinfo.compress_type = info.compress_type
+    zinfo.external_attr = info.external_attr
+    zinfo.create_system = info.create_system
+    # sizes go into the local header, no data descriptor follows the data
+    zinfo.flag_bits = info.flag_bits & ~0x08
+    zinfo.CRC = info.CRC
+    zinfo.compress_size = info.compress_size
+    zinfo.file_size = info.file_size
+    zip64 = max(zinfo.file_size, zinfo.compress_size) > zipfile.ZIP64_LIMIT
+
+    with zipf._lock:
+        if zipf._writing:
+            raise ValueError("Can't write to the ZIP file while there is an open writing handle.")
+        zipf._writecheck(zinfo)
+        zipf._didModify = True
+        if zipf._seekable:
+            zipf.fp.seek(zipf.start_dir)
+        zinfo.header_offset = zipf.fp.tell()
+        zipf.fp.write(zinfo.FileHeader(zip64))
+        remaining = zinfo.compress_size
+        while remaining > 0:
+            chunk = data_fp.read(min(remaining, 1 << 20))
+            if not chunk:
+                raise EOFError("Unexpected end of zip member '{f}'".format(f=info.filename))
+            zipf.fp.write(chunk)
+            remaining -= len(chunk)
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[zinfo.filename] = zinfo
+        zipf.start_dir = zipf.fp.tell()
+
+
+def _write_path(zipf: zipfile.ZipFile, path: Union[str, Path], arcname: str, compression: Compression):
+    """Like ZipFile.write, with method and level taken from compression."""
+    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+    compression.apply(zinfo)
+    with open(path, 'rb') as src, zipf.open(zinfo, 'w') as dst:
+        shutil.copyfileobj(src, dst, 1024 * 1024)
+
 
 class MapResource:
     """MapResource is responsibly to manage all additional mission resource files.
 
     Mission resource files are briefing images, lua scripts, sound files.
+    Files of a loaded mission are kept as :class:`ZipResource` references,
+    added files by their path.
 
     Args:
         mission(Mission): the mission this MapResource belongs too, needed for dictionary ids
     """
     def __init__(self, mission: Mission):
-        self.files = {}
-        self.binary_files = []
+        self.files = {}  # type: Dict[str, Dict[str, Union[str, ZipResource]]]
+        self.binary_files = []  # type: List[Dict[str, Union[str, ZipResource]]]
         self.added_paths = []
         self.mission = mission
 
@@ -1979,24 +2535,20 @@ class MapResource:
             self.added_paths.append(filepath)
 
             try:
-                extractedpath = zipf.extract(filepath, tempfile.gettempdir())
-                self.add_resource_file(extractedpath, lang, key)
+                self._add_resource(ZipResource(zipf.filename, zipf.getinfo(filepath)), lang, key)
             except KeyError as ke:
                 print(ke, file=sys.stderr)
 
     def load_binary_files(self, zipf: zipfile.ZipFile, reserved_files: [str]):
-        for filepath in zipf.namelist():
-            if filepath in reserved_files or filepath in self.added_paths:
+        for info in zipf.infolist():
+            filepath = info.filename
+            if filepath in reserved_files or filepath in self.added_paths or info.is_dir():
                 continue
 
-            try:
-                extractedpath = zipf.extract(filepath, tempfile.gettempdir())
-                self.binary_files.append({
-                    "path": os.path.abspath(extractedpath),
-                    "respath": filepath,
-                })
-            except KeyError as ke:
-                print(ke, file=sys.stderr)
+            self.binary_files.append({
+                "path": ZipResource(zipf.filename, info),
+                "respath": filepath,
+            })
 
     def add_resource_file(self, extracted_path: str, lang: str = 'DEFAULT', key=None) -> ResourceKey:
         """Adds a file to the mission resource depot.
@@ -2009,11 +2561,13 @@ class MapResource:
         Returns:
             resource key to use in scripts
         """
-        abspath = os.path.abspath(extracted_path)
+        return self._add_resource(os.path.abspath(extracted_path), lang, key)
+
+    def _add_resource(self, resource: Union[str, ZipResource], lang: str, key=None) -> ResourceKey:
         resource_key = ResourceKey(key) if key else ResourceKey("ResKey_" + str(self.mission.next_dict_id()))
         if lang not in self.files:
             self.files[lang] = {}
-        self.files[lang][resource_key.key] = abspath
+        self.files[lang][resource_key.key] = resource
         return resource_key
 
     def get_resource_keys(self, lang: str = 'DEFAULT') -> List[ResourceKey]:
@@ -2032,25 +2586,76 @@ class MapResource:
         :param lang:
         :return:
         """
-        return self.files[lang][resource_key.key][len(tempfile.gettempdir()) + len('/l10n//') + len(lang):]
+        resource = self.files[lang][resource_key.key]
+        if isinstance(resource, ZipResource):
+            return resource.name
+        return os.path.basename(resource)
+
+    def resources(self) -> List[ZipResource]:
+        """Returns all files that are still kept in a loaded mission archive."""
+        res = [x["path"] for x in self.binary_files]
+        for lang in self.files:
+            res += self.files[lang].values()
+        return [x for x in res if isinstance(x, ZipResource)]
+
+    def detach(self, filename: str):
+        """Moves all files kept in the archive filename into memory, before it is overwritten."""
+        ZipResource.detach_all(self.resources(), filename)
 
-    def store(self, zipf: zipfile.ZipFile, lang='DEFAULT'):
+    @staticmethod
+    def _write(zipf: zipfile.ZipFile, resource: Union[str, ZipResource], arcname: str, compression: Compression):
+        if isinstance(resource, ZipResource):
+            resource.copy_to(zipf, arcname, compression)
+        else:
+            _write_path(zipf, resource, arcname, compression)
+
+    @staticmethod
+    def _content_key(resource: Union[str, ZipResource]) -> Tuple[int, int]:
+        if isinstance(resource, ZipResource):
+            return resource.info.file_size, resource.info.CRC
+        crc = 0
+        with open(resource, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                crc = zlib.crc32(chunk, crc)
+        return os.path.getsize(resource), crc
+
+    @staticmethod
+    def _read(resource: Union[str, ZipResource]) -> bytes:
+        if isinstance(resource, ZipResource):
+            return resource.read()
+        with open(resource, 'rb') as f:
+            return f.read()
+
+    def store(self, zipf: zipfile.ZipFile, lang='DEFAULT', compression: Optional[Compression] = None):
         d = {}
+        compression = compression or Compression.presets["default"]
+        # names in the archive, so duplicates are found without scanning it
+        written = {x.filename for x in zipf.filelist}
 
         for file in self.binary_files:
-            zipf.write(file["path"], file["respath"])
+            self._write(zipf, file["path"], file["respath"], compression)
+            written.add(file["respath"])
 
         if lang in self.files:
+            # written files by (size, crc), identical files under different names are written once
+            by_content = {}  # type: Dict[Tuple[int, int], List[Tuple[Union[str, ZipResource], str]]]
             for reskey in self.files[lang]:
-                filepath = self.files[lang][reskey]
-                if os.path.isabs(filepath):
-                    nameinzip = os.path.basename(filepath)
+                resource = self.files[lang][reskey]
+                if isinstance(resource, ZipResource) or os.path.isabs(resource):
+                    nameinzip = self.get_file_path(ResourceKey(reskey), lang)
                     zippath = "l10n/{lang}/{name}".format(lang=lang, name=nameinzip)
                     # do not write files twice
                     # if a script is called multiple times, a resource key is duplicated for the same file
-                    has_file = [x for x in zipf.filelist if x.filename == zippath]
-                    if not has_file:
-                        zipf.write(filepath, zippath)
+                    if zippath not in written:
+                        content_key = self._content_key(resource)
+                        same = [name for other, name in by_content.get(content_key, [])
+                                if other == resource or self._read(other) == self._read(resource)]
+                        if same:
+                            d[reskey] = same[0]
+                            continue
+                        self._write(zipf, resource, zippath, compression)
+                        written.add(zippath)
+                        by_content.setdefault(content_key, []).append((resource, nameinzip))
                     d[reskey] = nameinzip
 
         return d
@@ -2175,7 +2780,7 @@ class Options:
         self.difficulty.load_from_dict(d["difficulty"])
         self.options = d
 
-    def __str__(self):
+    def dict(self):
         d = {
             "playerName": self.playerName,
             "difficulty": self.difficulty.dict()
@@ -2183,7 +2788,100 @@ class Options:
         for k in self.options:
             if k not in d:
                 d[k] = self.options[k]
-        return lua.dumps(d, "options", 1)
+        return d
+
+    def dump(self, fp, sort_keys: bool = True):
+        lua.dump(self.dict(), fp, "options", 1, sort_keys)
+
+    def __str__(self):
+        return lua.dumps(self.dict(), "options", 1)
 
     def __repr__(self):
         return repr(self.options)
+
+
+class LoadResult:
+    """Outcome of loading one mission with :func:`load_many`.
+
+    Args:
+        path: path of the mission file
+        result: return value of the summary function
+        error: formatted traceback if loading or summarizing failed
+    """
+    def __init__(self, path: str, result: Any = None, error: Optional[str] = None):
+        self.path = path
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self):
+        return "LoadResult({p!r}, {s})".format(p=self.path, s="ok" if self.ok else "error")
+
+
+def _load_summary(path: str, sections: Optional[Iterable[str]], summary: Optional[Callable[[Mission], Any]]) -> LoadResult:
+    try:
+        m = Mission()
+        m.load_file(path, lazy=sections is not None)
+        for section in sections or ():
+            getattr(m, section)
+        return LoadResult(path, summary(m) if summary else None)
+    except Exception:
+        return LoadResult(path, error=traceback.format_exc())
+
+
+def load_many(paths: Iterable[str],
+              workers: Optional[int] = None,
+              sections: Optional[Iterable[str]] = None,
+              summary: Optional[Callable[[Mission], Any]] = Mission.stats) -> Iterator[LoadResult]:
+    """Loads many mission files on a process pool.
+
+    Results are yielded as the missions finish loading, not in the order
+    of paths. Failing files are reported by their :class:`LoadResult`
+    and do not abort the others.
+
+    >>> for r in load_many(glob.glob("missions/*.miz"), workers=8):
+    ...     print(r.path, r.result["unit_count"] if r.ok else r.error)
+
+    On platforms without fork, the caller has to be guarded by ``if __name__ == "__main__":``.
+
+    Args:
+        paths: mission files to load
+        workers: number of processes, None for the cpu count, 1 loads in this process
+        sections: if set, missions are loaded lazy and only these sections are decoded up front,
+                  e.g. ``["coalition"]``, any of coalition, triggers and warehouses
+        summary: picklable function called with each loaded mission, its return value is sent back
+                 as :attr:`LoadResult.result`, as whole missions are expensive to transfer
+
+    Returns:
+        iterator of :class:`LoadResult`
+    """
+    if sections is not None:
+        sections = list(sections)
+        unknown = set(sections) - {"coalition", "triggers", "warehouses"}
+        if unknown:
+            raise ValueError("Unknown mission sections: {s}".format(s=", ".join(sorted(unknown))))
+
+    if workers == 1:
+        for path in paths:
+            yield _load_summary(path, sections, summary)
+        return
+
+    executor = concurrent.futures.ProcessPoolExecutor(workers)
+    futures = {}  # type: Dict[concurrent.futures.Future, str]
+    try:
+        for path in paths:
+            futures[executor.submit(_load_summary, path, sections, summary)] = path
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                yield future.result()
+            except Exception:
+                # the worker process died
+                yield LoadResult(futures[future], error=traceback.format_exc())
+    finally:
+        # the caller may stop iterating early, missions not started yet are dropped
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
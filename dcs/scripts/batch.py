@@ -0,0 +1,76 @@
+"""Batch generation of missions for the generator scripts.
+
+Importing pydcs and loading its unit databases takes much longer than
+generating a single mission. In batch mode the first mission is generated
+in the main process, which warms up all lazily loaded data, then worker
+processes are forked to generate the remaining missions.
+
+Every mission seeds the random module with its own seed, so a mission only
+depends on its seed and the script arguments, regardless of the worker it ran on.
+"""
+import argparse
+import functools
+import multiprocessing
+import os
+import random
+from typing import Callable, Tuple
+
+
+def _positive_int(value: str) -> int:
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError("must be at least 1, got {n}".format(n=n))
+    return n
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--count", type=_positive_int, default=1,
+                        help="Number of missions to generate, the seed is appended to the output name")
+    parser.add_argument("--workers", type=int, default=1, help="Number of processes generating missions")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Random seed of the first mission, the following missions use the next seeds")
+
+
+def output_path(output: str, seed: int, count: int) -> str:
+    """Returns the mission filename for a seed, output may contain a {seed} placeholder."""
+    if "{seed" in output:
+        return output.format(seed=seed)
+    if count == 1:
+        return output
+    base, ext = os.path.splitext(output)
+    return "{base}_{seed}{ext}".format(base=base, seed=seed, ext=ext or ".miz")
+
+
+def _generate(generate: Callable[[argparse.Namespace, str], None], args: argparse.Namespace, job: Tuple[int, str]) -> str:
+    seed, output = job
+    random.seed(seed)
+    generate(args, output)
+    return output
+
+
+def run(generate: Callable[[argparse.Namespace, str], None], args: argparse.Namespace):
+    """Generates args.count missions by calling generate(args, output) for each.
+
+    generate has to be a module level function, so it can be sent to the worker processes.
+    """
+    seed = args.seed if args.seed is not None else random.randrange(1 << 31)
+    jobs = [(seed + i, output_path(args.output, seed + i, args.count)) for i in range(args.count)]
+    job = functools.partial(_generate, generate, args)
+    if not jobs:
+        return
+
+    # the first mission warms up the main process before forking
+    print("Mission created: " + job(jobs[0]))
+    if len(jobs) == 1:
+        return
+
+    if args.workers <= 1:
+        for output in map(job, jobs[1:]):
+            print("Mission created: " + output)
+        return
+
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    with context.Pool(args.workers) as pool:
+        for output in pool.imap_unordered(job, jobs[1:]):
+            print("Mission created: " + output)
@@ -8,6 +8,7 @@ from dcs.mapping import Point, Polygon
 import dcs.terrain
 import dcs.unittype
 import dcs.vehicles
+from dcs.scripts import batch
 from dcs.countries import USA, Russia
 import random
 import argparse
@@ -416,8 +417,8 @@ class BasicScenario:
 
         return aircraft_groups
 
-    def save(self, filename, stats):
-        self.m.save(filename)
+    def save(self, filename, stats, compression="default"):
+        self.m.save(filename, compression=dcs.mission.Compression.presets[compression])
         if stats:
             self.m.print_stats(self.m.stats())
 
@@ -844,7 +845,7 @@ class CAP(BasicScenario):
             spawn_rect = dcs.mapping.Rectangle(spawn_rect.bottom + 40000, spawn_rect.left,
                                                spawn_rect.bottom, spawn_rect.right)
             att_country = self.m.country(af["country"])
-            start_airport = caucasus.sochi() if af["type"].helicopter else random.choice(self.red_airports)
+            start_airport = caucasus.sochi_adler() if af["type"].helicopter else random.choice(self.red_airports)
             attack_airport = random.choice(self.blue_airports)
 
             pos = attack_airport.position.point_from_heading(
@@ -877,32 +878,17 @@ class CAP(BasicScenario):
 AWACS and tanker are reachable on VHF-AM {freq} Mhz.""".format(freq=vhf_am))
 
 
-def main():
+player_types = [
+    (dcs.countries.USA.name, dcs.planes.A_10C.id),
+    (dcs.countries.Georgia.name, dcs.planes.Su_25T.id),
+    (dcs.countries.USA.name, dcs.planes.M_2000C.id),
+    (dcs.countries.USA.name, dcs.helicopters.Ka_50.id),
+    (dcs.countries.USA.name, USA.Plane.MiG_21Bis.id)
+]
 
-    types = [
-        (dcs.countries.USA.name, dcs.planes.A_10C.id),
-        (dcs.countries.Georgia.name, dcs.planes.Su_25T.id),
-        (dcs.countries.USA.name, dcs.planes.M_2000C.id),
-        (dcs.countries.USA.name, dcs.helicopters.Ka_50.id),
-        (dcs.countries.USA.name, USA.Plane.MiG_21Bis.id)
-    ]
-    aircraft_types = [x[1] for x in types]
-    parser = argparse.ArgumentParser(description="Random DCS mission generator")
 
-    parser.add_argument("-a", "--aircrafttype", default=dcs.planes.Su_25T.id,
-                        choices=aircraft_types,
-                        help="Player aircraft type")
-    parser.add_argument("-p", "--playercount", default=1, type=int)
-    parser.add_argument("-s", "--start", default="inflight", choices=["inflight", "runway", "warm", "cold"])
-    parser.add_argument("-t", "--missiontype", default="main", choices=["main", "CAS", "CAP", "refuel"])
-    parser.add_argument("-d", "--daytime", choices=["random", "day", "night", "dusk", "dawn", "noon"], default="random")
-    parser.add_argument("-w", "--weather", choices=["dynamic", "dyncyclone", "dynanti", "dynone", "clear"], default="dynamic")
-    parser.add_argument("-u", "--unhide", action="store_true", default=False, help="Show enemy pre mission")
-    parser.add_argument("--show-stats", action="store_true", default=False, help="Show generated missions stats")
-    parser.add_argument("-o", "--output", help="Name and path of the generated mission",
-                        default=os.path.join(os.path.expanduser("~"),"Saved Games\\DCS\\Missions\\random.miz"))
-
-    args = parser.parse_args()
+def generate(args, output: str):
+    types = player_types
     missiontype = args.missiontype
     if args.aircrafttype in [
         dcs.planes.Su_25T.id,
@@ -932,9 +918,31 @@ def main():
     s.daytime(args.daytime)
     if args.weather == "dynamic":
         s.dynamic_weather(args.weather)
-    s.save(args.output, args.show_stats)
+    s.save(output, args.show_stats, args.compression)
+
 
-    print("Mission created: " + args.output)
+def main():
+    aircraft_types = [x[1] for x in player_types]
+    parser = argparse.ArgumentParser(description="Random DCS mission generator")
+
+    parser.add_argument("-a", "--aircrafttype", default=dcs.planes.Su_25T.id,
+                        choices=aircraft_types,
+                        help="Player aircraft type")
+    parser.add_argument("-p", "--playercount", default=1, type=int)
+    parser.add_argument("-s", "--start", default="inflight", choices=["inflight", "runway", "warm", "cold"])
+    parser.add_argument("-t", "--missiontype", default="main", choices=["main", "CAS", "CAP", "refuel"])
+    parser.add_argument("-d", "--daytime", choices=["random", "day", "night", "dusk", "dawn", "noon"], default="random")
+    parser.add_argument("-w", "--weather", choices=["dynamic", "dyncyclone", "dynanti", "dynone", "clear"], default="dynamic")
+    parser.add_argument("-u", "--unhide", action="store_true", default=False, help="Show enemy pre mission")
+    parser.add_argument("-c", "--compression", choices=sorted(dcs.mission.Compression.presets), default="default",
+                        help="Zip compression of the mission file, 'fast' for batch generation")
+    parser.add_argument("--show-stats", action="store_true", default=False, help="Show generated missions stats")
+    parser.add_argument("-o", "--output", help="Name and path of the generated mission",
+                        default=os.path.join(os.path.expanduser("~"),"Saved Games\\DCS\\Missions\\random.miz"))
+    batch.add_arguments(parser)
+
+    args = parser.parse_args()
+    batch.run(generate, args)
     return 0
 
 
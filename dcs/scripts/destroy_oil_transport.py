@@ -3,6 +3,7 @@ import sys
 import os
 import random
 import argparse
+from dcs.scripts import batch
 
 zone_abkhazia = dcs.Polygon([dcs.Point(-187092.85714285, 460857.14285714), dcs.Point(-149378.57142856, 476285.71428571),
                              dcs.Point(-147664.28571428, 520000), dcs.Point(-175378.57142856, 599714.28571429),
@@ -10,23 +11,13 @@ zone_abkhazia = dcs.Polygon([dcs.Point(-187092.85714285, 460857.14285714), dcs.P
                              dcs.Point(-233949.99999999, 632857.14285714), dcs.Point(-271092.85714285, 596000)])
 
 
-def main():
-    aircrafts = [x for x in dcs.planes.plane_map.values() if x.flyable]
-    helicopters = [x for x in dcs.helicopters.helicopter_map.values() if x.flyable]
-    aircraft_types = [x.id for x in aircrafts + helicopters]
+def by_name(nodes):
+    # graph nodes are kept in a set, sort them so the same seed always picks the same nodes
+    return sorted(nodes, key=lambda x: x.name)
 
-    parser = argparse.ArgumentParser(description="DCS random search and destroy oil convoy")
-    parser.add_argument("-a", "--aircrafttype", default=dcs.planes.A_10C.id,
-                        choices=aircraft_types,
-                        help="Player aircraft type")
-    parser.add_argument("-u", "--unhide", action="store_true", default=False, help="Show enemy pre mission")
-    parser.add_argument("-t", "--terrain", choices=["caucasus", "nevada"], default='caucasus')
-    parser.add_argument("-d", "--difficulty", choices=["easy", "normal", "hard", "ohno"], default='normal')
-    parser.add_argument("-m", "--multiplayer", action="store_true", default=False)
-    parser.add_argument("-s", "--stats", action="store_false", default=True)
-    parser.add_argument("-o", "--output", help="Name and path of the generated mission", default=None)
 
-    args = parser.parse_args()
+def generate(args, output: str):
+    aircrafts = [x for x in dcs.planes.plane_map.values() if x.flyable]
     terrain_map = {
         "caucasus": dcs.terrain.Caucasus,
         "nevada": dcs.terrain.Nevada
@@ -39,11 +30,9 @@ def main():
     }
     difficulty = difficulty_map[args.difficulty]
 
-    if args.output is None:
-        args.output = os.path.join(os.path.expanduser("~"), "Saved Games\\DCS\\Missions\\oil_transport.miz")
-        if args.terrain == "caucasus":
-            zone_enemy = zone_abkhazia
-            destination_city = 'Adler'
+    if args.terrain == "caucasus":
+        zone_enemy = zone_abkhazia
+        destination_city = 'Adler'
 
     m = dcs.Mission(terrain_map[args.terrain]())
     m.random_weather = True
@@ -61,9 +50,9 @@ def main():
     destination_node = city_graph.node(destination_city)
 
     # find a startnode far away enough
-    start_node = random.choice(city_graph.rated_nodes_within(zone_enemy))
+    start_node = random.choice(by_name(city_graph.rated_nodes_within(zone_enemy)))
     while start_node.position.distance_to_point(destination_node.position) < 70000:
-        start_node = random.choice(city_graph.rated_nodes_within(zone_enemy))
+        start_node = random.choice(by_name(city_graph.rated_nodes_within(zone_enemy)))
 
     # create the oil convoy
     abkhazia = m.country(dcs.countries.Abkhazia.name)
@@ -94,7 +83,7 @@ def main():
     aaa_def = [[dcs.countries.Abkhazia.Vehicle.AirDefence.AAA_ZU_23_Emplacement],
                [dcs.countries.Abkhazia.Vehicle.AirDefence.SAM_SA_18_Igla_MANPADS,
                 dcs.countries.Abkhazia.Vehicle.AirDefence.SAM_SA_18_Igla_comm]]
-    for city in city_graph.rated_nodes_within(zone_enemy, 50):
+    for city in by_name(city_graph.rated_nodes_within(zone_enemy, 50)):
         use_building_pos = int(min(difficulty, random.random()) * len(city.air_defence_pos_small))
         small_aaa_pos = list(city.air_defence_pos_small)
         for i in range(0, use_building_pos):
@@ -111,7 +100,7 @@ def main():
     aaa_def += [[dcs.countries.Abkhazia.Vehicle.AirDefence.SPAAA_ZSU_23_4_Shilka,
                  dcs.countries.Abkhazia.Vehicle.Armor.ARV_BRDM_2,
                  dcs.countries.Abkhazia.Vehicle.Armor.ARV_BRDM_2]]
-    for node in city_graph.nodes_within(zone_enemy):
+    for node in by_name(city_graph.nodes_within(zone_enemy)):
         if random.random() < (difficulty - 0.1):
             vg = m.vehicle_group_platoon(abkhazia,
                                          node.name,
@@ -123,7 +112,7 @@ def main():
 
     # add a buk site if difficulty is hard or higher
     if difficulty > 0.5:
-        buk_node = random.choice(city_graph.rated_nodes_within(zone_enemy, 50))
+        buk_node = random.choice(by_name(city_graph.rated_nodes_within(zone_enemy, 50)))
         sa11 = dcs.templates.VehicleTemplate.sa11_site(
             m,
             abkhazia,
@@ -210,9 +199,35 @@ Mission objectives:
 
     if args.stats:
         m.print_stats(m.stats())
-    m.save(args.output)
+    m.save(output, compression=dcs.mission.Compression.presets[args.compression])
+
+
+def main():
+    aircrafts = [x for x in dcs.planes.plane_map.values() if x.flyable]
+    helicopters = [x for x in dcs.helicopters.helicopter_map.values() if x.flyable]
+    aircraft_types = [x.id for x in aircrafts + helicopters]
+
+    parser = argparse.ArgumentParser(description="DCS random search and destroy oil convoy")
+    parser.add_argument("-a", "--aircrafttype", default=dcs.planes.A_10C.id,
+                        choices=aircraft_types,
+                        help="Player aircraft type")
+    parser.add_argument("-u", "--unhide", action="store_true", default=False, help="Show enemy pre mission")
+    parser.add_argument("-t", "--terrain", choices=["caucasus", "nevada"], default='caucasus')
+    parser.add_argument("-d", "--difficulty", choices=["easy", "normal", "hard", "ohno"], default='normal')
+    parser.add_argument("-m", "--multiplayer", action="store_true", default=False)
+    parser.add_argument("-s", "--stats", action="store_false", default=True)
+    parser.add_argument("-c", "--compression", choices=sorted(dcs.mission.Compression.presets), default="default",
+                        help="Zip compression of the mission file, 'fast' for batch generation")
+    parser.add_argument("-o", "--output", help="Name and path of the generated mission", default=None)
+    batch.add_arguments(parser)
 
+    args = parser.parse_args()
+    if args.output is None:
+        args.output = os.path.join(os.path.expanduser("~"), "Saved Games\\DCS\\Missions\\oil_transport.miz")
+
+    batch.run(generate, args)
     return 0
 
+
 if __name__ == '__main__':
     sys.exit(main())
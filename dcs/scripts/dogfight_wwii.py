@@ -28,6 +28,8 @@ def main():
     parser.add_argument("-n", "--numberplanes", default=16, type=int, help="Count of planes per side")
     parser.add_argument("-t", "--terrain", choices=["caucasus", "nevada"], default='caucasus')
     parser.add_argument("-s", "--skill", choices=[x.value for x in dcs.unit.Skill], default=dcs.unit.Skill.Average.value)
+    parser.add_argument("-c", "--compression", choices=sorted(dcs.mission.Compression.presets), default="default",
+                        help="Zip compression of the mission file, 'fast' for batch generation")
     parser.add_argument("-o", "--output", help="Name and path of the generated mission", default=None)
 
     args = parser.parse_args()
@@ -127,7 +129,7 @@ There are {pc} planes in the air battling for life and death.""".format(
     m.set_description_redtask_text("Fight the other planes!")
     m.set_description_bluetask_text("Fight the other planes!")
 
-    m.save(args.output)
+    m.save(args.output, compression=dcs.mission.Compression.presets[args.compression])
 
     print("Mission created: " + args.output)
     return 0
@@ -424,8 +424,8 @@ KC-135 Tanker has TACAN 12X and KC-130 has TACAN 10X.""".format(
         pos = pos1.point_from_heading(80, 35 * 1000)
         self.add_sa6_site(russia, pos)
 
-    def save(self, filename, stats):
-        self.m.save(filename)
+    def save(self, filename, stats, compression="default"):
+        self.m.save(filename, compression=dcs.mission.Compression.presets[compression])
         if stats:
             self.m.print_stats(self.m.stats())
 
@@ -460,6 +460,8 @@ def main():
     parser.add_argument("-d", "--daytime", choices=["random", "day", "night", "dusk", "dawn", "noon"], default="random")
     parser.add_argument("-w", "--weather", choices=["dynamic", "dyncyclone", "dynanti", "dynone", "clear"], default="dynamic")
     parser.add_argument("-u", "--unhide", action="store_true", default=False, help="Show enemy pre mission")
+    parser.add_argument("-c", "--compression", choices=sorted(dcs.mission.Compression.presets), default="default",
+                        help="Zip compression of the mission file, 'fast' for batch generation")
     parser.add_argument("--show-stats", action="store_true", default=False, help="Show generated missions stats")
     parser.add_argument("-o", "--output", help="Name and path of the generated mission",
                         default=os.path.join(os.path.expanduser("~"), "Saved Games\\DCS\\Missions\\random.miz"))
@@ -472,7 +474,7 @@ def main():
     s.daytime(args.daytime)
     if args.weather == "dynamic":
         s.dynamic_weather(args.weather)
-    s.save(args.output, args.show_stats)
+    s.save(args.output, args.show_stats, args.compression)
 
     print("Mission created: " + args.output)
     return 0
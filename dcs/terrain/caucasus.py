@@ -14,9 +14,7 @@ class Anapa_Vityazevo(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Anapa_Vityazevo, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(220))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=1, position=mapping.Point(-4829.5249882422, 244622.06661236), large=False, heli=True,
@@ -305,9 +303,7 @@ class Krasnodar_Center(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Krasnodar_Center, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(90))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(10890.094726563, 368483.28125), large=False, heli=False,
@@ -488,9 +484,7 @@ class Novorossiysk(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Novorossiysk, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(220))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-40106.0234375, 279575.75), large=False, heli=True,
@@ -617,9 +611,7 @@ class Krymsk(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Krymsk, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(40))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-6138.9926757813, 295188.6875), large=False, heli=False,
@@ -803,9 +795,7 @@ class Maykop_Khanskaya(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Maykop_Khanskaya, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(40))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-26260.4609375, 459009.125), large=False, heli=True,
@@ -989,9 +979,7 @@ class Gelendzhik(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Gelendzhik, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(10))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-50574.20703125, 298005.59375), large=False, heli=True,
@@ -1043,9 +1031,7 @@ class Sochi_Adler(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Sochi_Adler, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(60))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-164362.125, 463237.3125), large=False, heli=False,
@@ -1262,9 +1248,7 @@ class Krasnodar_Pashkovsky(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Krasnodar_Pashkovsky, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(230))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(8852.1181640625, 388779.3125), large=False, heli=True,
@@ -1334,9 +1318,7 @@ class Sukhumi_Babushara(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Sukhumi_Babushara, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(300))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-219883.625, 563502.8125), large=False, heli=True,
@@ -1418,9 +1400,7 @@ class Gudauta(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Gudauta, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(150))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-196497.375, 515476.09375), large=False, heli=False,
@@ -1526,9 +1506,7 @@ class Batumi(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Batumi, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(310))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-356069.625, 618234.9375), large=False, heli=True,
@@ -1571,9 +1549,7 @@ class Senaki_Kolkhi(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Senaki_Kolkhi, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(270))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-281607.28417614, 646373.17498617), large=False, heli=True,
@@ -1790,9 +1766,7 @@ class Kobuleti(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Kobuleti, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(250))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-317882.375, 635012.9375), large=False, heli=True,
@@ -1931,9 +1905,7 @@ class Kutaisi(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Kutaisi, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(260))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-284604.78125, 682356.25), large=False, heli=True,
@@ -2120,9 +2092,7 @@ class Mineralnye_Vody(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Mineralnye_Vody, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(300))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-52132.26171875, 706676.875), large=False, heli=True,
@@ -2219,9 +2189,7 @@ class Nalchik(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Nalchik, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(60))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=1, position=mapping.Point(-125432.2109375, 760324.1875), large=False, heli=True,
@@ -2279,9 +2247,7 @@ class Mozdok(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Mozdok, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(260))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-84047.34375, 833973.125), large=False, heli=True,
@@ -2411,9 +2377,7 @@ class Tbilisi_Lochini(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Tbilisi_Lochini, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(130))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-315166.34375, 897212.4375), large=False, heli=True,
@@ -2648,9 +2612,7 @@ class Soganlug(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Soganlug, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(140))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-318023.51732654, 895394.57452592), large=False, heli=True,
@@ -2678,9 +2640,7 @@ class Vaziani(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Vaziani, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(130))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-318059.6875, 902639.0625), large=False, heli=False,
@@ -2969,9 +2929,7 @@ class Beslan(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Beslan, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(100))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-148875.828125, 844108.375), large=False, heli=True,
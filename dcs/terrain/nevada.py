@@ -13,9 +13,7 @@ class Creech_AFB(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Creech_AFB, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(80))
         self.runways.append(Runway(130))
         self.parking_slots.append(ParkingSlot(
@@ -182,9 +180,7 @@ class Groom_Lake_AFB(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Groom_Lake_AFB, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(320))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-287726.5625, -88658.625), large=False, heli=True,
@@ -353,9 +349,7 @@ class McCarran_International_Airport(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(McCarran_International_Airport, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(70))
         self.runways.append(Runway(70))
         self.parking_slots.append(ParkingSlot(
@@ -414,9 +408,7 @@ class Nellis_AFB(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Nellis_AFB, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(30))
         self.runways.append(Runway(30))
         self.parking_slots.append(ParkingSlot(
@@ -1171,9 +1163,7 @@ class Beatty_Airport(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Beatty_Airport, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(160))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-329737.78125, -174776.515625), large=False, heli=True,
@@ -1195,9 +1185,7 @@ class Boulder_City_Airport(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Boulder_City_Airport, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(330))
         self.runways.append(Runway(270))
         self.parking_slots.append(ParkingSlot(
@@ -1322,9 +1310,7 @@ class Echo_Bay(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Echo_Bay, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(60))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-388552.3125, 33604.30078125), large=False, heli=True,
@@ -1343,9 +1329,7 @@ class Henderson_Executive_Airport(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Henderson_Executive_Airport, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(350))
         self.runways.append(Runway(350))
         self.parking_slots.append(ParkingSlot(
@@ -1488,9 +1472,7 @@ class Jean_Airport(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Jean_Airport, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(200))
         self.runways.append(Runway(200))
         self.parking_slots.append(ParkingSlot(
@@ -1516,9 +1498,7 @@ class Laughlin_Airport(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Laughlin_Airport, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(160))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-516446.90625, 28580.93359375), large=False, heli=True,
@@ -1579,9 +1559,7 @@ class Lincoln_County(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Lincoln_County, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(170))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-224143.265625, 33338.26953125), large=False, heli=True,
@@ -1612,9 +1590,7 @@ class Mesquite(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Mesquite, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(10))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-329683.28125, 68345.796875), large=False, heli=False,
@@ -1660,9 +1636,7 @@ class Mina_Airport_3Q0(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Mina_Airport_3Q0, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(130))
 
 
@@ -1675,9 +1649,7 @@ class North_Las_Vegas(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(North_Las_Vegas, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(250))
         self.runways.append(Runway(300))
         self.runways.append(Runway(120))
@@ -1833,9 +1805,7 @@ class Pahute_Mesa_Airstrip(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Pahute_Mesa_Airstrip, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(360))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-303524.92167696, -133026.1164952), large=False, heli=True,
@@ -1863,9 +1833,7 @@ class Tonopah_Airport(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Tonopah_Airport, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(290))
         self.runways.append(Runway(330))
         self.parking_slots.append(ParkingSlot(
@@ -1954,9 +1922,7 @@ class Tonopah_Test_Range_Airfield(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Tonopah_Test_Range_Airfield, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(320))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-225679.28125, -174488.90625), large=False, heli=True,
@@ -13,9 +13,7 @@ class Saint_Pierre_du_Mont(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Saint_Pierre_du_Mont, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(90))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=1, position=mapping.Point(-11861.235351563, -46465.25390625), large=False, heli=True,
@@ -379,9 +377,7 @@ class Lignerolles(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Lignerolles, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(290))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-35437.69140625, -35072.56640625), large=False, heli=True,
@@ -592,9 +588,7 @@ class Cretteville(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Cretteville, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(130))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-19256.740234375, -77253.203125), large=False, heli=True,
@@ -775,9 +769,7 @@ class Maupertus(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Maupertus, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(100))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(15957.225585938, -84030.5546875), large=False, heli=True,
@@ -811,9 +803,7 @@ class Brucheville(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Brucheville, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(250))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-14501.358398438, -65514.94921875), large=False, heli=True,
@@ -1147,9 +1137,7 @@ class Meautis(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Meautis, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(260))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-24512.439453125, -71203.234375), large=False, heli=True,
@@ -1300,9 +1288,7 @@ class Cricqueville_en_Bessin(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Cricqueville_en_Bessin, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(350))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-15036.99609375, -51188.1875), large=False, heli=False,
@@ -1534,9 +1520,7 @@ class Lessay(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Lessay, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(60))
         self.runways.append(Runway(120))
         self.parking_slots.append(ParkingSlot(
@@ -1721,9 +1705,7 @@ class Sainte_Laurent_sur_Mer(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Sainte_Laurent_sur_Mer, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(290))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-14792.571289063, -40413.9765625), large=False, heli=True,
@@ -1862,9 +1844,7 @@ class Biniville(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Biniville, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(320))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-8033.611328125, -84135.671875), large=False, heli=True,
@@ -1973,9 +1953,7 @@ class Cardonville(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Cardonville, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(150))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-15586.537109375, -54800.81640625), large=False, heli=False,
@@ -2336,9 +2314,7 @@ class Deux_Jumeaux(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Deux_Jumeaux, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(100))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-16293.255859375, -48417.40234375), large=False, heli=False,
@@ -2669,9 +2645,7 @@ class Chippelle(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Chippelle, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(240))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-27995.6875, -47895.3359375), large=False, heli=False,
@@ -2798,9 +2772,7 @@ class Beuzeville(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Beuzeville, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(230))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-9549.2371128719, -72743.202755871), large=False, heli=True,
@@ -2921,9 +2893,7 @@ class Azeville(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Azeville, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(250))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-2123.7131347656, -73153.453125), large=False, heli=True,
@@ -3029,9 +2999,7 @@ class Picauville(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Picauville, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(290))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-11705.821289063, -80830.46875), large=False, heli=True,
@@ -3152,9 +3120,7 @@ class Le_Molay(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Le_Molay, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(40))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-25710.234375, -40841.69921875), large=False, heli=True,
@@ -3275,9 +3241,7 @@ class Longues_sur_Mer(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Longues_sur_Mer, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(300))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-16807.962890625, -28363.375), large=False, heli=True,
@@ -3428,9 +3392,7 @@ class Carpiquet(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Carpiquet, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(120))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-34197.03515625, -9833.6513671875), large=False, heli=True,
@@ -3584,9 +3546,7 @@ class Bazenville(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Bazenville, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(230))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-20335.234375, -18316.857421875), large=False, heli=True,
@@ -3779,9 +3739,7 @@ class Sainte_Croix_sur_Mer(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Sainte_Croix_sur_Mer, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(90))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-18935.797506538, -14425.181352241), large=False, heli=True,
@@ -3902,9 +3860,7 @@ class Beny_sur_Mer(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Beny_sur_Mer, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(170))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-20698.400390625, -8236.490234375), large=False, heli=False,
@@ -4064,9 +4020,7 @@ class Rucqueville(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Rucqueville, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(90))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-26680.033203125, -20166.484375), large=False, heli=True,
@@ -4199,9 +4153,7 @@ class Sommervieu(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Sommervieu, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(270))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-21503.513671875, -25766.630859375), large=False, heli=False,
@@ -4286,9 +4238,7 @@ class Lantheuil(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Lantheuil, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(240))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-24663.552734375, -16906.71875), large=False, heli=True,
@@ -4499,9 +4449,7 @@ class Evreux(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Evreux, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(160))
         self.runways.append(Runway(30))
         self.parking_slots.append(ParkingSlot(
@@ -4587,9 +4535,7 @@ class Chailey(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Chailey, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(170))
         self.runways.append(Runway(230))
         self.parking_slots.append(ParkingSlot(
@@ -4774,9 +4720,7 @@ class Needs_Oar_Point(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Needs_Oar_Point, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(340))
         self.runways.append(Runway(50))
         self.parking_slots.append(ParkingSlot(
@@ -4961,9 +4905,7 @@ class Funtington(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Funtington, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(190))
         self.runways.append(Runway(250))
         self.parking_slots.append(ParkingSlot(
@@ -5145,9 +5087,7 @@ class Tangmere(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Tangmere, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(290))
         self.runways.append(Runway(60))
         self.parking_slots.append(ParkingSlot(
@@ -5221,9 +5161,7 @@ class Ford_AF(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Ford_AF, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(270))
         self.runways.append(Runway(40))
         self.parking_slots.append(ParkingSlot(
@@ -5297,9 +5235,7 @@ class Argentan(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Argentan, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(300))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-78984.9453125, 23166.23046875), large=False, heli=True,
@@ -5408,9 +5344,7 @@ class Goulet(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Goulet, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(30))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-81659.4765625, 16622.775390625), large=False, heli=True,
@@ -5519,9 +5453,7 @@ class Barville(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Barville, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(100))
         self.runways.append(Runway(330))
         self.parking_slots.append(ParkingSlot(
@@ -5586,9 +5518,7 @@ class Essay(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Essay, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(270))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-105499.4375, 45538.40234375), large=False, heli=True,
@@ -5697,9 +5627,7 @@ class Hauterive(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Hauterive, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(140))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-107626.625, 40475.87109375), large=False, heli=True,
@@ -5808,9 +5736,7 @@ class Vrigny(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Vrigny, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(140))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-89126.6328125, 24743.80078125), large=False, heli=True,
@@ -5919,9 +5845,7 @@ class Conches(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Conches, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(40))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-57231.17578125, 95025.9140625), large=False, heli=True,
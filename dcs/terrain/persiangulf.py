@@ -13,9 +13,7 @@ class Abu_Musa_Island_Airport(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Abu_Musa_Island_Airport, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(80))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=1, position=mapping.Point(-31265.763702393, -121984.875), large=False, heli=True,
@@ -52,9 +50,7 @@ class Bandar_Abbas_Intl(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Bandar_Abbas_Intl, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(30))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(117866.46875, 15125.918945312), large=False, heli=True,
@@ -217,9 +213,7 @@ class Bandar_Lengeh(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Bandar_Lengeh, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(80))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(41385.64441061, -140533.0625), large=False, heli=False,
@@ -247,9 +241,7 @@ class Al_Dhafra_AB(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Al_Dhafra_AB, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(130))
         self.runways.append(Runway(130))
         self.parking_slots.append(ParkingSlot(
@@ -1013,9 +1005,7 @@ class Dubai_Intl(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Dubai_Intl, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(300))
         self.runways.append(Runway(300))
         self.parking_slots.append(ParkingSlot(
@@ -1317,9 +1307,7 @@ class Al_Maktoum_Intl(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Al_Maktoum_Intl, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(300))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-140247.46875, -111218.859375), large=False, heli=True,
@@ -1539,9 +1527,7 @@ class Fujairah_Intl(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Fujairah_Intl, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(290))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-117293.855896, 8304.8382568359), large=False, heli=True,
@@ -1566,9 +1552,7 @@ class Tunb_Island_AFB(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Tunb_Island_AFB, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(30))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(10327.60546875, -92808.609375), large=False, heli=False,
@@ -1593,9 +1577,7 @@ class Havadarya(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Havadarya, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(260))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(109336.5078125, -6856.7319335937), large=False, heli=True,
@@ -1674,9 +1656,7 @@ class Khasab(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Khasab, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(190))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-1017.2598266602, -602.64483642578), large=False, heli=True,
@@ -1725,9 +1705,7 @@ class Lar_Airbase(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Lar_Airbase, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(90))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(168556.390625, -182527.234375), large=False, heli=True,
@@ -1755,9 +1733,7 @@ class Al_Minhad_AB(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Al_Minhad_AB, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(270))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-126253.08361816, -89660.172302246), large=False, heli=True,
@@ -1956,9 +1932,7 @@ class Qeshm_Island(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Qeshm_Island, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(230))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(65148.21875, -33696.6328125), large=False, heli=True,
@@ -2007,9 +1981,7 @@ class Sharjah_Intl(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Sharjah_Intl, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(300))
         self.runways.append(Runway(300))
         self.parking_slots.append(ParkingSlot(
@@ -2164,9 +2136,7 @@ class Sirri_Island(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Sirri_Island, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(300))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-27713.302612305, -170052.375), large=False, heli=True,
@@ -2185,9 +2155,7 @@ class Tunb_Kochak(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Tunb_Kochak, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(260))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(8992.48046875, -109345.625), large=False, heli=False,
@@ -2206,9 +2174,7 @@ class Sir_Abu_Nuayr(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Sir_Abu_Nuayr, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(280))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-103019.671875, -203136.546875), large=False, heli=True,
@@ -2233,9 +2199,7 @@ class Kerman_Airport(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Kerman_Airport, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(340))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(452845.03125, 71861.46875), large=False, heli=True,
@@ -2374,9 +2338,7 @@ class Shiraz_International_Airport(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Shiraz_International_Airport, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(290))
         self.runways.append(Runway(290))
         self.parking_slots.append(ParkingSlot(
@@ -2747,9 +2709,7 @@ class Sas_Al_Nakheel_Airport(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Sas_Al_Nakheel_Airport, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(160))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-189181.953125, -176242.125), large=False, heli=True,
@@ -3023,9 +2983,7 @@ class Bandar_e_Jask_airfield(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Bandar_e_Jask_airfield, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(60))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-57597.375, 154792.71875), large=False, heli=False,
@@ -3050,9 +3008,7 @@ class Abu_Dhabi_International_Airport(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Abu_Dhabi_International_Airport, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(130))
         self.runways.append(Runway(310))
         self.runways.append(Runway(130))
@@ -3445,9 +3401,7 @@ class Al_Bateen_Airport(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Al_Bateen_Airport, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(130))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-190337.921875, -183074.21875), large=False, heli=False,
@@ -3604,9 +3558,7 @@ class Kish_International_Airport(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Kish_International_Airport, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(100))
         self.runways.append(Runway(100))
         self.parking_slots.append(ParkingSlot(
@@ -3758,9 +3710,7 @@ class Al_Ain_International_Airport(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Al_Ain_International_Airport, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(190))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-209643.34375, -64532.62890625), large=False, heli=False,
@@ -3995,9 +3945,7 @@ class Lavan_Island_Airport(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Lavan_Island_Airport, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(110))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(75569.2578125, -286948.1875), large=False, heli=False,
@@ -4019,9 +3967,7 @@ class Jiroft_Airport(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Jiroft_Airport, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(130))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(282949.9375, 141762.96875), large=False, heli=False,
@@ -4043,9 +3989,7 @@ class Ras_Al_Khaimah(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Ras_Al_Khaimah, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(350))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-61266.63671875, -30535.681640625), large=False, heli=True,
@@ -4112,9 +4056,7 @@ class Liwa_Airbase(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Liwa_Airbase, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(130))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-275178.9375, -249924.1875), large=False, heli=True,
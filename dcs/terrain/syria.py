@@ -13,9 +13,7 @@ class Abu_al_Duhur(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Abu_al_Duhur, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(90))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(76278.421875, 112793.0546875), large=False, heli=True,
@@ -136,9 +134,7 @@ class Adana_Sakirpasa(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Adana_Sakirpasa, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(50))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(219900.5625, -46846.515625), large=False, heli=True,
@@ -268,9 +264,7 @@ class Al_Qusayr(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Al_Qusayr, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(100))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-52056.5390625, 61770.86328125), large=False, heli=False,
@@ -385,9 +379,7 @@ class An_Nasiriyah(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(An_Nasiriyah, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(40))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-123598.6015625, 86827.671875), large=False, heli=False,
@@ -460,9 +452,7 @@ class Beirut_Rafic_Hariri(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Beirut_Rafic_Hariri, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(350))
         self.runways.append(Runway(210))
         self.runways.append(Runway(340))
@@ -555,9 +545,7 @@ class Damascus(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Damascus, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(230))
         self.runways.append(Runway(230))
         self.parking_slots.append(ParkingSlot(
@@ -784,9 +772,7 @@ class Marj_as_Sultan_South(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Marj_as_Sultan_South, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(270))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-171652.453125, 48101.5703125), large=False, heli=True,
@@ -859,9 +845,7 @@ class Al_Dumayr(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Al_Dumayr, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(240))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-158242.609375, 75715.703125), large=False, heli=False,
@@ -1045,9 +1029,7 @@ class Eyn_Shemer(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Eyn_Shemer, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(270))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-283520.1875, -92408.5234375), large=False, heli=True,
@@ -1075,9 +1057,7 @@ class Haifa(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Haifa, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(340))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-242233.8125, -87917.359375), large=False, heli=True,
@@ -1135,9 +1115,7 @@ class Hama(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Hama, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(90))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(8969.19140625, 73061.1796875), large=False, heli=True,
@@ -1288,9 +1266,7 @@ class Hatay(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Hatay, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(40))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(147685.390625, 38910.453125), large=False, heli=True,
@@ -1333,9 +1309,7 @@ class Incirlik(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Incirlik, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(230))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(221611.15625, -35769.90625), large=False, heli=True,
@@ -1708,9 +1682,7 @@ class Jirah(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Jirah, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(100))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(115251.65625, 188431.671875), large=False, heli=True,
@@ -1807,9 +1779,7 @@ class Khalkhalah(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Khalkhalah, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(250))
         self.runways.append(Runway(330))
         self.parking_slots.append(ParkingSlot(
@@ -1988,9 +1958,7 @@ class King_Hussein_Air_College(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(King_Hussein_Air_College, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(130))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-296638.53473556, 24180.32848277), large=False, heli=True,
@@ -2159,9 +2127,7 @@ class Kiryat_Shmona(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Kiryat_Shmona, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(210))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-199734.36850518, -34826.638614409), large=False, heli=True,
@@ -2189,9 +2155,7 @@ class Bassel_Al_Assad(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Bassel_Al_Assad, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(350))
         self.runways.append(Runway(350))
         self.parking_slots.append(ParkingSlot(
@@ -2367,9 +2331,7 @@ class Marj_as_Sultan_North(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Marj_as_Sultan_North, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(260))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=1, position=mapping.Point(-170310.71875, 47426.27734375), large=False, heli=True,
@@ -2424,9 +2386,7 @@ class Marj_Ruhayyil(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Marj_Ruhayyil, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(240))
         self.runways.append(Runway(240))
         self.parking_slots.append(ParkingSlot(
@@ -2539,9 +2499,7 @@ class Megiddo(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Megiddo, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(270))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=1, position=mapping.Point(-266866.625, -70705.734375), large=False, heli=True,
@@ -2584,9 +2542,7 @@ class Mezzeh(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Mezzeh, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(60))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-171953.0625, 25448.78515625), large=False, heli=True,
@@ -2665,9 +2621,7 @@ class Minakh(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Minakh, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(280))
         self.runways.append(Runway(220))
         self.parking_slots.append(ParkingSlot(
@@ -2741,9 +2695,7 @@ class Aleppo(Airport):
     civilian = True
     slot_version = 2
 
-    def __init__(self):
-        super(Aleppo, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(270))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(125126.828125, 124845.09375), large=False, heli=False,
@@ -2822,9 +2774,7 @@ class Palmyra(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Palmyra, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(80))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-55613.91796875, 218666.296875), large=False, heli=False,
@@ -2903,9 +2853,7 @@ class Qabr_as_Sitt(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Qabr_as_Sitt, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(60))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-174752.078125, 37094.52734375), large=False, heli=True,
@@ -2945,9 +2893,7 @@ class Ramat_David(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Ramat_David, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(270))
         self.runways.append(Runway(330))
         self.runways.append(Runway(290))
@@ -3088,9 +3034,7 @@ class Kuweires(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Kuweires, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(280))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(125533.8359375, 154375.15625), large=False, heli=True,
@@ -3214,9 +3158,7 @@ class Rayak(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Rayak, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(220))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-129373.9453125, 5490.4599609375), large=False, heli=True,
@@ -3265,9 +3207,7 @@ class Rene_Mouawad(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Rene_Mouawad, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(240))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-47948.4140625, 8702.654296875), large=False, heli=True,
@@ -3319,9 +3259,7 @@ class Tabqa(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Tabqa, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(270))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(77222.4296875, 244747.015625), large=False, heli=False,
@@ -3421,9 +3359,7 @@ class Taftanaz(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Taftanaz, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(100))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(103153.359375, 82645.1953125), large=False, heli=True,
@@ -3580,9 +3516,7 @@ class Wujah_Al_Hajar(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Wujah_Al_Hajar, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(20))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(-81061.453125, -22970.05078125), large=False, heli=True,
@@ -5,11 +5,11 @@ import dcs.point as point
 import dcs.unittype as unittype
 import dcs.weather as weather
 
+import heapq
 import random
 import pickle
-import sys
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple, Set, Type
+from typing import List, Dict, Iterable, Optional, Tuple, Set, Type
 from collections import defaultdict, deque
 
 
@@ -34,15 +34,129 @@ class ParkingSlot:
         self.airplanes = airplanes
         self.large = large
         self.shelter = shelter
-        self.unit_id = None  # type: Optional[int]
+        # notified when the slot becomes free again, see ParkingSlotAllocator
+        self._allocator = None  # type: Optional[ParkingSlotAllocator]
+        self._unit_id = None  # type: Optional[int]
         self.slot_name = slot_name
 
+    @property
+    def unit_id(self) -> Optional[int]:
+        """Id of the unit parked on this slot, None if the slot is free."""
+        return self._unit_id
+
+    @unit_id.setter
+    def unit_id(self, unit_id: Optional[int]):
+        released = unit_id is None and self._unit_id is not None
+        self._unit_id = unit_id
+        if released and self._allocator is not None:
+            self._allocator.release(self)
+
+    def copy(self) -> "ParkingSlot":
+        """Returns a free slot sharing the static data of this slot."""
+        slot = self.__class__.__new__(self.__class__)
+        slot.__dict__.update(self.__dict__)
+        slot._allocator = None
+        slot._unit_id = None
+        return slot
+
     def __repr__(self):
         return 'ParkingSlot({id}, "{name}", large={large}, heli={heli})'.format(
             id=self.crossroad_idx, name=self.slot_name, large=self.large, heli=self.helicopter
         )
 
 
+class ParkingSlotAllocator:
+    """Free parking slots of an airport, bucketed and sorted once.
+
+    Slots of version 1 airports are bucketed by their size category,
+    version 2 slots by their dimensions and helicopter flag. Each bucket
+    is a heap in the order free slots are handed out. Slots are taken by setting
+    ParkingSlot.unit_id, taken slots are removed from the heaps when they
+    come up, released slots are pushed back by the unit_id setter.
+
+    Args:
+        slots: parking slots of the airport
+        slot_version: slot resolution version of the airport
+    """
+    _LARGE = 2
+    _HELICOPTER = 1
+    _PLANE = 0
+
+    def __init__(self, slots: List[ParkingSlot], slot_version: int):
+        self.slots = slots
+        self.size = len(slots)
+        self.slot_version = slot_version
+        self.by_crossroad_idx = {}  # type: Dict[int, ParkingSlot]
+        # slot id to its index, the index is the last element of the sort key
+        self._index = {}  # type: Dict[int, int]
+        self._entries = []  # type: List[Tuple[tuple, tuple]]
+        self._buckets = {}  # type: Dict[tuple, List[tuple]]
+        self._queued = set()  # type: Set[int]
+
+        for i, slot in enumerate(slots):
+            self.by_crossroad_idx.setdefault(slot.crossroad_idx, slot)
+            self._index[id(slot)] = i
+            self._entries.append(self._entry(slot, i))
+            self._buckets.setdefault(self._entries[i][0], [])
+            slot._allocator = self
+            if slot.unit_id is None:
+                self._push(i)
+        self._ordered = sorted(range(len(slots)), key=lambda x: self._entries[x][1])
+
+    def _entry(self, slot: ParkingSlot, i: int) -> Tuple[tuple, tuple]:
+        # bucket key and sort key, free slots are handed out in the order of their sort key
+        if self.slot_version == 1:
+            if slot.large:
+                category = self._LARGE
+            elif slot.helicopter:
+                category = self._HELICOPTER
+            else:
+                category = self._PLANE
+            return (category,), (category, slot.slot_name, i)
+        return (slot.helicopter, slot.width, slot.height, slot.length), (slot.helicopter, slot.slot_name, i)
+
+    def _push(self, i: int):
+        if i not in self._queued:
+            bucket, key = self._entries[i]
+            heapq.heappush(self._buckets[bucket], key)
+            self._queued.add(i)
+
+    def _fits(self, bucket: tuple, aircraft_type: Type[unittype.FlyingType]) -> bool:
+        if self.slot_version == 1:
+            if aircraft_type.large_parking_slot:
+                return bucket[0] == self._LARGE
+            if aircraft_type.helicopter:
+                return bucket[0] != self._PLANE
+            return True
+        helicopter, width, height, length = bucket
+        return (aircraft_type.width < width and
+                aircraft_type.height < (height or 1000) and
+                aircraft_type.length < length and
+                (helicopter or not aircraft_type.helicopter))
+
+    def release(self, slot: ParkingSlot):
+        """Puts a slot that became free back into its bucket."""
+        i = self._index.get(id(slot))
+        if i is not None and self.slots[i] is slot:
+            self._push(i)
+
+    def free_slot(self, aircraft_type: Type[unittype.FlyingType]) -> Optional[ParkingSlot]:
+        best = None
+        for bucket, heap in self._buckets.items():
+            if not self._fits(bucket, aircraft_type):
+                continue
+            while heap and self.slots[heap[0][-1]].unit_id is not None:
+                self._queued.discard(heapq.heappop(heap)[-1])
+            if heap and (best is None or heap[0] < best):
+                best = heap[0]
+        return self.slots[best[-1]] if best is not None else None
+
+    def free_slots(self, aircraft_type: Type[unittype.FlyingType]) -> List[ParkingSlot]:
+        buckets = {x for x in self._buckets if self._fits(x, aircraft_type)}
+        return [self.slots[i] for i in self._ordered
+                if self.slots[i].unit_id is None and self._entries[i][0] in buckets]
+
+
 class Runway:
     def __init__(self, heading, ils=None, leftright=0):
         """
@@ -78,9 +192,15 @@ class Airport:
     slot_version = 1
 
     def __init__(self):
+        static = self._static()
+        # set by the AirportIndex of the terrain, notified about coalition changes
+        self._index = None  # type: Optional[AirportIndex]
         self.runway_used = None
-        self.runways = []  # type: List[Runway]
-        self.parking_slots = []  # type: List[ParkingSlot]
+        self.runways = list(static.runways)  # type: List[Runway]
+        # copied from the static slots on first access, see parking_slots
+        self._parking_slots = None  # type: Optional[List[ParkingSlot]]
+        self._parking_allocator = None  # type: Optional[ParkingSlotAllocator]
+        self.unit_zones = []  # type: List[mapping.Rectangle]
 
         # warehouse values
         self.coalition = "NEUTRAL"
@@ -101,6 +221,47 @@ class Airport:
         self.diesel_init = 100
         self.jet_init = 100
 
+    @classmethod
+    def _static(cls) -> "Airport":
+        """Airport instance holding the static runway and parking data of this class.
+
+        It is built once per process by load_static and shared by all instances,
+        these only keep the mission state like slot occupancy, coalition and warehouse values.
+        """
+        static = cls.__dict__.get("_static_airport")
+        if static is None:
+            static = cls.__new__(cls)
+            static.runways = []
+            static._parking_slots = []
+            static.load_static()
+            cls._static_airport = static
+        return static
+
+    def load_static(self):
+        """Adds the runways and parking slots of the airport, overwritten by the terrain airports."""
+        pass
+
+    @property
+    def parking_slots(self) -> List[ParkingSlot]:
+        if self._parking_slots is None:
+            self._parking_slots = [x.copy() for x in self._static().parking_slots]
+        return self._parking_slots
+
+    @parking_slots.setter
+    def parking_slots(self, slots: List[ParkingSlot]):
+        self._parking_slots = slots
+
+    @property
+    def coalition(self) -> str:
+        return self._coalition
+
+    @coalition.setter
+    def coalition(self, coalition: str):
+        previous = self.__dict__.get("_coalition")
+        self._coalition = coalition
+        if self._index is not None and previous != coalition:
+            self._index.coalition_changed(previous, coalition)
+
     def load_from_dict(self, d):
         self.coalition = d["coalition"]
         self.speed = d["speed"]
@@ -153,6 +314,15 @@ class Airport:
         self.runway_used = group
         return self.runway_used
 
+    def parking_allocator(self) -> ParkingSlotAllocator:
+        """Index of the parking slots, built on first use and again if the slot list changed."""
+        slots = self.parking_slots
+        allocator = self._parking_allocator
+        if allocator is None or allocator.slots is not slots or allocator.size != len(slots):
+            allocator = ParkingSlotAllocator(slots, self.slot_version)
+            self._parking_allocator = allocator
+        return allocator
+
     def parking_slot(self, index: int) -> Optional[ParkingSlot]:
         """Searches the parking slot with the given crossroad index.
 
@@ -162,10 +332,7 @@ class Airport:
         Returns:
             ParkingSlot: the found slot or None if not found.
         """
-        for x in self.parking_slots:
-            if x.crossroad_idx == index:
-                return x
-        return None
+        return self.parking_allocator().by_crossroad_idx.get(index)
 
     def clear_parking_slot(self, index: int) -> bool:
         slot = self.parking_slot(index)
@@ -175,53 +342,11 @@ class Airport:
 
         return False
 
-    def _free_parking_slots_resolve_v1(self, large: bool, helicopter: bool) -> List[ParkingSlot]:
-        slots_index = range(0, len(self.parking_slots))
-        free_large_slots = {x for x in slots_index
-                            if self.parking_slots[x].unit_id is None and
-                            self.parking_slots[x].large}
-
-        large_slots = sorted([self.parking_slots[x] for x in free_large_slots], key=lambda x: x.slot_name)
-        if large:
-            return large_slots
-
-        free_heli_slots = {x for x in slots_index
-                           if self.parking_slots[x].unit_id is None and
-                           self.parking_slots[x].helicopter and not self.parking_slots[x].large}
-
-        heli_slots = sorted([self.parking_slots[x] for x in free_heli_slots], key=lambda x: x.slot_name)
-        if helicopter:
-            return heli_slots + large_slots
-
-        free_slots = list(self.parking_slots[x] for x in slots_index if self.parking_slots[x].unit_id is None and
-                          not self.parking_slots[x].large and not self.parking_slots[x].helicopter)
-        free_slots = sorted(free_slots, key=lambda x: x.slot_name)
-        return free_slots + heli_slots + large_slots
-
-    def _free_parking_slots_resolve_v2(self, aircraft_type: unittype.FlyingType) -> List[ParkingSlot]:
-        free_slots = [x for x in self.parking_slots
-                      if x.unit_id is None and
-                      aircraft_type.width < x.width and
-                      aircraft_type.height < (x.height or 1000) and
-                      aircraft_type.length < x.length]
-
-        if aircraft_type.helicopter:
-            free_slots = [x for x in free_slots if x.helicopter]
-
-        slots_sorted = sorted(free_slots, key=lambda x: (x.helicopter, x.slot_name))
-        return slots_sorted
-
     def free_parking_slots(self, aircraft_type: unittype.FlyingType) -> List[ParkingSlot]:
-        if self.slot_version == 1:
-            return self._free_parking_slots_resolve_v1(aircraft_type.large_parking_slot, aircraft_type.helicopter)
-        else:
-            return self._free_parking_slots_resolve_v2(aircraft_type)
+        return self.parking_allocator().free_slots(aircraft_type)
 
     def free_parking_slot(self, aircraft_type: Type[unittype.FlyingType]) -> Optional[ParkingSlot]:
-        slots = self.free_parking_slots(aircraft_type)
-        if slots:
-            return slots[0]
-        return None
+        return self.parking_allocator().free_slot(aircraft_type)
 
     def dict(self):
         d = {
@@ -281,21 +406,53 @@ class Node:
 class Graph:
     Edge_indicators = {'N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW'}
 
+    # number of origins whose shortest paths are kept, see _dijkstra
+    path_cache_size = 256
+
     def __init__(self):
         self.nodes = set()
         self.edges = defaultdict(list)
         self.edge_properties = {}
+        self._clear_cache()
+
+    def _clear_cache(self):
+        # derived from nodes, edges and edge_properties, rebuilt on demand
+        self._node_map = None  # type: Optional[Dict[str, Node]]
+        self._adjacency = None  # type: Optional[Dict[str, List[Tuple[str, int, bool]]]]
+        self._path_cache = {}  # type: Dict[str, Tuple[Dict[str, int], Dict[str, str]]]
+        self._spatial_index = None  # type: Optional[mapping.KDTree]
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for x in ("_node_map", "_adjacency", "_path_cache", "_spatial_index"):
+            state.pop(x, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._clear_cache()
 
     def node(self, node_name) -> Node:
-        for x in self.nodes:
-            if x.name == node_name:
-                return x
-        raise RuntimeError('Node not found: ' + node_name)
+        if self._node_map is None:
+            self._node_map = {x.name: x for x in self.nodes}
+        try:
+            return self._node_map[node_name]
+        except KeyError:
+            raise RuntimeError('Node not found: ' + node_name)
 
     def node_names(self) -> Set[str]:
         return {x.name for x in self.nodes}
 
-    def nearest_node(self, position: mapping.Point):
+    def spatial_index(self) -> mapping.KDTree:
+        """KD-tree of the nodes, built on first use and dropped when a node is added.
+
+        Node positions must not be changed after the tree was built.
+        """
+        if self._spatial_index is None:
+            self._spatial_index = mapping.KDTree(self.nodes)
+        return self._spatial_index
+
+    def nearest_node(self, position: mapping.Point) -> Optional[Node]:
         """Find nearest node to the given point.
 
         Args:
@@ -304,27 +461,36 @@ class Graph:
         Returns:
             The nearest node to the that point
         """
-        dist = sys.float_info.max
-        node = None
-        for x in self.nodes:
-            d = position.distance_to_point(x.position)
-            if d < dist:
-                node = x
-                dist = d
+        return self.spatial_index().nearest(position)
+
+    def nearest_nodes(self, position: mapping.Point, count: int) -> List[Node]:
+        """Find the nearest nodes to the given point.
+
+        Args:
+            position: Point to find the nearest
+            count: number of nodes to return
+
+        Returns:
+            Up to count nodes, ordered by their distance to the point
+        """
+        return self.spatial_index().k_nearest(position, count)
 
-        return node
+    def nodes_in_radius(self, position: mapping.Point, distance) -> List[Node]:
+        """Returns all nodes closer than distance to the given point."""
+        return self.spatial_index().within_distance(position, distance)
 
     def rated_nodes(self, min_rating=0) -> Set[Node]:
         return {x for x in self.nodes if x.rating and x.rating > min_rating}
 
     def nodes_within(self, polygon: mapping.Polygon) -> List[Node]:
-        return [x for x in self.nodes if polygon.point_in_poly(x.position)]
+        return self.spatial_index().within_polygon(polygon)
 
     def rated_nodes_within(self, polygon: mapping.Polygon, min_rating=0) -> List[Node]:
-        return [x for x in self.rated_nodes(min_rating) if polygon.point_in_poly(x.position)]
+        return [x for x in self.nodes_within(polygon) if x.rating and x.rating > min_rating]
 
     def add_node(self, node: Node):
         self.nodes.add(node)
+        self._clear_cache()
 
     def add_edge(self, from_node: Node, to_node: Node, distance: int, on_road: bool = True):
         if to_node.name not in self.edges[from_node.name]:
@@ -332,41 +498,62 @@ class Graph:
         if from_node.name not in self.edges[to_node.name]:
             self.edges[to_node.name].append(from_node.name)
         self.edge_properties[(from_node.name, to_node.name)] = (distance, on_road)
+        self._clear_cache()
 
     @staticmethod
     def from_pickle(pickle_file):
         with open(pickle_file, 'rb') as f:
             return pickle.load(f)
 
+    def adjacency(self) -> Dict[str, List[Tuple[str, int, bool]]]:
+        """Neighbours and edge properties of every node.
+
+        Only edges with properties in that direction are included, the
+        reverse direction of an edge is only traversable if it was added too.
+
+        Returns:
+            dict of node name to a list of (neighbour name, distance, on_road)
+        """
+        if self._adjacency is None:
+            adjacency = {}  # type: Dict[str, List[Tuple[str, int, bool]]]
+            for name in self.edges:
+                adjacency[name] = [(x,) + self.edge_properties[(name, x)] for x in self.edges[name]
+                                   if (name, x) in self.edge_properties]
+            self._adjacency = adjacency
+        return self._adjacency
+
     def _dijkstra(self, initial):
+        """Distances and predecessors of all nodes reachable from initial.
+
+        Results are cached per origin until a node or edge is added,
+        they must not be modified.
+        """
+        cached = self._path_cache.get(initial)
+        if cached is not None:
+            return cached
+
+        adjacency = self.adjacency()
         visited = {initial: 0}
         path = {}
+        done = set()
+        queue = [(0, initial)]
+
+        while queue:
+            current_weight, min_node = heapq.heappop(queue)
+            if min_node in done:
+                continue
+            done.add(min_node)
 
-        nodes = self.node_names()
-
-        while nodes:
-            min_node = None
-            for node in nodes:
-                if node in visited:
-                    if min_node is None:
-                        min_node = node
-                    elif visited[node] < visited[min_node]:
-                        min_node = node
-            if min_node is None:
-                break
-
-            nodes.remove(min_node)
-            current_weight = visited[min_node]
-
-            for edge in self.edges[min_node]:
-                try:
-                    weight = current_weight + self.edge_properties[(min_node, edge)][0]
-                except KeyError:
-                    continue
+            for edge, distance, _ in adjacency.get(min_node, ()):
+                weight = current_weight + distance
                 if edge not in visited or weight < visited[edge]:
                     visited[edge] = weight
                     path[edge] = min_node
+                    heapq.heappush(queue, (weight, edge))
 
+        if len(self._path_cache) >= self.path_cache_size:
+            del self._path_cache[next(iter(self._path_cache))]
+        self._path_cache[initial] = (visited, path)
         return visited, path
 
     def shortest_path(self, origin, destination) -> Tuple[int, List[str]]:
@@ -383,8 +570,114 @@ class Graph:
 
         return visited[destination], list(full_path)
 
-    def travel(self, vehicle_group, from_node: Node, to_node: Node, speed=32):
-        distance, path = self.shortest_path(from_node.name, to_node.name)
+    def _search(self, origin: str, destinations: Set[str], off_road_factor: float, heuristic=None):
+        """Searches from origin until all destinations are reached or no node is left.
+
+        Edges that are not on road weigh off_road_factor times their distance.
+        Nodes are expanded by their weight plus heuristic(node), a function that
+        must not overestimate the remaining weight to a destination.
+
+        Returns:
+            tuple of distance and predecessor dict of the reached nodes
+        """
+        adjacency = self.adjacency()
+        weights = {origin: 0}
+        distances = {origin: 0}
+        path = {}
+        done = set()
+        remaining = set(destinations)
+        queue = [(heuristic(origin) if heuristic else 0, origin)]
+
+        while queue and remaining:
+            _, min_node = heapq.heappop(queue)
+            if min_node in done:
+                continue
+            done.add(min_node)
+            remaining.discard(min_node)
+
+            current_weight = weights[min_node]
+            for edge, distance, on_road in adjacency.get(min_node, ()):
+                weight = current_weight + (distance if on_road else distance * off_road_factor)
+                if edge not in weights or weight < weights[edge]:
+                    weights[edge] = weight
+                    distances[edge] = distances[min_node] + distance
+                    path[edge] = min_node
+                    heapq.heappush(queue, (weight + heuristic(edge) if heuristic else weight, edge))
+
+        return distances, path
+
+    @staticmethod
+    def _route(origin: str, destination: str, path: Dict[str, str]) -> List[str]:
+        route = [destination]
+        while route[-1] != origin:
+            route.append(path[route[-1]])
+        route.reverse()
+        return route
+
+    def astar(self, origin: str, destination: str, off_road_factor: float = 1.0) -> Tuple[int, List[str]]:
+        """Finds the route between two nodes with A*.
+
+        The straight line distance between the node positions is used as heuristic,
+        edge distances of the city graphs are the straight line distances of their nodes,
+        so the found route is the shortest one.
+
+        Args:
+            origin: name of the start node
+            destination: name of the target node
+            off_road_factor: edges that are not on road count this many times their distance,
+                values above 1 prefer roads
+
+        Returns:
+            distance and node names of the route
+
+        Raises:
+            KeyError: if destination can not be reached from origin
+        """
+        target = self.node(destination).position
+        scale = min(1.0, off_road_factor)
+
+        def heuristic(name):
+            return self.node(name).position.distance_to_point(target) * scale
+
+        distances, path = self._search(origin, {destination}, off_road_factor, heuristic)
+        return distances[destination], self._route(origin, destination, path)
+
+    def routes(self, origin: str, destinations: Iterable[str],
+               off_road_factor: float = 1.0) -> Dict[str, Tuple[int, List[str]]]:
+        """Finds the routes from one node to many in a single search.
+
+        Args:
+            origin: name of the start node
+            destinations: names of the target nodes
+            off_road_factor: edges that are not on road count this many times their distance,
+                values above 1 prefer roads
+
+        Returns:
+            dict of destination name to distance and node names of its route,
+            destinations that can not be reached are left out
+        """
+        destinations = set(destinations)
+        distances, path = self._search(origin, destinations, off_road_factor)
+        return {x: (distances[x], self._route(origin, x, path)) for x in destinations if x in distances}
+
+    def travel(self, vehicle_group, from_node: Node, to_node: Node, speed=32, off_road_factor: float = None):
+        """Adds waypoints along the route between two nodes to vehicle_group.
+
+        Args:
+            vehicle_group: group to move
+            from_node: start node, the group should already be there
+            to_node: destination node
+            speed: speed of the waypoints in km/h
+            off_road_factor: if set, the route is found by astar with this factor,
+                otherwise the shortest path is used
+
+        Returns:
+            distance and node names of the route
+        """
+        if off_road_factor is None:
+            distance, path = self.shortest_path(from_node.name, to_node.name)
+        else:
+            distance, path = self.astar(from_node.name, to_node.name, off_road_factor)
         last = path[0]
         for p in path[1:]:
             current_node = self.node(p)
@@ -414,6 +707,40 @@ class Graph:
         return s
 
 
+class AirportIndex:
+    """Lookup structures for the airports of a terrain, see Terrain.airport_index.
+
+    The per coalition views are updated when the coalition of an airport changes.
+
+    Args:
+        airports: airports of the terrain
+    """
+    def __init__(self, airports: Iterable[Airport]):
+        self.airports = list(airports)
+        self.by_id = {}  # type: Dict[int, Airport]
+        for x in self.airports:
+            self.by_id.setdefault(x.id, x)
+            x._index = self
+        self.tree = mapping.KDTree(self.airports)
+        # lower case coalition to the airports of that coalition and their KD-tree
+        self._coalitions = {}  # type: Dict[str, Tuple[List[Airport], mapping.KDTree]]
+
+    def coalition(self, coalition: str) -> Tuple[List[Airport], mapping.KDTree]:
+        """Airports of a coalition in terrain order and their KD-tree."""
+        key = coalition.lower()
+        view = self._coalitions.get(key)
+        if view is None:
+            airports = [x for x in self.airports if x.coalition.lower() == key]
+            view = (airports, mapping.KDTree(airports))
+            self._coalitions[key] = view
+        return view
+
+    def coalition_changed(self, previous: Optional[str], coalition: str):
+        if previous is not None:
+            self._coalitions.pop(previous.lower(), None)
+        self._coalitions.pop(coalition.lower(), None)
+
+
 class Terrain:
     bounds = None  # type: mapping.Rectangle
     map_view_default = None  # type: MapView
@@ -440,6 +767,7 @@ class Terrain:
         self.bullseye_blue = {"x": 0, "y": 0}
         self.bullseye_red = {"x": 0, "y": 0}
         self.airports = {}  # type: Dict[str,Airport]
+        self._airport_index = None  # type: Optional[AirportIndex]
 
     def weather(self, dt: datetime, weather_: weather.Weather):
         # check if there might be the season for thunderstorms
@@ -451,29 +779,45 @@ class Terrain:
         weather_.dynamic_weather(random.choice(list(weather.Weather.BaricSystem)), random.randint(1, 4))
         return self.random_season_temperature(dt)
 
+    def airport_index(self) -> AirportIndex:
+        """Index of the airports by id, position and coalition.
+
+        It is built on first use and again if the number of airports changed.
+        """
+        if self._airport_index is None or len(self._airport_index.airports) != len(self.airports):
+            self._airport_index = AirportIndex(self.airports.values())
+        return self._airport_index
+
     def airport_by_id(self, _id: int) -> Optional[Airport]:
-        for x in self.airports:
-            if self.airports[x].id == _id:
-                return self.airports[x]
-        return None
+        return self.airport_index().by_id.get(_id)
 
     def airport_list(self) -> List[Airport]:
         for x in self.airports:
             yield self.airports[x]
 
+    def coalition_airports(self, coalition: str) -> List[Airport]:
+        """Returns the airports of the given coalition, the list must not be modified."""
+        return self.airport_index().coalition(coalition)[0]
+
     def nearest_airport(self, position: mapping.Point, coalition: str = None) -> Optional[Airport]:
-        airports = [x for x in self.airports.values()
-                    if x.coalition.lower() == coalition.lower()] if coalition else self.airports
+        index = self.airport_index()
+        tree = index.coalition(coalition)[1] if coalition else index.tree
+        return tree.nearest(position)
+
+    def nearest_airports(self, position: mapping.Point, count: int, coalition: str = None) -> List[Airport]:
+        """Returns up to count airports ordered by their distance to position.
 
-        dist = sys.float_info.max
-        airport = None
-        for x in airports:
-            d = position.distance_to_point(x.position)
-            if d < dist:
-                airport = x
-                dist = d
+        Args:
+            position(mapping.Point): reference point
+            count: number of airports
+            coalition: only airports of this coalition if set
 
-        return airport
+        Returns:
+            Sequence of the nearest airports.
+        """
+        index = self.airport_index()
+        tree = index.coalition(coalition)[1] if coalition else index.tree
+        return tree.k_nearest(position, count)
 
     def airport_within(self, position: mapping.Point, distance) -> List[Airport]:
         """Return all airports within the radius of a given point.
@@ -485,8 +829,7 @@ class Terrain:
         Returns:
             Sequence of airports within range.
         """
-        return [self.airports[x] for x in self.airports
-                if self.airports[x].position.distance_to_point(position) < distance]
+        return self.airport_index().tree.within_distance(position, distance)
 
     def random_season_temperature(self, dt: datetime) -> int:
         return random.randint(self.temperature[dt.month - 1][0], self.temperature[dt.month - 1][1])
@@ -501,10 +844,15 @@ class Warehouses:
         for x in data.get("airports", {}):
             self.terrain.airport_by_id(x).load_from_dict(data["airports"][x])
 
-    def __str__(self):
+    def dict(self):
         airports = self.terrain.airports
-        d = {
+        return {
             "warehouses": self.warehouses,
             "airports": {airports[x].id: airports[x].dict() for x in airports}
         }
-        return lua.dumps(d, "warehouses", 1)
+
+    def dump(self, fp, sort_keys: bool = True):
+        lua.dump(self.dict(), fp, "warehouses", 1, sort_keys)
+
+    def __str__(self):
+        return lua.dumps(self.dict(), "warehouses", 1)
@@ -11,9 +11,7 @@ class Abbeville_Drucat(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Abbeville_Drucat, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(20))
         self.runways.append(Runway(90))
         self.parking_slots.append(ParkingSlot(
@@ -108,9 +106,7 @@ class Merville_Calonne(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Merville_Calonne, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(210))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-28799.3125, 73304.28125), large=False, heli=True,
@@ -267,9 +263,7 @@ class Saint_Omer_Longuenesse(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Saint_Omer_Longuenesse, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(260))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(-16750.32421875, 44658.95703125), large=False, heli=False,
@@ -393,9 +387,7 @@ class Dunkirk_Mardyck(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Dunkirk_Mardyck, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(260))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(16620.982421875, 47046.9921875), large=False, heli=True,
@@ -465,9 +457,7 @@ class Manston(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Manston, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(100))
         self.runways.append(Runway(40))
         self.parking_slots.append(ParkingSlot(
@@ -685,9 +675,7 @@ class Hawkinge(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Hawkinge, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(190))
         self.runways.append(Runway(40))
         self.parking_slots.append(ParkingSlot(
@@ -779,9 +767,7 @@ class Lympne(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Lympne, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(130))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=0, position=mapping.Point(23345.69140625, -39134.625), large=False, heli=True,
@@ -860,9 +846,7 @@ class Detling(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(Detling, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(230))
         self.parking_slots.append(ParkingSlot(
                 crossroad_idx=2, position=mapping.Point(50092, -67870.7734375), large=False, heli=False,
@@ -971,9 +955,7 @@ class High_Halden(Airport):
     civilian = False
     slot_version = 2
 
-    def __init__(self):
-        super(High_Halden, self).__init__()
-
+    def load_static(self):
         self.runways.append(Runway(110))
         self.runways.append(Runway(40))
         self.parking_slots.append(ParkingSlot(
@@ -7,14 +7,10 @@ from typing import List, Union, Optional
 from dcs.unit import Unit, Skill
 from dcs.flyingunit import FlyingUnit, Plane, Helicopter
 from dcs.unittype import FlyingType
-from dcs.planes import PlaneType
-from dcs.helicopters import HelicopterType
 from dcs.point import StaticPoint, MovingPoint, PointAction, PointProperties
 from dcs.translation import String
 from dcs.terrain import Airport, Runway
 from dcs.nav_target_point import NavTargetPoint
-import dcs.planes as planes
-import dcs.helicopters as helicopters
 import dcs.triggers as triggers
 import dcs.action as action
 import dcs.condition as condition
@@ -328,6 +324,7 @@ class FlyingGroup(MovingGroup):
         return self.points[0].airdrome_id if self.points else None
 
     def flight_type(self) -> FlyingType:
+        from dcs import planes, helicopters
         t = planes.plane_map.get(self.units[0].type)
         if not t:
             t = helicopters.helicopter_map.get(self.units[0].type)
@@ -367,16 +364,17 @@ class FlyingGroup(MovingGroup):
         self.add_point(mp)
         return mp
 
-    def add_runway_waypoint(self, airport: Airport, runway: Runway=None,
-                            distance=random.randrange(6000, 8000, 100)) -> MovingPoint:
+    def add_runway_waypoint(self, airport: Airport, runway: Runway=None, distance=None) -> MovingPoint:
         """Adds a waypoint parallel to the given runway heading, for start or approach.
 
         :param airport: start airport object
         :param runway: runway for heading direction, if None first(default) airport runway will be used.
-        :param distance: distance of the waypoint from the airport
+        :param distance: distance of the waypoint from the airport, if None a random distance of 6-8 km
         :return: MovePoint object describing the waypoint
         """
         runway = runway if runway else airport.runways[0]
+        if distance is None:
+            distance = random.randrange(6000, 8000, 100)
 
         mp = MovingPoint()
         mp.type = "Turning Point"
@@ -520,6 +518,7 @@ class PlaneGroup(FlyingGroup):
         super(PlaneGroup, self).__init__(_id, name, start_time)
 
     def add_unit(self, unit: Plane):
+        from dcs.planes import PlaneType
         if not issubclass(unit.unit_type, PlaneType):
             print(unit.unit_type)
             raise TypeError("unit.unit_type is not a plane")
@@ -532,6 +531,7 @@ class HelicopterGroup(FlyingGroup):
         self.frequency = 127.5
 
     def add_unit(self, unit: Helicopter):
+        from dcs.helicopters import HelicopterType
         if not issubclass(unit.unit_type, HelicopterType):
             raise TypeError("unit.unit_type is not a helicopter")
         super(HelicopterGroup, self).add_unit(unit)
@@ -3,7 +3,9 @@ import dcs.installation as installation
 import os
 import re
 import sys
-from typing import Optional, Type, Any
+import unicodedata
+from enum import Enum
+from typing import Optional, Type, Dict, Tuple, Iterator
 
 
 class UnitType:
@@ -36,6 +38,59 @@ class LiveryOverwrites:
     }
 
 
+def _livery_member_name(livery_id: str) -> str:
+    # same as safe_name in tools/pydcs_export.lua, python identifiers are NFKC normalized
+    name = re.sub(r"[-()/., *'+`#\[\]]", "_", livery_id).rstrip("_")
+    name = re.sub(r"^([0-9])", r"_\1", name)
+    return "None_" if name == "None" else unicodedata.normalize("NFKC", name)
+
+
+class LiveryTable:
+    """Liveries of a flying unit type per country.
+
+    The generated unit modules only store the livery ids, the Enum class of a
+    country is created on first access, e.g. planes.A_10C.Liveries.USA.
+    Creating all of them on import took most of the import time of the planes module.
+
+    Args:
+        schemes: country class name to livery ids
+    """
+
+    def __init__(self, schemes: Dict[str, Tuple[str, ...]]):
+        self._schemes = schemes
+        self._module = None
+        self._qualname = "Liveries"
+
+    def __set_name__(self, owner, name):
+        self._module = owner.__module__
+        self._qualname = owner.__qualname__ + "." + name
+
+    def __getattr__(self, country: str) -> Type[Enum]:
+        # only called for countries without an Enum yet
+        schemes = self.__dict__.get("_schemes", {})
+        if country not in schemes:
+            raise AttributeError("no liveries for '{c}'".format(c=country))
+        members = [(_livery_member_name(x), x) for x in schemes[country]]
+        liveries = Enum(country, members, module=self._module, qualname=self._qualname + "." + country)
+        setattr(self, country, liveries)
+        return liveries
+
+    def __contains__(self, country: str) -> bool:
+        return country in self._schemes
+
+    def __iter__(self) -> Iterator[Type[Enum]]:
+        return (getattr(self, x) for x in self._schemes)
+
+    def __len__(self):
+        return len(self._schemes)
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self._schemes))
+
+    def __repr__(self):
+        return "LiveryTable({q}, {n} countries)".format(q=self._qualname, n=len(self._schemes))
+
+
 class FlyingType(UnitType):
     flyable = False
     group_size_max = 4
@@ -63,7 +118,7 @@ class FlyingType(UnitType):
     property_defaults = None
 
     pylons = {}
-    Liveries: Optional[Type[Any]] = None
+    Liveries: Optional[LiveryTable] = None
     payloads = None
     dcs_dir = installation.get_dcs_install_directory()
     payload_dirs = []
@@ -174,9 +229,6 @@ class FlyingType(UnitType):
             return LiveryOverwrites.map[cls.id + "." + country_name]
         else:
             liveries = cls.Liveries
-            if liveries is not None:
-                for x in liveries.__dict__:
-                    clas = liveries.__dict__[x]
-                    if clas and getattr(clas, "__name__", "") == country_name:
-                        return list(clas)[0].value
+            if liveries is not None and country_name in liveries:
+                return list(getattr(liveries, country_name))[0].value
         return ""
@@ -1,4 +1,4 @@
-from setuptools import setup
+from setuptools import setup, Extension
 from codecs import open
 from os import path
 
@@ -36,6 +36,10 @@ setup(
     package_data={
         'dcs/terrain': ['caucasus.p', 'nevada.p']
     },
+    # optional C lua parser, pydcs falls back to the pure python parser if it can't be built
+    ext_modules=[
+        Extension('dcs.lua._parse', ['dcs/lua/_parse.c'], optional=True)
+    ],
     entry_points={
         'console_scripts': [
             'dcs_random=dcs.scripts.caucasus_random_mission:main',
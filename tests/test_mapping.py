@@ -1,5 +1,6 @@
+import random
 import unittest
-from dcs.mapping import Polygon, Point, Rectangle, Triangle
+from dcs.mapping import KDTree, Polygon, Point, Rectangle, Triangle
 
 
 class PointTests(unittest.TestCase):
@@ -92,3 +93,36 @@ class PolygonTests(unittest.TestCase):
         for i in range(0, 100):
             rp = poly.random_point()
             self.assertTrue(poly.point_in_poly(rp))
+
+
+class KDTreeTests(unittest.TestCase):
+    def test_queries(self):
+        rnd = random.Random(4)
+        # coarse grid positions, so there are equal coordinates and distances
+        points = [Point(rnd.randint(-50, 50) * 10, rnd.randint(-50, 50) * 10) for _ in range(300)]
+        tree = KDTree(points, lambda p: p)
+        self.assertEqual(len(tree), 300)
+
+        for _ in range(100):
+            q = Point(rnd.uniform(-600, 600), rnd.uniform(-600, 600))
+            by_distance = sorted(range(len(points)), key=lambda i: (points[i].distance_to_point(q), i))
+            self.assertIs(tree.nearest(q), points[by_distance[0]])
+            self.assertEqual([id(x) for x in tree.k_nearest(q, 5)], [id(points[i]) for i in by_distance[:5]])
+
+            d = rnd.uniform(0, 400)
+            self.assertEqual([id(x) for x in tree.within_distance(q, d)],
+                             [id(x) for x in points if x.distance_to_point(q) < d])
+
+            r = Rectangle(q.x + rnd.uniform(0, 300), q.y - rnd.uniform(0, 300),
+                          q.x - rnd.uniform(0, 300), q.y + rnd.uniform(0, 300))
+            self.assertEqual([id(x) for x in tree.within_rectangle(r)], [id(x) for x in points if r.point_in_rect(x)])
+
+            poly = Polygon([q, q + Point(300, 50), q + Point(100, 300)])
+            self.assertEqual([id(x) for x in tree.within_polygon(poly)],
+                             [id(x) for x in points if poly.point_in_poly(x)])
+
+    def test_empty(self):
+        tree = KDTree([])
+        self.assertIsNone(tree.nearest(Point(0, 0)))
+        self.assertEqual(tree.k_nearest(Point(0, 0), 3), [])
+        self.assertEqual(tree.within_distance(Point(0, 0), 100), [])
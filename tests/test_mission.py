@@ -1,6 +1,14 @@
+import concurrent.futures
+import enum
+import io
 import os
+import pickle
+import shutil
+import subprocess
+import sys
 import time
 import unittest
+import unittest.mock
 from pathlib import Path
 import zipfile
 
@@ -660,3 +668,269 @@ class BasicTests(unittest.TestCase):
                 result = content.find('["unknown_test_key"]')
 
         self.assertNotEqual(result, -1)
+
+    def test_lazy_load(self):
+        m = dcs.mission.Mission()
+        self.assertTrue(m.load_file('tests/loadtest.miz', lazy=True))
+        self.assertIsNotNone(m.weather)
+
+        saved_mission = 'missions/test_lazy_load.miz'
+        m.save(saved_mission)
+
+        with zipfile.ZipFile('tests/loadtest.miz', 'r') as orig, zipfile.ZipFile(saved_mission, 'r') as saved:
+            self.assertEqual(orig.read('warehouses'), saved.read('warehouses'))
+            orig_mission = dcs.lua.loads(orig.read('mission').decode())["mission"]
+            saved_mission = dcs.lua.loads(saved.read('mission').decode())["mission"]
+        for section in ["coalition", "coalitions", "triggers", "trigrules", "trig"]:
+            self.assertEqual(orig_mission[section], saved_mission[section])
+
+        # accessing a section decodes it
+        m = dcs.mission.Mission()
+        m.load_file('tests/loadtest.miz', lazy=True)
+        self.assert_prepared_mission_load(m)
+
+    def test_streamed_save(self):
+        m = dcs.mission.Mission()
+        m.load_file('tests/loadtest.miz')
+        saved_mission = 'missions/test_streamed_save.miz'
+        m.save(saved_mission)
+
+        with zipfile.ZipFile(saved_mission, 'r') as miz:
+            self.assertEqual(miz.read('mission').decode(), str(m))
+            self.assertEqual(miz.read('options').decode(), str(m.options))
+            self.assertEqual(miz.read('warehouses').decode(), str(m.warehouses))
+            self.assertEqual(dcs.lua.loads(miz.read('mission').decode())["mission"]["theatre"], m.dict()["theatre"])
+
+    def test_parse_cache(self):
+        m = dcs.mission.Mission()
+        m.load_file('tests/loadtest.miz')
+        ref = str(m)
+
+        m = dcs.mission.Mission()
+        m.parse_cache = dcs.lua.ParseCache()
+        m.load_file('tests/loadtest.miz')
+        self.assertEqual(m.parse_cache.hits, 0)
+        m.reload()
+        self.assertEqual(m.parse_cache.hits, m.parse_cache.misses)
+        self.assertEqual(str(m), ref)
+
+        # loaded sections are independent copies of the cached values
+        m.reload()
+        self.assertEqual(str(m), ref)
+
+    def test_load_executor(self):
+        m = dcs.mission.Mission()
+        m.load_file('tests/loadtest.miz')
+        ref = str(m)
+
+        for executor_type in [concurrent.futures.ThreadPoolExecutor, concurrent.futures.ProcessPoolExecutor]:
+            with executor_type(max_workers=2) as executor:
+                m = dcs.mission.Mission()
+                self.assertTrue(m.load_file('tests/loadtest.miz', executor=executor))
+                self.assertEqual(str(m), ref)
+
+    def test_unsorted_save(self):
+        m = dcs.mission.Mission()
+        m.load_file('tests/loadtest.miz')
+        m.save('missions/test_sorted_save.miz')
+        m.save('missions/test_unsorted_save.miz', sort_keys=False)
+
+        with zipfile.ZipFile('missions/test_sorted_save.miz') as a, \
+                zipfile.ZipFile('missions/test_unsorted_save.miz') as b:
+            for member in ['mission', 'options', 'warehouses', 'l10n/DEFAULT/dictionary', 'l10n/DEFAULT/mapResource']:
+                self.assertEqual(dcs.lua.loads(a.read(member).decode()), dcs.lua.loads(b.read(member).decode()))
+            unsorted_mission = b.read('mission')
+
+        # insertion order is reproducible as well
+        s = io.StringIO()
+        m.dump(s, sort_keys=False)
+        self.assertEqual(s.getvalue().encode(), unsorted_mission)
+
+    def test_resources_kept_in_archive(self):
+        shutil.copy('tests/loadtest.miz', 'missions/test_resources.miz')
+        m = dcs.mission.Mission()
+        m.load_file('missions/test_resources.miz')
+        resources = m.map_resource.resources()
+        self.assertTrue(resources)
+        self.assertTrue(all(isinstance(x, dcs.mission.ZipResource) for x in resources))
+
+        with zipfile.ZipFile('tests/loadtest.miz') as miz:
+            orig = {x.filename: miz.read(x.filename) for x in resources}
+            infos = {x.filename: miz.getinfo(x.filename) for x in resources}
+
+        # saving over the loaded file moves the resources into memory first
+        m.save()
+        m.save('missions/test_resources_2.miz')
+        for filename in ['missions/test_resources.miz', 'missions/test_resources_2.miz']:
+            with zipfile.ZipFile(filename) as miz:
+                self.assertIsNone(miz.testzip())
+                for name, data in orig.items():
+                    self.assertEqual(miz.read(name), data)
+                    self.assertEqual(miz.getinfo(name).compress_size, infos[name].compress_size)
+
+    def test_archive_replaced_after_load(self):
+        shutil.copy('tests/loadtest.miz', 'missions/test_replaced.miz')
+        m = dcs.mission.Mission()
+        m.load_file('missions/test_replaced.miz')
+        with zipfile.ZipFile('tests/loadtest.miz') as miz:
+            orig = {x.filename: miz.read(x.filename) for x in m.map_resource.resources()}
+
+        # the same files at other offsets are still copied
+        other = dcs.mission.Mission()
+        other.load_file('missions/test_replaced.miz')
+        other.string("unused")
+        other.save('missions/test_replaced_tmp.miz', compression=dcs.mission.Compression.presets["store"])
+        os.replace('missions/test_replaced_tmp.miz', 'missions/test_replaced.miz')
+        m.save('missions/test_replaced_2.miz')
+        with zipfile.ZipFile('missions/test_replaced_2.miz') as miz:
+            self.assertIsNone(miz.testzip())
+            for name, data in orig.items():
+                self.assertEqual(miz.read(name), data)
+
+        # resources of a deleted archive are lost, lua files are written from memory
+        os.remove('missions/test_replaced.miz')
+        with self.assertRaises(RuntimeError):
+            m.save('missions/test_replaced_failed.miz')
+        self.assertFalse(os.path.exists('missions/test_replaced_failed.miz'))
+        self.assertFalse(os.path.exists('missions/test_replaced_failed.miz.tmp'))
+        m = dcs.mission.Mission()
+        m.load_file('missions/test_replaced_2.miz')
+        m.map_resource.files.clear()
+        m.map_resource.binary_files.clear()
+        os.remove('missions/test_replaced_2.miz')
+        m.save('missions/test_replaced_3.miz')
+        with zipfile.ZipFile('missions/test_replaced_3.miz') as miz:
+            self.assertIsNone(miz.testzip())
+            self.assertIn('options', miz.namelist())
+
+    def test_copy_without_zipfile_internals(self):
+        m = dcs.mission.Mission()
+        m.load_file('tests/loadtest.miz')
+        with unittest.mock.patch.object(dcs.mission, '_RAW_WRITE_ATTRS', ('_missing',)):
+            m.save('missions/test_no_raw_copy.miz')
+        with zipfile.ZipFile('tests/loadtest.miz') as a, zipfile.ZipFile('missions/test_no_raw_copy.miz') as b:
+            self.assertIsNone(b.testzip())
+            for resource in m.map_resource.resources():
+                self.assertEqual(a.read(resource.filename), b.read(resource.filename))
+                self.assertEqual(a.getinfo(resource.filename).compress_type, b.getinfo(resource.filename).compress_type)
+
+    def test_unchanged_files_copied(self):
+        m = dcs.mission.Mission()
+        m.load_file('tests/loadtest.miz')
+        m.save('missions/test_unchanged_0.miz')
+        # date the members back, so rewritten ones get a different timestamp
+        with zipfile.ZipFile('missions/test_unchanged_0.miz') as a, \
+                zipfile.ZipFile('missions/test_unchanged_1.miz', 'w') as b:
+            for info in a.infolist():
+                info.date_time = (2000, 1, 1, 0, 0, 0)
+                b.writestr(info, a.read(info))
+
+        m = dcs.mission.Mission()
+        m.load_file('missions/test_unchanged_1.miz')
+        changed = m.string("changed")  # strings without references are removed
+        m.save('missions/test_unchanged_2.miz')
+
+        with zipfile.ZipFile('missions/test_unchanged_1.miz') as a, \
+                zipfile.ZipFile('missions/test_unchanged_2.miz') as b:
+            for name in ['options', 'warehouses', 'l10n/DEFAULT/mapResource']:
+                self.assertEqual(a.getinfo(name).date_time, b.getinfo(name).date_time)
+                self.assertEqual(a.read(name), b.read(name))
+            self.assertNotEqual(a.getinfo('l10n/DEFAULT/dictionary').date_time,
+                                b.getinfo('l10n/DEFAULT/dictionary').date_time)
+            self.assertIn(changed.id.encode(), b.read('l10n/DEFAULT/dictionary'))
+            self.assertIsNone(b.testzip())
+
+    def test_save_compression(self):
+        Compression = dcs.mission.Compression
+        self.assertEqual(Compression.file_class('mission'), Compression.Lua)
+        self.assertEqual(Compression.file_class('l10n/DEFAULT/dictionary'), Compression.Lua)
+        self.assertEqual(Compression.file_class('l10n/DEFAULT/radio.OGG'), Compression.Media)
+        self.assertEqual(Compression.file_class('KNEEBOARD/IMAGES/page.png'), Compression.Kneeboard)
+        self.assertEqual(Compression.file_class('l10n/DEFAULT/script.lua'), Compression.Other)
+
+        with open('missions/test_sound.ogg', 'wb') as f:
+            f.write(b'\0' * 4096)
+        m = dcs.mission.Mission()
+        m.map_resource.add_resource_file('missions/test_sound.ogg')
+        m.map_resource.add_resource_file('tests/loadtest.miz')
+
+        m.save('missions/test_compression.miz', compression=Compression.presets["fast"])
+        with zipfile.ZipFile('missions/test_compression.miz') as miz:
+            self.assertEqual(miz.getinfo('mission').compress_type, zipfile.ZIP_DEFLATED)
+            self.assertEqual(miz.getinfo('l10n/DEFAULT/test_sound.ogg').compress_type, zipfile.ZIP_STORED)
+            self.assertEqual(miz.getinfo('l10n/DEFAULT/loadtest.miz').compress_type, zipfile.ZIP_DEFLATED)
+            self.assertIsNone(miz.testzip())
+
+        m.save('missions/test_compression.miz', compression=Compression.presets["store"])
+        with zipfile.ZipFile('missions/test_compression.miz') as miz:
+            self.assertTrue(all(x.compress_type == zipfile.ZIP_STORED for x in miz.infolist()))
+
+        # members of a loaded mission follow the compression as well
+        m = dcs.mission.Mission()
+        m.load_file('missions/test_compression.miz')
+        m.save('missions/test_compression_2.miz', compression=Compression.presets["default"])
+        with zipfile.ZipFile('missions/test_compression.miz') as a, \
+                zipfile.ZipFile('missions/test_compression_2.miz') as b:
+            self.assertTrue(all(x.compress_type == zipfile.ZIP_DEFLATED for x in b.infolist()))
+            self.assertIsNone(b.testzip())
+            for name in ['options', 'l10n/DEFAULT/test_sound.ogg', 'l10n/DEFAULT/loadtest.miz']:
+                self.assertEqual(a.read(name), b.read(name))
+
+    def test_resource_dedup(self):
+        for name, content in [('a.lua', b'print(1)'), ('b.lua', b'print(1)'), ('c.lua', b'print(2)')]:
+            with open(os.path.join('missions', name), 'wb') as f:
+                f.write(content)
+        m = dcs.mission.Mission()
+        keys = [m.map_resource.add_resource_file(os.path.join('missions', x)) for x in ['a.lua', 'b.lua', 'c.lua', 'a.lua']]
+        m.save('missions/test_resource_dedup.miz')
+
+        with zipfile.ZipFile('missions/test_resource_dedup.miz') as miz:
+            names = [x for x in miz.namelist() if x.endswith('.lua')]
+            self.assertEqual(names, ['l10n/DEFAULT/a.lua', 'l10n/DEFAULT/c.lua'])
+            mapresource = dcs.lua.loads(miz.read('l10n/DEFAULT/mapResource').decode())["mapResource"]
+        self.assertEqual([mapresource[x.key] for x in keys], ['a.lua', 'a.lua', 'c.lua', 'a.lua'])
+
+    def test_load_many(self):
+        with open('missions/test_broken.miz', 'wb') as f:
+            f.write(b'not a zip file')
+        paths = ['tests/loadtest.miz', 'tests/bypass_triggers.miz', 'missions/test_broken.miz']
+        for workers in [1, 2]:
+            results = {r.path: r for r in dcs.mission.load_many(paths, workers=workers, sections=["coalition"])}
+            self.assertEqual(set(results), set(paths))
+            self.assertTrue(results['tests/loadtest.miz'].ok)
+            self.assertGreater(results['tests/loadtest.miz'].result["unit_count"], 0)
+            self.assertFalse(results['missions/test_broken.miz'].ok)
+            self.assertIn("BadZipFile", results['missions/test_broken.miz'].error)
+
+        # stopping early cancels the missions that are still queued
+        results = dcs.mission.load_many(paths * 4, workers=2)
+        self.assertIn(next(results).path, paths)
+        results.close()
+
+        with self.assertRaises(ValueError):
+            list(dcs.mission.load_many(paths, sections=["groups"]))
+
+    def test_lazy_unit_databases(self):
+        code = ("import sys, dcs\n"
+                "print(sorted(m for m in sys.modules if m in ('dcs.planes', 'dcs.countries', 'dcs.weapons_data')))\n"
+                "dcs.planes.A_10C\n"
+                "print('dcs.weapons_data' in sys.modules)\n")
+        out = subprocess.run([sys.executable, "-c", code], stdout=subprocess.PIPE, check=True).stdout.decode()
+        # installation detection prints warnings first
+        self.assertEqual(out.splitlines()[-2:], ["[]", "True"])
+
+    def test_liveries(self):
+        liveries = dcs.planes.A_10C.Liveries
+        self.assertIn("USA", liveries)
+        self.assertNotIn("Atlantis", liveries)
+        usa = liveries.USA
+        self.assertIs(usa, liveries.USA)
+        self.assertTrue(issubclass(usa, enum.Enum))
+        self.assertEqual(usa.__qualname__, "A_10C.Liveries.USA")
+        first = list(usa)[0]
+        self.assertEqual(dcs.planes.A_10C.default_livery("USA"), first.value)
+        self.assertIs(pickle.loads(pickle.dumps(first)), first)
+        self.assertEqual(dcs.planes.A_10C.default_livery("Atlantis"), "")
+        with self.assertRaises(AttributeError):
+            liveries.Atlantis
+        self.assertEqual(len(list(liveries)), len(liveries))
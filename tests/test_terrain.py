@@ -1,3 +1,4 @@
+import pickle
 import unittest
 import dcs
 
@@ -54,6 +55,75 @@ class CaucasusTest(unittest.TestCase):
 
         self.assertEqual(len(used)+2, len(m.terrain.batumi().parking_slots))
 
+    def test_parking_allocator(self):
+        t = dcs.terrain.Caucasus()
+        batumi = t.batumi()
+        slot = batumi.parking_slots[3]
+        self.assertIs(batumi.parking_slot(slot.crossroad_idx), slot)
+        self.assertIsNone(batumi.parking_slot(-1))
+
+        taken = []
+        while batumi.free_parking_slot(dcs.planes.A_10C):
+            s = batumi.free_parking_slot(dcs.planes.A_10C)
+            self.assertIs(s, batumi.free_parking_slots(dcs.planes.A_10C)[0])
+            s.unit_id = len(taken) + 1
+            taken.append(s)
+        self.assertEqual(len(taken), 10)
+
+        # released slots are handed out again in their original order
+        self.assertTrue(batumi.clear_parking_slot(taken[5].crossroad_idx))
+        taken[2].unit_id = None
+        self.assertEqual(batumi.free_parking_slots(dcs.planes.A_10C), [taken[2], taken[5]])
+        self.assertIs(batumi.free_parking_slot(dcs.planes.A_10C), taken[2])
+
+        # a replaced slot list gets a new index
+        batumi.parking_slots = [taken[5]]
+        self.assertEqual(batumi.free_parking_slots(dcs.planes.A_10C), [taken[5]])
+        self.assertIsNone(batumi.parking_slot(taken[2].crossroad_idx))
+
+    def test_unit_zones(self):
+        a = dcs.terrain.Caucasus()
+        b = dcs.terrain.Caucasus()
+        self.assertEqual(len(a.krasnodar_center().unit_zones), 4)
+        self.assertEqual(len(b.krasnodar_center().unit_zones), 4)
+        self.assertIsNot(a.krasnodar_center().unit_zones, b.krasnodar_center().unit_zones)
+
+    def test_shared_static_data(self):
+        a = dcs.terrain.Caucasus()
+        b = dcs.terrain.Caucasus()
+        self.assertEqual(len(a.batumi().parking_slots), 10)
+        self.assertIsNot(a.batumi().parking_slots, b.batumi().parking_slots)
+        self.assertIs(a.batumi().parking_slots[0].position, b.batumi().parking_slots[0].position)
+
+        # slot occupancy and warehouse values are kept per terrain instance
+        a.batumi().parking_slots[0].unit_id = 1
+        a.batumi().set_blue()
+        self.assertIsNone(b.batumi().parking_slots[0].unit_id)
+        self.assertEqual(b.batumi().coalition, "NEUTRAL")
+        self.assertEqual(len(b.batumi().free_parking_slots(dcs.planes.A_10C)), 10)
+        self.assertIsNone(dcs.terrain.Caucasus().batumi().parking_slots[0].unit_id)
+
+    def test_airport_index(self):
+        t = dcs.terrain.Caucasus()
+        self.assertIs(t.airport_by_id(t.batumi().id), t.batumi())
+        self.assertIsNone(t.airport_by_id(-1))
+        self.assertIs(t.nearest_airport(t.batumi().position + dcs.Point(100, 0)), t.batumi())
+        self.assertEqual(t.nearest_airports(t.batumi().position, 2), [t.batumi(), t.kobuleti()])
+        self.assertEqual(t.airport_within(t.batumi().position, 1000), [t.batumi()])
+
+        # coalition views follow coalition changes
+        self.assertIsNone(t.nearest_airport(t.batumi().position, "blue"))
+        t.senaki_kolkhi().set_blue()
+        t.kutaisi().set_blue()
+        self.assertIs(t.nearest_airport(t.batumi().position, "BLUE"), t.senaki_kolkhi())
+        self.assertEqual(t.coalition_airports("blue"), [t.senaki_kolkhi(), t.kutaisi()])
+        t.senaki_kolkhi().set_red()
+        self.assertIs(t.nearest_airport(t.batumi().position, "blue"), t.kutaisi())
+        self.assertEqual(t.coalition_airports("red"), [t.senaki_kolkhi()])
+
+        # another terrain instance has its own coalition state
+        self.assertEqual(dcs.terrain.Caucasus().coalition_airports("blue"), [])
+
 
 class NevadaTest(unittest.TestCase):
 
@@ -83,3 +153,92 @@ class NormandyTest(unittest.TestCase):
     def test_creation(self):
         m = dcs.mission.Mission(terrain=dcs.terrain.Normandy())
         self.assertIsInstance(m.terrain, dcs.terrain.Normandy)
+
+
+class GraphTest(unittest.TestCase):
+
+    def graph(self):
+        # distances are the straight line distances, like in the terrain city graphs
+        g = dcs.terrain.Graph()
+        positions = {"a": (0, 0), "b": (1000, 1000), "c": (2000, 0), "d": (0, 5000)}
+        nodes = {x: dcs.terrain.terrain.Node(x, 0, dcs.Point(*positions[x])) for x in sorted(positions)}
+        for x in nodes.values():
+            g.add_node(x)
+
+        def add_edge(a, b, on_road=True):
+            g.add_edge(nodes[a], nodes[b], nodes[a].position.distance_to_point(nodes[b].position), on_road)
+
+        add_edge("a", "b")
+        add_edge("b", "c")
+        add_edge("a", "c", on_road=False)
+        return g, nodes
+
+    def test_shortest_path(self):
+        g, nodes = self.graph()
+        self.assertEqual(g.shortest_path("a", "c"), (2000, ["a", "c"]))
+        self.assertIs(g.node("c"), nodes["c"])
+        with self.assertRaises(RuntimeError):
+            g.node("x")
+        # edges are only traversable in the direction they were added
+        with self.assertRaises(KeyError):
+            g.shortest_path("c", "a")
+        with self.assertRaises(KeyError):
+            g.shortest_path("a", "d")
+
+        # cached paths are dropped when the graph changes
+        g.add_edge(nodes["a"], nodes["d"], 5)
+        g.add_edge(nodes["d"], nodes["c"], 5)
+        self.assertEqual(g.shortest_path("a", "c"), (10, ["a", "d", "c"]))
+
+    def test_astar(self):
+        g, nodes = self.graph()
+        self.assertEqual(g.astar("a", "c"), (2000, ["a", "c"]))
+        distance, path = g.astar("a", "c", off_road_factor=2)
+        self.assertAlmostEqual(distance, 2000 * 2 ** 0.5)
+        self.assertEqual(path, ["a", "b", "c"])
+        self.assertEqual(g.astar("a", "a"), (0, ["a"]))
+        with self.assertRaises(KeyError):
+            g.astar("a", "d")
+
+    def test_routes(self):
+        g, nodes = self.graph()
+        routes = g.routes("a", ["b", "c", "d"], off_road_factor=2)
+        self.assertEqual(sorted(routes), ["b", "c"])
+        self.assertEqual(routes["c"][1], ["a", "b", "c"])
+        self.assertEqual(routes["b"][1], ["a", "b"])
+
+    def test_spatial_queries(self):
+        g, nodes = self.graph()
+        self.assertIs(g.nearest_node(dcs.Point(900, 900)), nodes["b"])
+        self.assertEqual(g.nearest_nodes(dcs.Point(1900, 0), 2), [nodes["c"], nodes["b"]])
+        self.assertEqual(set(g.nodes_in_radius(dcs.Point(0, 0), 1500)), {nodes["a"], nodes["b"]})
+        triangle = dcs.mapping.Polygon([dcs.Point(-10, -10), dcs.Point(2100, -10), dcs.Point(-10, 2100)])
+        self.assertEqual(set(g.nodes_within(triangle)), {nodes["a"], nodes["b"], nodes["c"]})
+
+        # the index is rebuilt when nodes are added
+        e = dcs.terrain.terrain.Node("e", 10, dcs.Point(950, 950))
+        g.add_node(e)
+        self.assertIs(g.nearest_node(dcs.Point(900, 900)), e)
+        self.assertEqual(g.rated_nodes_within(triangle), [e])
+
+    def test_pickle(self):
+        g, nodes = self.graph()
+        g.shortest_path("a", "c")
+        self.assertNotIn("_path_cache", g.__getstate__())
+        g = pickle.loads(pickle.dumps(g))
+        self.assertEqual(g.shortest_path("a", "c"), (2000, ["a", "c"]))
+
+    def test_caucasus_travel(self):
+        g = dcs.terrain.Caucasus.city_graph
+        distance, path = g.shortest_path("Batumi", "Kobuleti")
+        self.assertEqual(path[0], "Batumi")
+        self.assertEqual(path[-1], "Kobuleti")
+        self.assertEqual(distance, sum(g.edge_properties[(a, b)][0] for a, b in zip(path, path[1:])))
+        self.assertEqual(g.astar("Batumi", "Kobuleti"), (distance, path))
+        self.assertEqual(g.routes("Batumi", ["Kobuleti"])["Kobuleti"], (distance, path))
+
+        m = dcs.Mission()
+        group = m.vehicle_group(m.country("Russia"), "Convoy", dcs.vehicles.Unarmed.Fuel_Truck_ATZ_10,
+                                g.node("Batumi").position)
+        self.assertEqual(g.travel(group, g.node("Batumi"), g.node("Kobuleti"), off_road_factor=3), (distance, path))
+        self.assertEqual(len(group.points), len(path))
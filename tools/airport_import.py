@@ -65,9 +65,7 @@ class {sname}(Airport):
     civilian = {civ}
     slot_version = {slot_version}
 
-    def __init__(self):
-        super({sname}, self).__init__()
-""".format(sname=safename(airport['airport']['display_name']), name=airport['airport']['display_name'], id=id, x=airport["airport"]["reference_point"]["x"],
+    def load_static(self):""".format(sname=safename(airport['airport']['display_name']), name=airport['airport']['display_name'], id=id, x=airport["airport"]["reference_point"]["x"],
            y=airport["airport"]["reference_point"]["y"], tacan=tacan,
 #           freq=", ".join(map(str, airport["airport"]["frequency"].values())),
            civ=airport["airport"].get("civilian", True),
@@ -0,0 +1,205 @@
+#!/usr/bin/python3
+"""Measures import time, memory and mission construction, load and save times of pydcs.
+
+Results are written as JSON, a previous result file can be passed with --compare
+to print the relative change of every measurement.
+
+Import times and memory are measured in fresh interpreters, bytecode should be
+compiled before (python -m compileall dcs), otherwise compile time is measured.
+"""
+
+import argparse
+import contextlib
+import datetime
+import glob
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+# prints the peak resident set size in kB after running the given statement
+_RSS_SCRIPT = """
+import sys
+{stmt}
+try:
+    import resource
+except ImportError:  # not available on windows
+    print(-1)
+else:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(rss // 1024 if sys.platform == "darwin" else rss)
+"""
+
+_DATABASES = ["weapons_data", "planes", "helicopters", "vehicles", "ships", "statics", "countries"]
+
+
+def _python(args, stmt):
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    return subprocess.run([sys.executable] + args + ["-c", stmt], stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          env=env, cwd=ROOT, check=True, universal_newlines=True)
+
+
+def parse_importtime(output: str):
+    """Parses the stderr output of python -X importtime.
+
+    Returns:
+        dict of module name to (self, cumulative) import time in seconds
+    """
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+        times[fields[2].strip()] = (int(fields[0]) / 1e6, int(fields[1]) / 1e6)
+    return times
+
+
+def import_times(stmt: str, repeat: int):
+    """Best self and cumulative import time of every dcs module imported by stmt."""
+    best = {}
+    for _ in range(repeat):
+        times = parse_importtime(_python(["-X", "importtime"], stmt).stderr)
+        for name, (self_time, cumulative) in times.items():
+            if name != "dcs" and not name.startswith("dcs."):
+                continue
+            if name in best:
+                self_time = min(self_time, best[name]["self"])
+                cumulative = min(cumulative, best[name]["cumulative"])
+            best[name] = {"self": self_time, "cumulative": cumulative}
+    return best
+
+
+def rss(stmt: str, repeat: int):
+    """Lowest peak RSS in kB of a fresh interpreter after running stmt, None if unsupported."""
+    value = min(int(_python([], _RSS_SCRIPT.format(stmt=stmt)).stdout.split()[-1]) for _ in range(repeat))
+    return value if value >= 0 else None
+
+
+def best_time(func, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def mission_times(repeat: int):
+    """Mission() construction time per terrain, the first construction loads the unit databases."""
+    import dcs
+
+    terrains = [dcs.terrain.Caucasus, dcs.terrain.Nevada, dcs.terrain.Normandy, dcs.terrain.PersianGulf,
+                dcs.terrain.TheChannel, dcs.terrain.Syria]
+    result = {"first": best_time(lambda: dcs.Mission(), 1)}
+    for terrain in terrains:
+        result[terrain.__name__] = best_time(lambda: dcs.Mission(terrain()), repeat)
+    return result
+
+
+def miz_times(missions, repeat: int):
+    """Load and save time for every mission file."""
+    import dcs
+
+    result = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        output = os.path.join(tmpdir, "out.miz")
+        for filename in missions:
+            load = best_time(lambda: dcs.mission.Mission().load_file(filename), repeat)
+            m = dcs.mission.Mission()
+            m.load_file(filename)
+            save = best_time(lambda: m.save(output), repeat)
+            result[os.path.basename(filename)] = {"load": load, "save": save, "size": os.path.getsize(filename)}
+    return result
+
+
+def run(missions, repeat: int):
+    # import statements, -X importtime does not report modules loaded by importlib.import_module
+    database_stmt = "import dcs\n" + "\n".join("import dcs." + x for x in _DATABASES)
+    return {
+        "info": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "repeat": repeat,
+        },
+        "import": import_times("import dcs", repeat),
+        "import_databases": import_times(database_stmt, repeat),
+        "rss_kb": {
+            "python": rss("", repeat),
+            "import": rss("import dcs", repeat),
+            "databases": rss(database_stmt, repeat),
+            "mission": rss("import dcs\ndcs.Mission()", repeat),
+        },
+        "mission": mission_times(repeat),
+        "miz": miz_times(missions, repeat),
+    }
+
+
+def _flatten(d, prefix=""):
+    for key, value in d.items():
+        if isinstance(value, dict):
+            yield from _flatten(value, prefix + key + "/")
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield prefix + key, value
+
+
+def _compared(key: str) -> bool:
+    if key.startswith("info/"):
+        return False
+    # import times of single modules are too noisy, only the package and unit database totals are compared
+    if key.startswith(("import/", "import_databases/")):
+        return key.split("/")[1] == "dcs" or key.split("/")[1] in ("dcs." + x for x in _DATABASES)
+    return True
+
+
+def compare(base, current, threshold: float):
+    """Prints every measurement that changed more than threshold, relative to base."""
+    base_values = dict(_flatten(base))
+    print("{k:50s} {b:>12s} {c:>12s} {r:>8s}".format(k="measurement", b="base", c="current", r="change"))
+    for key, value in sorted(_flatten(current)):
+        if not _compared(key) or not base_values.get(key):
+            continue
+        change = value / base_values[key] - 1
+        if abs(change) >= threshold:
+            print("{k:50s} {b:12.4g} {c:12.4g} {r:+7.1%}".format(k=key, b=base_values[key], c=value, r=change))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pydcs import time, memory, mission creation, load and save")
+    parser.add_argument("missions", nargs="*", help="mission files, default are the bundled test missions")
+    parser.add_argument("-n", "--repeat", type=int, default=3, help="repetitions per measurement, best value is used")
+    parser.add_argument("-o", "--output", help="write the results to this JSON file instead of stdout")
+    parser.add_argument("--compare", metavar="JSON", help="print the changes relative to a previous result file")
+    parser.add_argument("--threshold", type=float, default=0.05,
+                        help="only print changes larger than this fraction with --compare")
+
+    args = parser.parse_args()
+    missions = args.missions or sorted(glob.glob(os.path.join(ROOT, "tests", "missions", "*.miz")))
+
+    # keep stdout clean for the JSON output, pydcs prints warnings while importing and loading
+    with contextlib.redirect_stdout(sys.stderr):
+        result = run(missions, args.repeat)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2, sort_keys=True)
+    elif not args.compare:
+        json.dump(result, sys.stdout, indent=2, sort_keys=True)
+        print()
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), result, args.threshold)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/python3
+"""Compares save time and file size of the mission compression presets.
+
+Members of the loaded missions are written with each preset, compressed
+data is only copied as is if the preset uses the same method.
+The size is also given per file class, see :class:`dcs.mission.Compression`.
+"""
+
+import argparse
+import glob
+import os
+import tempfile
+import time
+import zipfile
+import dcs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark mission compression presets")
+    parser.add_argument("missions", nargs="*", help="mission files, default are the bundled test missions")
+    parser.add_argument("-n", "--repeat", type=int, default=3, help="saves per mission and preset, best time is used")
+    parser.add_argument("-p", "--presets", nargs="*", default=sorted(dcs.mission.Compression.presets),
+                        choices=sorted(dcs.mission.Compression.presets))
+
+    args = parser.parse_args()
+    missions = args.missions
+    if not missions:
+        testdir = os.path.join(os.path.dirname(__file__), "..", "tests")
+        missions = sorted(glob.glob(os.path.join(testdir, "missions", "*.miz")))
+
+    classes = [dcs.mission.Compression.Lua, dcs.mission.Compression.Media,
+               dcs.mission.Compression.Kneeboard, dcs.mission.Compression.Other]
+    print("{m:40s} {p:8s} {t:>9s} {s:>12s} ".format(m="mission", p="preset", t="save [s]", s="size [kB]")
+          + " ".join("{c:>15s}".format(c=c + " [kB]") for c in classes))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for filename in missions:
+            m = dcs.mission.Mission()
+            m.load_file(filename)
+            for preset in args.presets:
+                compression = dcs.mission.Compression.presets[preset]
+                output = os.path.join(tmpdir, preset + ".miz")
+                best = None
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    m.save(output, compression=compression)
+                    elapsed = time.perf_counter() - start
+                    best = elapsed if best is None else min(best, elapsed)
+                sizes = dict.fromkeys(classes, 0)
+                with zipfile.ZipFile(output) as miz:
+                    for info in miz.infolist():
+                        sizes[dcs.mission.Compression.file_class(info.filename)] += info.compress_size
+                print("{m:40s} {p:8s} {t:9.3f} {s:12.1f} ".format(
+                    m=os.path.basename(filename)[:40], p=preset, t=best, s=os.path.getsize(output) / 1024)
+                    + " ".join("{s:15.1f}".format(s=sizes[c] / 1024) for c in classes))
+
+
+if __name__ == "__main__":
+    main()
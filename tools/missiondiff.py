@@ -10,14 +10,18 @@ def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("fileA")
     parser.add_argument("fileB")
+    parser.add_argument("--skip", nargs="*", default=[],
+                        help="mission sections that are not compared, e.g. trig trigrules")
 
     args = parser.parse_args()
+    skip = {("mission", x) for x in args.skip}
 
     def loaddict(fname, miz):
+        d = {}
         with miz.open(fname) as mfile:
-            data = mfile.read()
-            data = data.decode()
-            return dcs.lua.loads(data)
+            for path, value in dcs.lua.iterparse(mfile, 2, skip):
+                d[path[1]] = value
+        return d
 
     with zipfile.ZipFile(args.fileA, 'r') as mizA:
         missionA = loaddict('mission', mizA)
@@ -283,8 +283,7 @@ local function export_aircraft(file, aircrafts, export_type, exportplane)
 
 from dcs.weapons_data import Weapons
 import dcs.task as task
-from dcs.unittype import FlyingType
-from enum import Enum
+from dcs.unittype import FlyingType, LiveryTable
 
 
 ]])
@@ -445,28 +444,32 @@ from enum import Enum
             end
         end
 
+        -- only the livery ids are written, LiveryTable creates the Enum classes on first access
         local livery_written = false
         for j in pairs(countries) do
             local schemes = loadLiveries.loadSchemes(plane.type, countries[j])
             if schemes ~= nil and #schemes > 0 then
                 if not livery_written then
                     writeln(file, '')
-                    writeln(file, '    class Liveries:')
+                    writeln(file, '    Liveries = LiveryTable({')
                     livery_written = true
                 end
 
-                writeln(file, '')
-                writeln(file, '        class '..safe_name(j)..'(Enum):')
+                writeln(file, '        "'..safe_name(j)..'": (')
                 local dupcheck = {}
                 for k in pairs(schemes) do
                     local liv_safe = safe_name(schemes[k].itemId)
                     if dupcheck[liv_safe] == nil then
-                        writeln(file, '            '..liv_safe..' = "'..schemes[k].itemId..'"')
+                        writeln(file, '            "'..schemes[k].itemId..'",')
                         dupcheck[liv_safe] = true
                     end
                 end
+                writeln(file, '        ),')
             end
         end
+        if livery_written then
+            writeln(file, '    })')
+        end
 
         local pylons = {}
 